@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the internal article representation.
+
+Compares building a run's articles as validated pydantic NewsArticle models
+against compact ArticleRecord objects (slots, interned source and subreddit
+names, epoch-second timestamps), in construction time and in the memory held by
+the objects themselves. Field values are decoded from JSON first, as they are
+from the APIs, so every article starts out with its own copies of the strings.
+Materializing the records as NewsArticle models at the boundary is timed too.
+
+Usage:
+    python -m benchmarks.bench_article_records
+"""
+
+import gc
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from models.news_models import ArticleRecord, NewsArticle
+
+SOURCES = ["Reddit", "SeekingAlpha", "Google News - Reuters", "Google News - CNBC"]
+SUBREDDITS = ["stocks", "wallstreetbets", "investing", "StockMarket", "options"]
+
+
+def make_raw_articles(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Generate raw article fields, decoded from JSON like API responses."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    raw = []
+    for index in range(count):
+        source = rng.choice(SOURCES)
+        raw.append(
+            {
+                "source": source,
+                "title": f"Article {index} about the stock moving today",
+                "url": f"https://example.com/article/{index}",
+                "content": f"Content of article {index}",
+                "published_at": (now - timedelta(minutes=index)).isoformat(),
+                "subreddit": rng.choice(SUBREDDITS) if source == "Reddit" else None,
+            }
+        )
+    return json.loads(json.dumps(raw))
+
+
+def build(factory: Callable[..., Any], raw: List[Dict[str, Any]]) -> List[Any]:
+    """Build articles from raw fields with the given class."""
+    return [
+        factory(
+            source=fields["source"],
+            title=fields["title"],
+            url=fields["url"],
+            content=fields["content"],
+            published_at=datetime.fromisoformat(fields["published_at"]),
+            subreddit=fields["subreddit"],
+        )
+        for fields in raw
+    ]
+
+
+def measure(factory: Callable[..., Any], count: int) -> Tuple[float, int, List[Any]]:
+    """Time building count articles and measure the memory they hold.
+
+    Returns:
+        Construction seconds, bytes allocated and the built articles
+    """
+    raw = make_raw_articles(count)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    articles = build(factory, raw)
+    seconds = time.perf_counter() - start
+    # Drop the decoded fields; whatever the articles still reference stays
+    del raw
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return seconds, allocated, articles
+
+
+def run(counts: Tuple[int, ...] = (1000, 10000, 50000)) -> None:
+    """Run the benchmark for several article counts."""
+    for count in counts:
+        model_seconds, model_bytes, _ = measure(NewsArticle, count)
+        record_seconds, record_bytes, records = measure(ArticleRecord, count)
+
+        start = time.perf_counter()
+        for record in records:
+            record.to_model()
+        materialize_seconds = time.perf_counter() - start
+
+        print(f"Articles: {count:6d}")
+        print(
+            f"  NewsArticle (pydantic): {model_seconds * 1000:9.1f} ms "
+            f"{model_bytes / 1024:10.0f} KiB"
+        )
+        print(
+            f"  ArticleRecord:          {record_seconds * 1000:9.1f} ms "
+            f"{record_bytes / 1024:10.0f} KiB"
+        )
+        print(f"  Materialize records:    {materialize_seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark for keeping article content in the blob store.
+
+Builds a run's articles with bodies of a few kilobytes, a share of which appear
+under several tickers (the same post or story found for each of them), once with
+the content held in memory and once with it in a BlobStore. Reports the memory
+held by the records, the size of the blob file and the time taken to build the
+records and to read every body back. Bodies are decoded from JSON first, as they
+are from the APIs, so duplicates start out as separate strings.
+
+Usage:
+    python -m benchmarks.bench_blob_store
+"""
+
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+import models.news_models as news_models
+from models.news_models import ArticleRecord
+from utils.blob_store import BlobStore
+
+WORDS = "shares rose after the company reported quarterly revenue above estimates".split()
+
+
+def make_raw_articles(
+    count: int, duplicate_ratio: float = 0.3, seed: int = 7
+) -> List[Dict[str, Any]]:
+    """Generate raw article fields, decoded from JSON like API responses."""
+    rng = random.Random(seed)
+    raw = []
+    for index in range(count):
+        if raw and rng.random() < duplicate_ratio:
+            raw.append(dict(rng.choice(raw)))
+            continue
+        body = " ".join(rng.choice(WORDS) for _ in range(rng.randint(200, 600)))
+        raw.append(
+            {
+                "source": "Reddit",
+                "title": f"Post {index} about the stock moving today",
+                "url": f"https://example.com/post/{index}",
+                "content": f"Post {index}: {body}",
+                "subreddit": "stocks",
+            }
+        )
+    return json.loads(json.dumps(raw))
+
+
+def measure(count: int, store: Optional[BlobStore] = None) -> Tuple[float, int, float]:
+    """Build count articles, with or without a blob store, and read them back.
+
+    Returns:
+        Construction seconds, bytes held by the records (including their
+        content and the store's index) and read seconds
+    """
+    news_models.ARTICLE_BLOB_STORE_ENABLED = store is not None
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    raw = make_raw_articles(count)
+    start = time.perf_counter()
+    records = [ArticleRecord(**fields) for fields in raw]
+    build_seconds = time.perf_counter() - start
+    # Drop the decoded fields; whatever the records still reference stays
+    del raw
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for record in records:
+        record.content
+    read_seconds = time.perf_counter() - start
+    return build_seconds, held, read_seconds
+
+
+def run(counts: Tuple[int, ...] = (1000, 10000)) -> None:
+    """Run the benchmark for several article counts."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for count in counts:
+            inline = measure(count)
+
+            # Records use the shared store, which opens its file on first use
+            BlobStore.reset_shared()
+            store = BlobStore.shared()
+            store.path = os.path.join(cache_dir, f"blobs_{count}.bin")
+            stored = measure(count, store)
+            metrics = store.get_metrics()
+            store.close()
+
+            print(f"Articles: {count:6d}")
+            for name, (build_seconds, held, read_seconds) in (
+                ("In memory:", inline),
+                ("Blob store:", stored),
+            ):
+                print(
+                    f"  {name:<12} build {build_seconds * 1000:8.1f} ms "
+                    f"held {held / 1024:8.0f} KiB "
+                    f"read {read_seconds * 1000:8.1f} ms"
+                )
+            print(
+                f"  Blob file: {metrics['bytes'] / 1024:.0f} KiB in "
+                f"{metrics['blobs']} blobs ({metrics['deduplicated']} duplicates)"
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Reddit ticker relevance checks.
+
+Compares the original substring-based relevance checks (repeated .lower(), find
+and count calls against every other ticker) against the compiled MentionExtractor,
+which scans each post once per run for the whole ticker universe. A run checks
+every listing post against every watchlist ticker, so the legacy cost grows with
+the square of the universe size while the extractor cost stays flat.
+
+Usage:
+    python -m benchmarks.bench_mention_extraction
+"""
+
+import random
+import time
+from typing import Dict, List, Optional
+
+from utils.mention_extractor import MentionExtractor
+
+UNIVERSE = {
+    "AAPL": "Apple Inc.",
+    "TSLA": "Tesla, Inc.",
+    "MSFT": "Microsoft Corporation",
+    "AMZN": "Amazon.com, Inc.",
+    "GOOGL": "Alphabet Inc. Class A",
+    "META": "Meta Platforms, Inc.",
+    "NVDA": "NVIDIA Corporation",
+    "JPM": "JPMorgan Chase & Co.",
+    "GS": "Goldman Sachs Group Inc",
+    "BAC": "Bank of America Corp",
+    "AMD": "Advanced Micro Devices, Inc.",
+    "TSM": "Taiwan Semiconductor Manufacturing",
+    "NFLX": "Netflix, Inc.",
+    "INTC": "Intel Corporation",
+    "PLTR": "Palantir Technologies Inc.",
+}
+
+WORDS = (
+    "the stock market rallied today after earnings things look good for calls "
+    "and puts while bears argue the valuation is stretched going into guidance"
+).split()
+
+
+def legacy_is_relevant(ticker: str, other_tickers: List[str], title: str, body: str):
+    """Original relevance check from RedditClient._is_submission_relevant."""
+    title_lower = title.lower()
+    selftext_lower = body.lower()
+    ticker_lower = ticker.lower()
+
+    if ticker_lower in title_lower:
+        for other_ticker in other_tickers:
+            if other_ticker.lower() in title_lower and title_lower.find(
+                other_ticker.lower()
+            ) < title_lower.find(ticker_lower):
+                return False
+        return True
+    elif ticker_lower in selftext_lower:
+        ticker_count = selftext_lower.count(ticker_lower)
+        other_ticker_counts = {
+            other: selftext_lower.count(other.lower()) for other in other_tickers
+        }
+        if any(count > ticker_count for count in other_ticker_counts.values()):
+            return False
+        return True
+    return False
+
+
+def extractor_is_relevant(ticker: str, title_mentions, body_mentions) -> bool:
+    """Relevance check built on precomputed extractor mentions."""
+    if ticker in title_mentions:
+        own = title_mentions[ticker].first_position
+        return not any(
+            mention.first_position < own
+            for other, mention in title_mentions.items()
+            if other != ticker
+        )
+    if ticker in body_mentions:
+        count = body_mentions[ticker].count
+        return not any(mention.count > count for mention in body_mentions.values())
+    return False
+
+
+def make_universe(size: int) -> Dict[str, Optional[str]]:
+    """Extend the sample universe with synthetic tickers up to the given size."""
+    universe: Dict[str, Optional[str]] = dict(list(UNIVERSE.items())[:size])
+    index = 0
+    while len(universe) < size:
+        universe[f"ZQ{index:02d}"] = None
+        index += 1
+    return universe
+
+
+def make_post(rng: random.Random, body_words: int, tickers: List[str]):
+    """Generate a synthetic post mentioning a few tickers."""
+    title = " ".join(rng.choice(WORDS) for _ in range(8))
+    title += f" {rng.choice(tickers)} {rng.choice(WORDS)}"
+    body_tokens = [rng.choice(WORDS) for _ in range(body_words)]
+    for _ in range(max(1, body_words // 50)):
+        body_tokens.insert(rng.randrange(len(body_tokens)), f"${rng.choice(tickers)}")
+    return title, " ".join(body_tokens)
+
+
+def run_universe(corpus, universe: Dict[str, Optional[str]]) -> None:
+    """Time one simulated run over the corpus for a ticker universe."""
+    tickers = list(universe)
+
+    start = time.perf_counter()
+    for ticker in tickers:
+        others = [t for t in tickers if t != ticker]
+        for title, body in corpus:
+            legacy_is_relevant(ticker, others, title, body)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extractor = MentionExtractor(universe)
+    # RedditClient caches mentions per permalink, so each post is scanned once
+    scanned = [(extractor.extract(title), extractor.extract(body)) for title, body in corpus]
+    for ticker in tickers:
+        for title_mentions, body_mentions in scanned:
+            extractor_is_relevant(ticker, title_mentions, body_mentions)
+    extractor_seconds = time.perf_counter() - start
+
+    checks = len(corpus) * len(tickers)
+    print(f"Tickers: {len(tickers):4d}, relevance checks: {checks:7d}")
+    print(f"  Legacy substring checks: {legacy_seconds * 1000:9.1f} ms")
+    print(f"  Compiled extractor:      {extractor_seconds * 1000:9.1f} ms")
+
+
+def run(posts: int = 1000, body_words: int = 300, seed: int = 7) -> None:
+    """Run the benchmark for a small and a large watchlist universe."""
+    for size in (15, 60):
+        universe = make_universe(size)
+        rng = random.Random(seed)
+        corpus = [make_post(rng, body_words, list(universe)) for _ in range(posts)]
+        run_universe(corpus, universe)
+
+
+if __name__ == "__main__":
+    run()
@@ -11,19 +11,20 @@ import xml.etree.ElementTree as ET
 from typing import List, Optional
 from datetime import datetime, timedelta
 import requests
-from models.news_models import NewsArticle
+from models.news_models import ArticleRecord
+from utils.shared_instance import SharedInstanceMixin
 
 logger = logging.getLogger("news_agent")
 
 
-class GoogleNewsClient:
+class GoogleNewsClient(SharedInstanceMixin):
     """Client for retrieving news from Google News RSS feeds."""
 
     def __init__(self):
         """Initialize the Google News client."""
         pass
 
-    def get_news(self, query: str, days: int = 2) -> List[NewsArticle]:
+    def get_news(self, query: str, days: int = 2) -> List[ArticleRecord]:
         """Get news articles from Google News RSS feed.
 
         Args:
@@ -31,7 +32,7 @@ class GoogleNewsClient:
             days: How many days back to search for news
 
         Returns:
-            List of NewsArticle objects containing news articles
+            List of ArticleRecord objects containing news articles
         """
         logger.info(f"Searching Google News RSS for {query}")
         articles = []
@@ -66,15 +67,15 @@ class GoogleNewsClient:
 
     def _process_item(
         self, item: ET.Element, cutoff_date: datetime
-    ) -> Optional[NewsArticle]:
-        """Process an RSS item and create a NewsArticle.
+    ) -> Optional[ArticleRecord]:
+        """Process an RSS item and create an ArticleRecord.
 
         Args:
             item: XML Element representing an RSS item
             cutoff_date: Cutoff date for articles
 
         Returns:
-            NewsArticle object if the item is valid and recent, None otherwise
+            ArticleRecord object if the item is valid and recent, None otherwise
         """
         title_elem = item.find("title")
         link_elem = item.find("link")
@@ -105,7 +106,7 @@ class GoogleNewsClient:
             if source_elem is not None:
                 source = source_elem.text
 
-            return NewsArticle(
+            return ArticleRecord(
                 source=f"Google News - {source}" if source else "Google News",
                 title=title,
                 url=link,
@@ -0,0 +1,160 @@
+"""
+Content-addressed cache for LLM responses.
+
+This module provides a persistent cache of chat completion responses keyed by a
+hash of the model, request parameters and messages, so byte-identical prompts
+(reruns, crash recovery, tickers sharing content) are answered without an API
+call. Entries expire after a TTL and the cache is bounded with LRU eviction.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.state_store import CACHE_DIR
+
+logger = logging.getLogger("news_agent")
+
+# Cache configuration
+LLM_CACHE_ENABLED = os.environ.get("OPENAI_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_TTL_SECONDS = int(os.environ.get("OPENAI_CACHE_TTL", "86400"))
+LLM_CACHE_MAX_ENTRIES = int(os.environ.get("OPENAI_CACHE_MAX_ENTRIES", "5000"))
+
+
+class LLMResponseCache:
+    """Persistent TTL + LRU cache of LLM responses backed by SQLite."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        The database is only opened on first use.
+
+        Args:
+            path: SQLite database path (defaults to llm_cache.sqlite3 in the cache dir)
+            ttl_seconds: How long a response stays valid
+            max_entries: Maximum number of responses kept (least recently used are evicted)
+        """
+        self.path = path or os.path.join(CACHE_DIR, "llm_cache.sqlite3")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.metrics = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table if needed."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], **params: Any) -> str:
+        """Build the content address of a request.
+
+        Args:
+            model: Model name
+            messages: Chat messages
+            **params: Other request parameters (temperature, max_tokens, ...)
+
+        Returns:
+            Hex SHA-256 digest of the canonical request
+        """
+        canonical = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Request content address
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.metrics["misses"] += 1
+                    return None
+                response, created_at = row
+                if now - created_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                    self.metrics["expirations"] += 1
+                    self.metrics["misses"] += 1
+                    return None
+                conn.execute(
+                    "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                )
+                conn.commit()
+                self.metrics["hits"] += 1
+                return response
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {str(e)}")
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entries if needed.
+
+        Args:
+            key: Request content address
+            response: Response text
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+                overflow = count - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM responses WHERE key IN ("
+                        "SELECT key FROM responses ORDER BY last_access LIMIT ?)",
+                        (overflow,),
+                    )
+                    self.metrics["evictions"] += overflow
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {str(e)}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get cache hit/miss metrics.
+
+        Returns:
+            Dictionary of hit, miss, eviction and expiration counts and hit rate
+        """
+        with self._lock:
+            metrics = dict(self.metrics)
+        lookups = metrics["hits"] + metrics["misses"]
+        metrics["hit_rate"] = round(metrics["hits"] / lookups, 3) if lookups else 0.0
+        return metrics
@@ -0,0 +1,180 @@
+"""
+Model routing for OpenAI requests.
+
+This module picks the model and completion token limit of every OpenAI request
+from its call type and input size: short per-source summaries and headline
+condensations go to a small, fast model, while the final bullet points (and
+unusually large inputs) go to the large model. It also prices token usage so
+latency and cost can be reported per route.
+"""
+
+import logging
+import os
+from typing import Dict, NamedTuple, Optional
+
+logger = logging.getLogger("news_agent")
+
+# Route calls to small/large models (false: every call uses the large model)
+MODEL_ROUTING_ENABLED = os.environ.get("MODEL_ROUTING_ENABLED", "true").lower() == "true"
+
+# Models used by the routes
+OPENAI_SMALL_MODEL = os.environ.get("OPENAI_SMALL_MODEL", "gpt-4o-mini")
+OPENAI_LARGE_MODEL = os.environ.get("OPENAI_LARGE_MODEL", "gpt-4o")
+
+# Inputs above this many tokens go to the large model whatever the call type
+LARGE_INPUT_TOKENS = int(os.environ.get("MODEL_ROUTING_LARGE_INPUT_TOKENS", "8000"))
+
+# Per-route overrides, e.g. "headline_condensation=gpt-4.1-nano:80,bullet_points=gpt-4o"
+OPENAI_MODEL_ROUTES = os.environ.get("OPENAI_MODEL_ROUTES", "")
+
+# Batch API requests are billed at this fraction of the synchronous price
+BATCH_PRICE_FACTOR = 0.5
+
+# USD per million tokens: (input, cached input, output)
+MODEL_PRICES = {
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+}
+
+
+class ModelRoute(NamedTuple):
+    """Model and completion token limit of a request."""
+
+    model: str
+    max_tokens: int
+
+
+# Default route of each call type; multi-item calls scale max_tokens per item
+DEFAULT_ROUTES: Dict[str, ModelRoute] = {
+    "summary_reddit": ModelRoute(OPENAI_SMALL_MODEL, 500),
+    "summary_seeking_alpha": ModelRoute(OPENAI_SMALL_MODEL, 500),
+    "summary_news": ModelRoute(OPENAI_SMALL_MODEL, 500),
+    "subreddit_summaries": ModelRoute(OPENAI_SMALL_MODEL, 350),
+    "ticker_summaries": ModelRoute(OPENAI_SMALL_MODEL, 500),
+    "event_summary": ModelRoute(OPENAI_SMALL_MODEL, 500),
+    "bullet_points": ModelRoute(OPENAI_LARGE_MODEL, 300),
+    "headline_condensation": ModelRoute(OPENAI_SMALL_MODEL, 100),
+}
+
+
+def parse_route_overrides(spec: str) -> Dict[str, ModelRoute]:
+    """Parse route overrides of the form "call_type=model[:max_tokens],...".
+
+    Args:
+        spec: Comma-separated overrides
+
+    Returns:
+        Dictionary mapping call types to their overridden routes
+    """
+    overrides = {}
+    for entry in spec.split(","):
+        call_type, _, target = entry.strip().partition("=")
+        if not call_type or not target or call_type not in DEFAULT_ROUTES:
+            if entry.strip():
+                logger.warning(f"Ignoring invalid model route override: {entry!r}")
+            continue
+        model, _, max_tokens = target.partition(":")
+        default = DEFAULT_ROUTES[call_type]
+        try:
+            overrides[call_type] = ModelRoute(
+                model.strip() or default.model,
+                int(max_tokens) if max_tokens else default.max_tokens,
+            )
+        except ValueError:
+            logger.warning(f"Ignoring invalid model route override: {entry!r}")
+    return overrides
+
+
+def estimate_cost(
+    model: str,
+    prompt_tokens: int,
+    cached_tokens: int,
+    completion_tokens: int,
+    batched: bool = False,
+) -> Optional[float]:
+    """Price a request's token usage.
+
+    Args:
+        model: Model name (dated snapshots are priced as their base model)
+        prompt_tokens: Prompt tokens, including cached ones
+        cached_tokens: Prompt tokens served from the provider-side cache
+        completion_tokens: Completion tokens
+        batched: Whether the request ran through the Batch API
+
+    Returns:
+        Cost in USD, or None if the model's price is unknown
+    """
+    prices = MODEL_PRICES.get(model)
+    if prices is None:
+        # e.g. "gpt-4o-mini-2024-07-18" -> "gpt-4o-mini"
+        base = max(
+            (name for name in MODEL_PRICES if model.startswith(f"{name}-")),
+            key=len,
+            default=None,
+        )
+        prices = MODEL_PRICES.get(base)
+    if prices is None:
+        return None
+    input_price, cached_price, output_price = prices
+    cost = (
+        (prompt_tokens - cached_tokens) * input_price
+        + cached_tokens * cached_price
+        + completion_tokens * output_price
+    ) / 1_000_000
+    return cost * BATCH_PRICE_FACTOR if batched else cost
+
+
+class ModelRouter:
+    """Routes each OpenAI request to a model by call type and input size."""
+
+    def __init__(
+        self,
+        routes: Optional[Dict[str, ModelRoute]] = None,
+        enabled: bool = MODEL_ROUTING_ENABLED,
+        small_model: str = OPENAI_SMALL_MODEL,
+        large_model: str = OPENAI_LARGE_MODEL,
+        large_input_tokens: int = LARGE_INPUT_TOKENS,
+    ):
+        """Initialize the router.
+
+        Args:
+            routes: Route of each call type (defaults plus OPENAI_MODEL_ROUTES)
+            enabled: Whether to route at all (otherwise use the large model)
+            small_model: Model calls are downgraded to when budgets run low
+            large_model: Model for disabled routing and oversized inputs
+            large_input_tokens: Input size above which the large model is used
+        """
+        self.routes = routes or {
+            **DEFAULT_ROUTES,
+            **parse_route_overrides(OPENAI_MODEL_ROUTES),
+        }
+        self.enabled = enabled
+        self.small_model = small_model
+        self.large_model = large_model
+        self.large_input_tokens = large_input_tokens
+
+    def route(self, call_type: str, input_tokens: int = 0, items: int = 1) -> ModelRoute:
+        """Pick the model and completion token limit of a request.
+
+        Args:
+            call_type: Kind of request (a key of DEFAULT_ROUTES)
+            input_tokens: Tokens of the variable input (content) of the request
+            items: Number of summaries requested at once (multi-item calls)
+
+        Returns:
+            Model and completion token limit
+        """
+        route = self.routes.get(call_type, ModelRoute(self.large_model, 500))
+        max_tokens = route.max_tokens * items
+        if not self.enabled:
+            return ModelRoute(self.large_model, max_tokens)
+
+        # The completion limit stays at the route's default whatever the input
+        # size: summaries of short inputs (and multi-item JSON) still need it
+        model = route.model
+        if input_tokens > self.large_input_tokens:
+            model = self.large_model
+        return ModelRoute(model, max_tokens)
@@ -0,0 +1,483 @@
+"""
+OpenAI Batch API execution.
+
+This module runs chat completion requests through the OpenAI Batch API, which
+costs half as much as synchronous requests but can take up to 24 hours, for
+runs that aren't latency-sensitive (e.g. end-of-day recaps). Requests made by
+concurrent summarization workers are gathered until every worker is waiting,
+written to a JSONL batch file, submitted, polled until complete and mapped back
+to their callers by custom ID. A local stand-in endpoint processes the same
+files offline, answering with extractive summaries.
+"""
+
+import contextlib
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from utils.extractive_summarizer import ExtractiveSummarizer
+from utils.state_store import CACHE_DIR
+
+logger = logging.getLogger("news_agent")
+
+# Batch execution mode: "off", "openai" (Batch API) or "local" (offline stand-in)
+OPENAI_BATCH_MODE = os.environ.get("OPENAI_BATCH_MODE", "off").lower()
+
+# How often a submitted batch is polled, and how long it may take overall
+OPENAI_BATCH_POLL_SECONDS = float(os.environ.get("OPENAI_BATCH_POLL_SECONDS", "30"))
+OPENAI_BATCH_TIMEOUT_SECONDS = float(
+    os.environ.get("OPENAI_BATCH_TIMEOUT_SECONDS", "90000")
+)
+
+# Directory holding batch input and output files
+BATCH_DIR = os.path.join(CACHE_DIR, "batches")
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Section headers of multi-item prompts ("=== r/stocks ===", "=== AAPL (...) ===")
+SECTION_PATTERN = re.compile(r"^=== (?:r/)?(\S+)(?: \(.*\))? ===$", re.MULTILINE)
+TICKER_LINE_PATTERN = re.compile(r"^Ticker: (\S+)$", re.MULTILINE)
+
+_participation = threading.local()
+
+
+def current_batch_collector() -> Optional["BatchRequestCollector"]:
+    """Get the batch collector of the calling thread's participant scope, if any.
+
+    Returns:
+        BatchRequestCollector, or None outside a batch participant scope
+    """
+    return getattr(_participation, "collector", None)
+
+
+def write_batch_file(path: str, requests: Dict[str, Dict[str, Any]]) -> None:
+    """Write chat completion requests as a Batch API input file.
+
+    Args:
+        path: Path of the JSONL file to write
+        requests: Dictionary mapping custom IDs to request bodies
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for custom_id, body in requests.items():
+            line = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": body,
+            }
+            f.write(json.dumps(line) + "\n")
+
+
+def parse_batch_output(text: str) -> Dict[str, Any]:
+    """Parse a Batch API output (or error) file.
+
+    Response bodies are returned as attribute-access objects, shaped like the
+    SDK's chat completion responses.
+
+    Args:
+        text: Contents of the JSONL file
+
+    Returns:
+        Dictionary mapping custom IDs to response bodies, or to a RuntimeError
+        for failed requests
+    """
+    results: Dict[str, Any] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning("Skipping malformed batch output line")
+            continue
+        custom_id = entry.get("custom_id")
+        response = entry.get("response") or {}
+        error = entry.get("error")
+        if error is None and response.get("status_code") == 200:
+            results[custom_id] = json.loads(
+                json.dumps(response.get("body") or {}),
+                object_hook=lambda fields: SimpleNamespace(**fields),
+            )
+            continue
+        if error is None:
+            error = (response.get("body") or {}).get("error") or {
+                "message": f"status {response.get('status_code')}"
+            }
+        results[custom_id] = RuntimeError(
+            f"Batch request failed: {error.get('message', error)}"
+        )
+    return results
+
+
+class OpenAIBatchEndpoint:
+    """Batch API operations of the OpenAI SDK."""
+
+    def __init__(self, openai_client: Any):
+        """Initialize the endpoint.
+
+        Args:
+            openai_client: OpenAIClient whose SDK client submits the batches
+        """
+        self.openai_client = openai_client
+
+    @property
+    def client(self):
+        """Get the OpenAI SDK client."""
+        if self.openai_client.client is None:
+            raise RuntimeError("OpenAI API key not set")
+        return self.openai_client.client
+
+    def upload(self, path: str) -> str:
+        """Upload a batch input file and return its file ID."""
+        with open(path, "rb") as f:
+            return self.client.files.create(file=f, purpose="batch").id
+
+    def create(self, input_file_id: str) -> str:
+        """Create a batch over an uploaded input file and return its ID."""
+        batch = self.client.batches.create(
+            input_file_id=input_file_id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def retrieve(self, batch_id: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Get a batch's status and its output and error file IDs."""
+        batch = self.client.batches.retrieve(batch_id)
+        return batch.status, batch.output_file_id, batch.error_file_id
+
+    def download(self, file_id: str) -> str:
+        """Get the contents of an output or error file."""
+        return self.client.files.content(file_id).text
+
+    def cancel(self, batch_id: str) -> None:
+        """Cancel a batch."""
+        self.client.batches.cancel(batch_id)
+
+
+def extractive_responder(body: Dict[str, Any]) -> str:
+    """Answer a chat completion request locally with extractive summaries.
+
+    Multi-item prompts requesting JSON are answered with one summary per
+    section, keyed by the section's subreddit or ticker.
+
+    Args:
+        body: Chat completion request body
+
+    Returns:
+        Completion text
+    """
+    content = body["messages"][-1]["content"]
+    match = TICKER_LINE_PATTERN.search(content)
+    ticker = match.group(1) if match else ""
+    summarizer = ExtractiveSummarizer()
+
+    if (body.get("response_format") or {}).get("type") != "json_object":
+        return summarizer.summarize(content, ticker)
+
+    parts = SECTION_PATTERN.split(content)
+    # split() yields [preamble, name, section, name, section, ...]
+    return json.dumps(
+        {
+            name: summarizer.summarize(section, ticker or name)
+            for name, section in zip(parts[1::2], parts[2::2])
+        }
+    )
+
+
+class LocalBatchEndpoint:
+    """Offline stand-in for the Batch API, processing batch files locally."""
+
+    def __init__(
+        self,
+        responder: Callable[[Dict[str, Any]], str] = extractive_responder,
+        directory: str = BATCH_DIR,
+    ):
+        """Initialize the endpoint.
+
+        Args:
+            responder: Callable answering a chat completion request body
+            directory: Directory the output files are written to
+        """
+        self.responder = responder
+        self.directory = directory
+        self._files: Dict[str, str] = {}
+        self._batches: Dict[str, Tuple[str, Optional[str], Optional[str]]] = {}
+        self._ids = itertools.count(1)
+
+    def upload(self, path: str) -> str:
+        """Register a batch input file and return its file ID."""
+        file_id = f"file-local-{next(self._ids)}"
+        self._files[file_id] = path
+        return file_id
+
+    def create(self, input_file_id: str) -> str:
+        """Process every request of an input file and return the batch ID."""
+        batch_id = f"batch-local-{next(self._ids)}"
+        output, errors = [], []
+        with open(self._files[input_file_id], encoding="utf-8") as f:
+            for index, line in enumerate(f):
+                request = json.loads(line)
+                body = request["body"]
+                entry = {
+                    "id": f"{batch_id}-{index}",
+                    "custom_id": request["custom_id"],
+                }
+                try:
+                    text = self.responder(body)
+                except Exception as e:
+                    entry.update(
+                        response=None, error={"code": "local_error", "message": str(e)}
+                    )
+                    errors.append(entry)
+                    continue
+                entry.update(
+                    response={
+                        "status_code": 200,
+                        "body": {
+                            "object": "chat.completion",
+                            "model": body.get("model"),
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "message": {"role": "assistant", "content": text},
+                                    "finish_reason": "stop",
+                                }
+                            ],
+                            "usage": None,
+                        },
+                    },
+                    error=None,
+                )
+                output.append(entry)
+
+        file_ids = []
+        for suffix, entries in (("output", output), ("errors", errors)):
+            if not entries:
+                file_ids.append(None)
+                continue
+            path = os.path.join(self.directory, f"{batch_id}-{suffix}.jsonl")
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in entries)
+            file_ids.append(self.upload(path))
+        self._batches[batch_id] = ("completed", file_ids[0], file_ids[1])
+        return batch_id
+
+    def retrieve(self, batch_id: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Get a batch's status and its output and error file IDs."""
+        return self._batches[batch_id]
+
+    def download(self, file_id: str) -> str:
+        """Get the contents of an output or error file."""
+        with open(self._files[file_id], encoding="utf-8") as f:
+            return f.read()
+
+    def cancel(self, batch_id: str) -> None:
+        """Cancel a batch (local batches complete immediately)."""
+
+
+class OpenAIBatchRunner:
+    """Writes, submits and polls batches, mapping results back by custom ID."""
+
+    def __init__(
+        self,
+        endpoint: Any,
+        directory: str = BATCH_DIR,
+        poll_seconds: float = OPENAI_BATCH_POLL_SECONDS,
+        timeout_seconds: float = OPENAI_BATCH_TIMEOUT_SECONDS,
+    ):
+        """Initialize the runner.
+
+        Args:
+            endpoint: OpenAIBatchEndpoint or LocalBatchEndpoint
+            directory: Directory the batch input files are written to
+            poll_seconds: Delay between status checks
+            timeout_seconds: How long a batch may take before it is cancelled
+        """
+        self.endpoint = endpoint
+        self.directory = directory
+        self.poll_seconds = poll_seconds
+        self.timeout_seconds = timeout_seconds
+        self.metrics = {"batches": 0, "requests": 0, "failed": 0, "wait_seconds": 0.0}
+
+    def run(self, requests: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Run requests as one batch and wait for the results.
+
+        Args:
+            requests: Dictionary mapping custom IDs to request bodies
+
+        Returns:
+            Dictionary mapping custom IDs to response bodies or exceptions
+        """
+        started = time.monotonic()
+        path = os.path.join(
+            self.directory,
+            f"batch-{time.strftime('%Y%m%d-%H%M%S')}-{self.metrics['batches']}.jsonl",
+        )
+        write_batch_file(path, requests)
+        batch_id = self.endpoint.create(self.endpoint.upload(path))
+        logger.info(f"Submitted batch {batch_id} with {len(requests)} requests")
+
+        status, output_file_id, error_file_id = self.endpoint.retrieve(batch_id)
+        while status not in TERMINAL_STATUSES:
+            if time.monotonic() - started > self.timeout_seconds:
+                self.endpoint.cancel(batch_id)
+                raise TimeoutError(
+                    f"Batch {batch_id} did not complete in {self.timeout_seconds}s"
+                )
+            time.sleep(self.poll_seconds)
+            status, output_file_id, error_file_id = self.endpoint.retrieve(batch_id)
+        logger.info(f"Batch {batch_id} finished with status {status}")
+
+        results: Dict[str, Any] = {}
+        for file_id in (output_file_id, error_file_id):
+            if file_id:
+                results.update(parse_batch_output(self.endpoint.download(file_id)))
+        for custom_id in requests:
+            if custom_id not in results:
+                results[custom_id] = RuntimeError(
+                    f"Batch {batch_id} ({status}) returned no result"
+                )
+
+        self.metrics["batches"] += 1
+        self.metrics["requests"] += len(requests)
+        self.metrics["failed"] += sum(
+            isinstance(results[custom_id], Exception) for custom_id in requests
+        )
+        self.metrics["wait_seconds"] += time.monotonic() - started
+        return results
+
+
+class BatchRequestCollector:
+    """Gathers the requests of concurrent workers into batches.
+
+    Workers run inside participant() scopes. A request blocks its worker; once
+    every participating worker is blocked, the pending requests are run as one
+    batch and each worker gets its own result back. Callers starting several
+    workers reserve() their slots first, so early workers don't flush a batch
+    before the later ones have joined.
+    """
+
+    def __init__(self, runner: OpenAIBatchRunner):
+        """Initialize the collector.
+
+        Args:
+            runner: Runner executing the gathered batches
+        """
+        self.runner = runner
+        self._condition = threading.Condition()
+        self._participants = 0
+        self._reserved = 0
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[str, Any] = {}
+        self._sequence = itertools.count()
+        self._flushing = False
+
+    @property
+    def offline(self) -> bool:
+        """Whether batches are processed by the local stand-in endpoint."""
+        return isinstance(self.runner.endpoint, LocalBatchEndpoint)
+
+    @contextlib.contextmanager
+    def reserve(self, count: int) -> Iterator[None]:
+        """Reserve participant slots for workers that are about to start.
+
+        Args:
+            count: Number of workers; slots they haven't claimed by the end of
+                the scope are released
+        """
+        with self._condition:
+            self._participants += count
+            self._reserved += count
+        try:
+            yield
+        finally:
+            with self._condition:
+                released = min(count, self._reserved)
+                self._participants -= released
+                self._reserved -= released
+            self._flush_if_ready()
+
+    @contextlib.contextmanager
+    def participant(self) -> Iterator[None]:
+        """Scope in which the calling thread's requests are batched."""
+        with self._condition:
+            if self._reserved:
+                self._reserved -= 1
+            else:
+                self._participants += 1
+        previous = current_batch_collector()
+        _participation.collector = self
+        try:
+            yield
+        finally:
+            _participation.collector = previous
+            with self._condition:
+                self._participants -= 1
+            self._flush_if_ready()
+
+    def submit(self, body: Dict[str, Any]) -> Any:
+        """Add a request to the next batch and wait for its result.
+
+        Args:
+            body: Chat completion request body
+
+        Returns:
+            Response body (with attribute access, like an SDK response)
+        """
+        with self._condition:
+            custom_id = f"request-{next(self._sequence)}"
+            self._pending[custom_id] = body
+        self._flush_if_ready()
+
+        with self._condition:
+            while custom_id not in self._results:
+                self._condition.wait()
+            result = self._results.pop(custom_id)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _flush_if_ready(self) -> None:
+        """Run the pending requests once every participant is waiting on one."""
+        while True:
+            with self._condition:
+                if (
+                    self._flushing
+                    or not self._pending
+                    or len(self._pending) < self._participants
+                ):
+                    return
+                requests, self._pending = self._pending, {}
+                self._flushing = True
+
+            try:
+                results = self.runner.run(requests)
+            except Exception as e:
+                logger.error(f"Error running batch: {str(e)}")
+                results = {custom_id: e for custom_id in requests}
+
+            with self._condition:
+                self._results.update(results)
+                self._flushing = False
+                self._condition.notify_all()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get batch execution metrics.
+
+        Returns:
+            Dictionary of batch, request and failure counts and time waited
+        """
+        with self._condition:
+            metrics = dict(self.runner.metrics)
+        metrics["wait_seconds"] = round(metrics["wait_seconds"], 3)
+        return metrics
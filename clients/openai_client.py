@@ -5,36 +5,550 @@ This module provides a client for interacting with the OpenAI API to generate
 summaries of news articles and discussions.
 """
 
+import asyncio
+import functools
+import json
 import logging
 import os
-from typing import Optional
-import openai
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from clients.llm_cache import LLM_CACHE_ENABLED, LLMResponseCache
+from clients.openai_batch import current_batch_collector
+from clients.model_router import ModelRoute, ModelRouter, estimate_cost
+from clients.openai_dispatcher import OpenAIDispatcher
+from clients.usage_ledger import (
+    BudgetGovernor,
+    TokenBudgetExceeded,
+    UsageLedger,
+    UsageRecord,
+)
+from clients.prompt_builder import build_messages, describe_move
+from utils.shared_instance import SharedInstanceMixin
+from utils.token_packer import count_tokens
 
 logger = logging.getLogger("news_agent")
 
 # OpenAI API config
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 
+# Upper bound on completion tokens of a single request
+MAX_COMPLETION_TOKENS = 16000
 
-class OpenAIClient:
+# Source descriptions for multi-ticker prompts: (content, whose view, focus)
+SOURCE_PROMPT_PARTS = {
+    "reddit": (
+        "Reddit discussions",
+        "what Redditors believe",
+        "market sentiment, catalysts, and predictions",
+    ),
+    "seeking_alpha": (
+        "Seeking Alpha articles",
+        "what analysts believe",
+        "fundamentals, catalysts, and analyst opinions",
+    ),
+    "news": (
+        "news headlines and articles",
+        "what is likely",
+        "the most important news, events, and market reactions",
+    ),
+}
+
+
+class OpenAIClient(SharedInstanceMixin):
     """Client for interacting with the OpenAI API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        dispatcher: Optional[OpenAIDispatcher] = None,
+        router: Optional[ModelRouter] = None,
+        usage_ledger: Optional[UsageLedger] = None,
+    ):
         """Initialize the OpenAI client.
 
+        The underlying OpenAI SDK client is only created on first use.
+
         Args:
             api_key: OpenAI API key (defaults to environment variable)
+            response_cache: Cache for chat completion responses (defaults to the
+                persistent cache unless OPENAI_CACHE_ENABLED is false)
+            dispatcher: Dispatcher budgeting and retrying API requests
+            router: Router picking the model of each request
+            usage_ledger: Ledger recording the usage of every call
         """
         # Get the API key from the environment if not provided
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self._client = None
+        self.response_cache = response_cache or (
+            LLMResponseCache() if LLM_CACHE_ENABLED else None
+        )
+        self.dispatcher = dispatcher or OpenAIDispatcher()
+        self.router = router or ModelRouter()
+        self._ttft_seconds: List[float] = []
+        self.usage_ledger = usage_ledger or UsageLedger()
+        self.governor = BudgetGovernor(self.usage_ledger)
+        self._metrics_lock = threading.Lock()
 
         if not self.api_key:
             logger.warning(
                 "OpenAI API key not set. Summarization will not be available."
             )
-            self.client = None
-        else:
-            self.client = openai.OpenAI(api_key=self.api_key)
+
+    @property
+    def client(self):
+        """Get the OpenAI SDK client, creating it on first use.
+
+        Returns:
+            openai.OpenAI instance, or None if the API key is not set
+        """
+        if self._client is None and self.api_key:
+            # Imported lazily so runs that never summarize don't pay for the SDK
+            import openai
+
+            # Retries are handled by the dispatcher, which also budgets them
+            self._client = openai.OpenAI(api_key=self.api_key, max_retries=0)
+        return self._client
+
+    @property
+    def available(self) -> bool:
+        """Check whether requests can be answered.
+
+        Returns:
+            True if the API key is set, or if the calling thread's requests are
+            answered by the offline batch endpoint
+        """
+        collector = current_batch_collector()
+        return bool(self.api_key) or (collector is not None and collector.offline)
+
+    def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-4o",
+        temperature: float = 0.3,
+        max_tokens: int = 500,
+        call_type: Optional[str] = None,
+        tickers: Sequence[str] = (),
+        source: Optional[str] = None,
+        **params: Any,
+    ) -> str:
+        """Run a chat completion, serving byte-identical requests from the cache.
+
+        Every OpenAI call in the project goes through this method. Calls made
+        inside a batch participant scope are run through the Batch API instead of
+        the synchronous endpoint. Usage is recorded in the run's ledger, and the
+        budget governor may downgrade the call to the small model or refuse it.
+
+        Args:
+            messages: Chat messages
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum completion tokens
+            call_type: Kind of request, used to report metrics per route
+            tickers: Tickers the request is for, used for accounting and budgets
+            source: Content source summarized (e.g. "reddit"), used for accounting
+            **params: Extra request parameters passed to the API
+
+        Returns:
+            Completion text, stripped of surrounding whitespace
+
+        Raises:
+            TokenBudgetExceeded: If a token budget of the run is exhausted
+        """
+        tags = (call_type, tickers, source)
+        estimated_tokens = self._estimate_tokens(messages, max_tokens)
+        model, stop = self._apply_budget(model, tickers, estimated_tokens)
+        try:
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = LLMResponseCache.make_key(
+                    model,
+                    messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **params,
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"LLM cache hit ({model})")
+                    self._record_usage(None, model, *tags, served_from="cache")
+                    return cached
+            if stop:
+                raise TokenBudgetExceeded(
+                    f"Token budget exhausted ({', '.join(tickers) or 'run'})"
+                )
+
+            started = time.monotonic()
+            collector = current_batch_collector()
+            if collector is not None:
+                response = collector.submit(
+                    {
+                        "model": model,
+                        "messages": messages,
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                        **params,
+                    }
+                )
+            else:
+                response = self.dispatcher.run(
+                    lambda: self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        **params,
+                    ),
+                    estimated_tokens,
+                )
+            self._record_usage(
+                getattr(response, "usage", None),
+                model,
+                *tags,
+                latency=time.monotonic() - started,
+                served_from="api" if collector is None else "batch",
+            )
+            content = response.choices[0].message.content.strip()
+
+            if cache_key is not None:
+                self.response_cache.set(cache_key, content)
+            return content
+        finally:
+            if not stop:
+                self.usage_ledger.release(tickers, estimated_tokens)
+
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-4o",
+        temperature: float = 0.3,
+        max_tokens: int = 500,
+        call_type: Optional[str] = None,
+        tickers: Sequence[str] = (),
+        source: Optional[str] = None,
+        **params: Any,
+    ) -> str:
+        """Async variant of chat_completion(), executed on a worker thread.
+
+        Concurrent async callers share the dispatcher's RPM/TPM budget with
+        threaded ones.
+
+        Args:
+            messages: Chat messages
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum completion tokens
+            call_type: Kind of request, used to report metrics per route
+            tickers: Tickers the request is for, used for accounting and budgets
+            source: Content source summarized, used for accounting
+            **params: Extra request parameters passed to the API
+
+        Returns:
+            Completion text, stripped of surrounding whitespace
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.chat_completion,
+                messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                call_type=call_type,
+                tickers=tickers,
+                source=source,
+                **params,
+            ),
+        )
+
+    @staticmethod
+    def _estimate_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+        """Estimate the tokens a request counts against the TPM limit.
+
+        Args:
+            messages: Chat messages
+            max_tokens: Maximum completion tokens
+
+        Returns:
+            Prompt tokens plus the maximum completion tokens
+        """
+        return sum(count_tokens(message["content"]) for message in messages) + max_tokens
+
+    def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-4o",
+        temperature: float = 0.3,
+        max_tokens: int = 500,
+        call_type: Optional[str] = None,
+        tickers: Sequence[str] = (),
+        source: Optional[str] = None,
+        **params: Any,
+    ) -> Iterator[str]:
+        """Run a streaming chat completion, yielding text as it is generated.
+
+        Cached and batched responses are yielded in one piece. The time to the
+        first token of every streamed API call is recorded, and the full response
+        is cached once the stream completes.
+
+        Args:
+            messages: Chat messages
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum completion tokens
+            call_type: Kind of request, used to report metrics per route
+            tickers: Tickers the request is for, used for accounting and budgets
+            source: Content source summarized, used for accounting
+            **params: Extra request parameters passed to the API
+
+        Yields:
+            Text chunks of the completion
+
+        Raises:
+            TokenBudgetExceeded: If a token budget of the run is exhausted
+        """
+        if current_batch_collector() is not None:
+            yield self.chat_completion(
+                messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                call_type=call_type,
+                tickers=tickers,
+                source=source,
+                **params,
+            )
+            return
+
+        tags = (call_type, tickers, source)
+        estimated_tokens = self._estimate_tokens(messages, max_tokens)
+        model, stop = self._apply_budget(model, tickers, estimated_tokens)
+        try:
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = LLMResponseCache.make_key(
+                    model,
+                    messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **params,
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"LLM cache hit ({model})")
+                    self._record_usage(None, model, *tags, served_from="cache")
+                    yield cached
+                    return
+            if stop:
+                raise TokenBudgetExceeded(
+                    f"Token budget exhausted ({', '.join(tickers) or 'run'})"
+                )
+
+            started = time.monotonic()
+            stream = self.dispatcher.stream(
+                lambda: self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **params,
+                ),
+                estimated_tokens,
+            )
+            chunks: List[str] = []
+            usage = None
+            try:
+                for event in stream:
+                    if not event.choices:
+                        # The final chunk carries the usage and no choices
+                        usage = getattr(event, "usage", None) or usage
+                        continue
+                    text = event.choices[0].delta.content
+                    if not text:
+                        continue
+                    if not chunks:
+                        ttft = time.monotonic() - started
+                        with self._metrics_lock:
+                            self._ttft_seconds.append(ttft)
+                        logger.debug(
+                            f"Time to first token ({model}): {ttft:.3f}s"
+                        )
+                    chunks.append(text)
+                    yield text
+            finally:
+                # Free the dispatcher slot even if the caller stops reading early
+                stream.close()
+            self._record_usage(
+                usage, model, *tags, latency=time.monotonic() - started
+            )
+
+            if cache_key is not None:
+                self.response_cache.set(cache_key, "".join(chunks).strip())
+        finally:
+            if not stop:
+                self.usage_ledger.release(tickers, estimated_tokens)
+
+    def route(self, call_type: str, content: str = "", items: int = 1) -> ModelRoute:
+        """Pick the model and completion token limit of a request.
+
+        Args:
+            call_type: Kind of request (see clients.model_router)
+            content: Variable input of the request, sized to route it
+            items: Number of summaries requested at once
+
+        Returns:
+            Model and completion token limit
+        """
+        route = self.router.route(call_type, count_tokens(content), items)
+        return ModelRoute(route.model, min(route.max_tokens, MAX_COMPLETION_TOKENS))
+
+    def _apply_budget(
+        self, model: str, tickers: Sequence[str], estimated_tokens: int
+    ) -> Tuple[str, bool]:
+        """Apply the budget governor's decision to a call.
+
+        Unless the call is refused, its estimated tokens are reserved against the
+        budgets; the caller must release them once the call is done.
+
+        Args:
+            model: Model the call was routed to
+            tickers: Tickers the call is for
+            estimated_tokens: Estimated tokens of the call
+
+        Returns:
+            Model to use, and whether the call must be refused (cache hits are
+            still served)
+        """
+        action = self.governor.check(tickers, estimated_tokens)
+        if action == "downgrade" and model != self.router.small_model:
+            logger.info(
+                f"Token budget running low, downgrading {model} to "
+                f"{self.router.small_model}"
+            )
+            return self.router.small_model, False
+        return model, action == "stop"
+
+    def _record_usage(
+        self,
+        usage: Any,
+        model: str,
+        call_type: Optional[str] = None,
+        tickers: Sequence[str] = (),
+        source: Optional[str] = None,
+        latency: float = 0.0,
+        served_from: str = "api",
+    ) -> None:
+        """Record a call's token usage and latency in the run's ledger.
+
+        Args:
+            usage: Usage object of the API response (None if not reported)
+            model: Model name
+            call_type: Kind of request
+            tickers: Tickers the request is for
+            source: Content source summarized
+            latency: Seconds the call took, including dispatch waits and retries
+            served_from: "api", "batch" or "cache"
+        """
+        details = getattr(usage, "prompt_tokens_details", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        cached_tokens = getattr(details, "cached_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+        cost = estimate_cost(
+            model,
+            prompt_tokens,
+            cached_tokens,
+            completion_tokens,
+            batched=served_from == "batch",
+        )
+        self.usage_ledger.add(
+            UsageRecord(
+                call_type=call_type or "other",
+                model=model,
+                tickers=tuple(tickers),
+                source=source,
+                served_from=served_from,
+                prompt_tokens=prompt_tokens,
+                cached_tokens=cached_tokens,
+                completion_tokens=completion_tokens,
+                latency_seconds=latency,
+                cost_usd=cost or 0.0,
+            )
+        )
+
+    def start_run(self) -> None:
+        """Reset usage accounting and budgets for a new run."""
+        self.usage_ledger.start_run()
+        self.governor.reset()
+
+    def get_route_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get latency, token and cost metrics per route.
+
+        Returns:
+            Dictionary mapping "call_type:model" to its call statistics
+        """
+        return self.usage_ledger.by_route()
+
+    def get_usage_metrics(self) -> Dict[str, Any]:
+        """Get token usage of the run, including provider-side cached tokens.
+
+        Returns:
+            Dictionary of call and token counts and the cached prompt ratio
+        """
+        return self.usage_ledger.totals()
+
+    def get_budget_metrics(self) -> Dict[str, Any]:
+        """Get token budgets and counts of downgraded and refused calls.
+
+        Returns:
+            Dictionary of budget governor metrics
+        """
+        return self.governor.get_metrics()
+
+    def get_usage_report(self) -> str:
+        """Format the run's usage per ticker.
+
+        Returns:
+            Multi-line usage report
+        """
+        return self.usage_ledger.report()
+
+    def get_latency_metrics(self) -> Dict[str, Any]:
+        """Get time-to-first-token metrics of streamed calls.
+
+        Returns:
+            Dictionary of streamed call count and average/max time to first token
+        """
+        with self._metrics_lock:
+            samples = list(self._ttft_seconds)
+        if not samples:
+            return {"streamed_calls": 0}
+        return {
+            "streamed_calls": len(samples),
+            "ttft_avg_seconds": round(sum(samples) / len(samples), 3),
+            "ttft_max_seconds": round(max(samples), 3),
+        }
+
+    def get_dispatch_metrics(self) -> Dict[str, Any]:
+        """Get request budgeting and retry metrics.
+
+        Returns:
+            Dictionary of dispatcher metrics
+        """
+        return self.dispatcher.get_metrics()
+
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """Get response cache hit/miss metrics.
+
+        Returns:
+            Dictionary of cache metrics (empty if caching is disabled)
+        """
+        if self.response_cache is None:
+            return {}
+        return self.response_cache.get_metrics()
 
     def generate_summary(
         self,
@@ -53,64 +567,320 @@ class OpenAIClient:
 
         Returns:
             Summarized text from GPT-4
+
+        Raises:
+            TokenBudgetExceeded: If a token budget of the run is exhausted
         """
-        if not self.api_key:
+        if not self.available:
             return "GPT-4 summarization not available (API key not set)."
 
         try:
-            # Create prompt based on source and price change
-            price_direction = (
-                "increase"
-                if price_change_percent and price_change_percent > 0
-                else "decrease"
-            )
-
-            if source == "reddit":
-                prompt = f"""Analyze these Reddit discussions about {ticker} stock and provide a concise, coherent summary that explains what Redditors believe is causing the stock's {price_direction} ({price_change_percent:.2f}% change). 
-                Focus on the most insightful points about market sentiment, catalysts, and predictions. 
-                Organize the summary into 3 key points with clear explanations that comprehensively captures the most insightful points. 
-                Be specific about factors driving the price change.
-                
-                Reddit content:
-                {content}
-                """
-            elif source == "seeking_alpha":
-                prompt = f"""Analyze these Seeking Alpha articles about {ticker} stock and provide a concise, coherent summary that explains what analysts believe is causing the stock's {price_direction} ({price_change_percent:.2f}% change).
-                Focus on the most insightful points about fundamentals, catalysts, and analyst opinions. 
-                Organize the summary into 3 key points with clear explanations that comprehensively captures the most insightful points. 
-                Be specific about factors driving the price change.
-                
-                Seeking Alpha content:
-                {content}
-                """
-            else:  # General news
-                prompt = f"""Analyze these news headlines and articles about {ticker} stock and provide a concise, coherent summary that explains what is likely causing the stock's {price_direction} ({price_change_percent:.2f}% change).
-                Focus on the most important news, events, and market reactions. 
-                Organize the summary into 3 key points with clear explanations that comprehensively captures the most insightful points. 
-                Be specific about factors driving the price change.
-                
-                News content:
-                {content}
-                """
+            call_type, messages, route = self._summary_request(
+                content, ticker, price_change_percent, source
+            )
 
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a financial analyst specializing in stock market analysis. Provide concise, insightful summaries of market news and sentiment, as well as earnings-related news that may have direct impact to price change",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            summary = self.chat_completion(
+                model=route.model,
+                messages=messages,
                 temperature=0.3,
-                max_tokens=500,
+                max_tokens=route.max_tokens,
+                call_type=call_type,
+                tickers=(ticker,),
+                source=source,
             )
-
-            # Extract and return the summary
-            summary = response.choices[0].message.content.strip()
             return summary
 
+        except TokenBudgetExceeded:
+            # Left to the caller, which answers without the LLM
+            raise
         except Exception as e:
             logger.error(f"Error generating GPT-4 summary: {str(e)}")
             return f"Error generating summary: {str(e)}"
+
+    def _summary_request(
+        self,
+        content: str,
+        ticker: str,
+        price_change_percent: Optional[float],
+        source: str,
+    ) -> Tuple[str, List[Dict[str, str]], ModelRoute]:
+        """Build the single-ticker summary request for content.
+
+        Args:
+            content: The content to summarize
+            ticker: Stock ticker symbol
+            price_change_percent: Price change percentage (optional)
+            source: Source of the content (e.g., "reddit", "news", "seeking_alpha")
+
+        Returns:
+            Call type, chat messages and route of the request
+        """
+        call_type = (
+            f"summary_{source}"
+            if source in ("reddit", "seeking_alpha")
+            else "summary_news"
+        )
+        messages = build_messages(
+            call_type,
+            f"{describe_move(ticker, price_change_percent)}\n\nContent:\n{content}",
+        )
+        return call_type, messages, self.route(call_type, content)
+
+    def _summary_cache_key(
+        self,
+        content: str,
+        ticker: str,
+        price_change_percent: Optional[float],
+        source: str,
+    ) -> Optional[str]:
+        """Get the cache key of the single-ticker summary request for content.
+
+        Returns:
+            Cache key, or None if caching is disabled
+        """
+        if self.response_cache is None:
+            return None
+        _, messages, route = self._summary_request(
+            content, ticker, price_change_percent, source
+        )
+        return LLMResponseCache.make_key(
+            route.model, messages, temperature=0.3, max_tokens=route.max_tokens
+        )
+
+    def get_cached_summary(
+        self,
+        content: str,
+        ticker: str,
+        price_change_percent: Optional[float] = None,
+        source: str = "news",
+    ) -> Optional[str]:
+        """Get a cached summary of content without making a request.
+
+        Summaries split out of batched responses are cached under the key of
+        the single-ticker request, so this finds a ticker's summary whichever
+        way it was produced.
+
+        Args:
+            content: The content to summarize
+            ticker: Stock ticker symbol
+            price_change_percent: Price change percentage (optional)
+            source: Source of the content (e.g., "reddit", "news", "seeking_alpha")
+
+        Returns:
+            Cached summary text, or None on a miss
+        """
+        key = self._summary_cache_key(content, ticker, price_change_percent, source)
+        if key is None:
+            return None
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            call_type, _, route = self._summary_request(
+                content, ticker, price_change_percent, source
+            )
+            logger.info(f"LLM cache hit ({route.model})")
+            self._record_usage(
+                None, route.model, call_type, (ticker,), source, served_from="cache"
+            )
+        return cached
+
+    def generate_subreddit_summaries(
+        self,
+        contents: Dict[str, str],
+        ticker: str,
+        price_change_percent: Optional[float] = None,
+    ) -> Dict[str, str]:
+        """Summarize the discussions of several subreddits in a single request.
+
+        The model is asked for a JSON object keyed by subreddit name. Subreddits
+        missing from (or malformed in) the response are left out of the result so
+        the caller can fall back to per-subreddit summaries.
+
+        Args:
+            contents: Dictionary mapping subreddit names to packed discussion content
+            ticker: Stock ticker symbol
+            price_change_percent: Price change percentage (optional)
+
+        Returns:
+            Dictionary mapping subreddit names to summary text
+        """
+        if not self.available or not contents:
+            return {}
+
+        sections = "\n\n".join(
+            f"=== r/{subreddit} ===\n{content}" for subreddit, content in contents.items()
+        )
+        keys = ", ".join(f'"{subreddit}"' for subreddit in contents)
+        messages = build_messages(
+            "subreddit_summaries",
+            f"{describe_move(ticker, price_change_percent)}\n"
+            f"Subreddits (JSON keys): {keys}\n\n"
+            f"Reddit content:\n{sections}",
+        )
+
+        route = self.route("subreddit_summaries", sections, items=len(contents))
+
+        try:
+            response = self.chat_completion(
+                model=route.model,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=route.max_tokens,
+                call_type="subreddit_summaries",
+                tickers=(ticker,),
+                source="reddit",
+                response_format={"type": "json_object"},
+            )
+            parsed = json.loads(response)
+        except Exception as e:
+            logger.error(f"Error generating combined Reddit summary: {str(e)}")
+            return {}
+
+        if not isinstance(parsed, dict):
+            logger.warning("Combined Reddit summary was not a JSON object")
+            return {}
+
+        # Match keys case-insensitively and tolerate an "r/" prefix
+        by_key = {}
+        for key, value in parsed.items():
+            key = str(key).lower()
+            by_key[key[2:] if key.startswith("r/") else key] = value
+        summaries = {}
+        for subreddit in contents:
+            summary = by_key.get(subreddit.lower())
+            if isinstance(summary, list):
+                summary = "\n".join(str(point) for point in summary)
+            if isinstance(summary, str) and summary.strip():
+                summaries[subreddit] = summary.strip()
+        return summaries
+
+    def generate_ticker_summaries(
+        self,
+        contents: Dict[str, str],
+        price_changes: Dict[str, Optional[float]],
+        source: str = "news",
+    ) -> Dict[str, str]:
+        """Summarize the same source for several tickers in a single request.
+
+        The model is asked for a JSON object keyed by ticker. Tickers missing from
+        (or malformed in) the response are left out of the result so the caller
+        can fall back to single-ticker summaries.
+
+        Args:
+            contents: Dictionary mapping tickers to the content to summarize
+            price_changes: Dictionary mapping tickers to price change percentages
+            source: Source of the content (e.g., "reddit", "news", "seeking_alpha")
+
+        Returns:
+            Dictionary mapping tickers to summary text
+        """
+        if not self.available or not contents:
+            return {}
+
+        content_kind, whose_view, focus = SOURCE_PROMPT_PARTS.get(
+            source, SOURCE_PROMPT_PARTS["news"]
+        )
+        sections = []
+        for ticker, content in contents.items():
+            change = price_changes.get(ticker) or 0.0
+            direction = "increase" if change > 0 else "decrease"
+            sections.append(
+                f"=== {ticker} ({direction}, {change:.2f}% change) ===\n{content}"
+            )
+        keys = ", ".join(f'"{ticker}"' for ticker in contents)
+        body = "\n\n".join(sections)
+        messages = build_messages(
+            "ticker_summaries",
+            f"Tickers (JSON keys): {keys}\n\nContent:\n{body}",
+            content_kind=content_kind,
+            whose_view=whose_view,
+            focus=focus,
+        )
+
+        route = self.route("ticker_summaries", body, items=len(contents))
+
+        try:
+            response = self.chat_completion(
+                model=route.model,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=route.max_tokens,
+                call_type="ticker_summaries",
+                tickers=tuple(contents),
+                source=source,
+                response_format={"type": "json_object"},
+            )
+            parsed = json.loads(response)
+        except Exception as e:
+            logger.error(f"Error generating batched {source} summary: {str(e)}")
+            return {}
+
+        if not isinstance(parsed, dict):
+            logger.warning(f"Batched {source} summary was not a JSON object")
+            return {}
+
+        by_key = {str(key).upper().lstrip("$"): value for key, value in parsed.items()}
+        summaries = {}
+        for ticker in contents:
+            summary = by_key.get(ticker.upper())
+            if isinstance(summary, list):
+                summary = "\n".join(str(point) for point in summary)
+            if isinstance(summary, str) and summary.strip():
+                summaries[ticker] = summary.strip()
+                # Cache each ticker's summary on its own, as the same tickers
+                # rarely end up in the same batch again
+                key = self._summary_cache_key(
+                    contents[ticker], ticker, price_changes.get(ticker), source
+                )
+                if key is not None:
+                    self.response_cache.set(key, summaries[ticker])
+        return summaries
+
+    def generate_event_summary(
+        self,
+        content: str,
+        price_changes: Dict[str, Optional[float]],
+    ) -> str:
+        """Summarize news about one event that moved several stocks.
+
+        Args:
+            content: The event's articles
+            price_changes: Dictionary mapping affected tickers to price changes
+
+        Returns:
+            Summarized text from GPT-4
+
+        Raises:
+            TokenBudgetExceeded: If a token budget of the run is exhausted
+        """
+        if not self.available:
+            return "GPT-4 summarization not available (API key not set)."
+
+        try:
+            moves = ", ".join(
+                f"{ticker} ({(change or 0.0):+.2f}%)"
+                for ticker, change in price_changes.items()
+            )
+            messages = build_messages(
+                "event_summary",
+                f"Affected stocks: {moves}\n\nNews content:\n{content}",
+            )
+
+            route = self.route("event_summary", content)
+
+            return self.chat_completion(
+                model=route.model,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=route.max_tokens,
+                call_type="event_summary",
+                tickers=tuple(price_changes),
+                source="event",
+            )
+
+        except TokenBudgetExceeded:
+            # Left to the caller, which answers without the LLM
+            raise
+        except Exception as e:
+            logger.error(f"Error generating GPT-4 event summary: {str(e)}")
+            return f"Error generating summary: {str(e)}"
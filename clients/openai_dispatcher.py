@@ -0,0 +1,322 @@
+"""
+Rate-limit-aware dispatcher for OpenAI API requests.
+
+This module provides a dispatcher that every OpenAI request goes through. It
+tracks requests and tokens per minute over a sliding window against the
+configured account limits, starts waiting calls in arrival order once the
+budget allows, and retries rate-limited (429), server-side (5xx) and transient
+connection failures with jittered exponential backoff.
+"""
+
+import asyncio
+import collections
+import functools
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger("news_agent")
+
+# Account limits the dispatcher keeps under
+OPENAI_RPM_LIMIT = int(os.environ.get("OPENAI_RPM_LIMIT", "500"))
+OPENAI_TPM_LIMIT = int(os.environ.get("OPENAI_TPM_LIMIT", "30000"))
+
+# Maximum requests in flight at once
+OPENAI_MAX_CONCURRENCY = int(os.environ.get("OPENAI_MAX_CONCURRENCY", "8"))
+
+# Retry policy for 429, 5xx and connection errors
+OPENAI_MAX_RETRIES = int(os.environ.get("OPENAI_MAX_RETRIES", "5"))
+OPENAI_BACKOFF_BASE_SECONDS = float(os.environ.get("OPENAI_BACKOFF_BASE", "1.0"))
+OPENAI_BACKOFF_MAX_SECONDS = float(os.environ.get("OPENAI_BACKOFF_MAX", "30.0"))
+
+# Length of the sliding rate-limit window
+WINDOW_SECONDS = 60.0
+
+# Exception class names (from the OpenAI SDK) that are worth retrying
+RETRYABLE_ERROR_NAMES = {"APITimeoutError", "APIConnectionError", "RateLimitError"}
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check whether a failed OpenAI request is worth retrying.
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        True for rate limits, server errors, timeouts and connection errors
+    """
+    status_code = getattr(error, "status_code", None)
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the server's suggested retry delay from a failed request, if any.
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        Seconds to wait, or None if the response didn't say
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+class OpenAIDispatcher:
+    """FIFO dispatcher that budgets OpenAI requests against RPM/TPM limits."""
+
+    def __init__(
+        self,
+        rpm_limit: int = OPENAI_RPM_LIMIT,
+        tpm_limit: int = OPENAI_TPM_LIMIT,
+        max_concurrency: int = OPENAI_MAX_CONCURRENCY,
+        max_retries: int = OPENAI_MAX_RETRIES,
+        backoff_base_seconds: float = OPENAI_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds: float = OPENAI_BACKOFF_MAX_SECONDS,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            rpm_limit: Requests allowed per minute
+            tpm_limit: Tokens (prompt plus maximum completion) allowed per minute
+            max_concurrency: Maximum requests in flight at once
+            max_retries: Retries of a request after retryable failures
+            backoff_base_seconds: Base delay of the exponential backoff
+            backoff_max_seconds: Upper bound of a single backoff delay
+        """
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+        self._condition = threading.Condition()
+        self._queue: Deque[int] = collections.deque()
+        self._sequence = itertools.count()
+        self._active = 0
+        # (start time, tokens) of requests started within the window
+        self._window: Deque[Tuple[float, int]] = collections.deque()
+        self._window_tokens = 0
+        self._paused_until = 0.0
+
+        self.metrics = {
+            "requests": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "failures": 0,
+            "throttle_wait_seconds": 0.0,
+            "backoff_seconds": 0.0,
+        }
+
+    def run(self, request: Callable[[], Any], estimated_tokens: int = 0) -> Any:
+        """Run a request once the budget allows, retrying retryable failures.
+
+        Args:
+            request: Callable performing the OpenAI request
+            estimated_tokens: Tokens the request counts against the TPM limit
+
+        Returns:
+            Whatever the request returns
+        """
+        result = self._start(request, estimated_tokens)
+        self._release()
+        return result
+
+    def stream(
+        self, request: Callable[[], Iterable[Any]], estimated_tokens: int = 0
+    ) -> Iterator[Any]:
+        """Run a streaming request, like run(), and iterate over its events.
+
+        The request's concurrency slot is held until the stream is exhausted or
+        closed, not just until the stream object is returned.
+
+        Args:
+            request: Callable starting the streaming OpenAI request
+            estimated_tokens: Tokens the request counts against the TPM limit
+
+        Yields:
+            Events of the stream
+        """
+        stream = self._start(request, estimated_tokens)
+        try:
+            yield from stream
+        finally:
+            self._release()
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+    def _start(self, request: Callable[[], Any], estimated_tokens: int) -> Any:
+        """Run a request with retries, keeping its concurrency slot on success.
+
+        The caller must release the slot once the request is done with.
+
+        Args:
+            request: Callable performing the OpenAI request
+            estimated_tokens: Tokens the request counts against the TPM limit
+
+        Returns:
+            Whatever the request returns
+        """
+        attempt = 0
+        while True:
+            self._acquire(estimated_tokens)
+            try:
+                return request()
+            except Exception as e:
+                self._release()
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    with self._condition:
+                        self.metrics["failures"] += 1
+                    raise
+                delay = self._backoff_delay(attempt, e)
+                attempt += 1
+                logger.warning(
+                    f"OpenAI request failed ({type(e).__name__}), "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                with self._condition:
+                    self.metrics["retries"] += 1
+                    self.metrics["backoff_seconds"] += delay
+                    if getattr(e, "status_code", None) == 429:
+                        # Hold every caller back, not just this one
+                        self.metrics["rate_limited"] += 1
+                        self._paused_until = max(
+                            self._paused_until, time.monotonic() + delay
+                        )
+            time.sleep(delay)
+
+    async def arun(self, request: Callable[[], Any], estimated_tokens: int = 0) -> Any:
+        """Async variant of run(), executed on a worker thread.
+
+        Args:
+            request: Callable performing the OpenAI request
+            estimated_tokens: Tokens the request counts against the TPM limit
+
+        Returns:
+            Whatever the request returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run, request, estimated_tokens)
+        )
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Compute the delay before the next retry.
+
+        Uses the server's Retry-After hint when present, otherwise full-jitter
+        exponential backoff.
+
+        Args:
+            attempt: Number of retries already made
+            error: Exception raised by the failed request
+
+        Returns:
+            Seconds to wait
+        """
+        hint = retry_after_seconds(error)
+        if hint is not None:
+            return min(hint, self.backoff_max_seconds) + random.uniform(0, 0.5)
+        cap = min(self.backoff_max_seconds, self.backoff_base_seconds * 2**attempt)
+        return random.uniform(0, cap)
+
+    def _acquire(self, tokens: int) -> None:
+        """Wait for this caller's turn and for room in the RPM/TPM window.
+
+        Args:
+            tokens: Tokens the request counts against the TPM limit
+        """
+        ticket = next(self._sequence)
+        queued_at = time.monotonic()
+        # A request larger than the whole TPM budget would otherwise wait forever
+        tokens = min(tokens, self.tpm_limit)
+
+        with self._condition:
+            self._queue.append(ticket)
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                wait = self._wait_seconds(now, tokens)
+                if self._queue[0] == ticket and wait <= 0:
+                    break
+                self._condition.wait(wait if wait > 0 else None)
+
+            self._queue.popleft()
+            self._active += 1
+            self._window.append((now, tokens))
+            self._window_tokens += tokens
+            self.metrics["requests"] += 1
+            self.metrics["throttle_wait_seconds"] += now - queued_at
+            # Let the next caller in line re-check whether it can start
+            self._condition.notify_all()
+
+    def _release(self) -> None:
+        """Free a concurrency slot."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def _expire(self, now: float) -> None:
+        """Drop requests that left the sliding window (the lock must be held)."""
+        while self._window and now - self._window[0][0] >= WINDOW_SECONDS:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def _wait_seconds(self, now: float, tokens: int) -> float:
+        """Time until a request of this size fits (the lock must be held).
+
+        Args:
+            now: Current monotonic time
+            tokens: Tokens the request counts against the TPM limit
+
+        Returns:
+            Seconds to wait (0 or less if it can start now); when only the
+            concurrency limit is in the way, a finishing request wakes it earlier
+        """
+        wait = self._paused_until - now
+        if len(self._window) >= self.rpm_limit:
+            wait = max(wait, self._window[0][0] + WINDOW_SECONDS - now)
+        if self._window_tokens + tokens > self.tpm_limit:
+            # Find when enough old requests expire to make room
+            freed = 0
+            needed = self._window_tokens + tokens - self.tpm_limit
+            for started, window_tokens in self._window:
+                freed += window_tokens
+                if freed >= needed:
+                    wait = max(wait, started + WINDOW_SECONDS - now)
+                    break
+        if wait <= 0 and self._active >= self.max_concurrency:
+            return WINDOW_SECONDS
+        return wait
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get dispatch, throttling and retry metrics.
+
+        Returns:
+            Dictionary of dispatcher statistics and current window usage
+        """
+        with self._condition:
+            self._expire(time.monotonic())
+            metrics = dict(self.metrics)
+            metrics["throttle_wait_seconds"] = round(metrics["throttle_wait_seconds"], 3)
+            metrics["backoff_seconds"] = round(metrics["backoff_seconds"], 3)
+            metrics["window_requests"] = len(self._window)
+            metrics["window_tokens"] = self._window_tokens
+            return metrics
@@ -5,12 +5,23 @@ This module provides a client for interacting with the Reddit API to retrieve
 posts and comments related to specific stocks.
 """
 
+import contextlib
 import logging
 import os
-from typing import List, Optional, Set
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
-import praw
-from models.news_models import NewsArticle
+from models.news_models import ArticleRecord
+from clients.reddit_ingestion import RedditIngestionStore
+from clients.reddit_routing import SubredditRouter
+from clients.reddit_scheduler import RedditRequestScheduler
+from clients.reddit_search_planner import RedditSearchPlanner
+from utils.mention_extractor import Mention, MentionExtractor
+from utils.relevance import rank_articles
+from utils.shared_instance import SharedInstanceMixin
+from utils.ttl_cache import TTLCache
 
 logger = logging.getLogger("news_agent")
 
@@ -18,22 +29,40 @@ logger = logging.getLogger("news_agent")
 REDDIT_CLIENT_ID = os.environ.get("REDDIT_CLIENT_ID")
 REDDIT_CLIENT_SECRET = os.environ.get("REDDIT_CLIENT_SECRET")
 REDDIT_USER_AGENT = os.environ.get("REDDIT_USER_AGENT", "stock-watchlist-alert-agent")
+REDDIT_BASE_URL = "https://www.reddit.com"
 
-# Subreddits to search
-DEFAULT_SUBREDDITS = [
+# General market subreddits, searched for every ticker
+GENERAL_SUBREDDITS = [
     "wallstreetbets",
     "stocks",
     "investing",
     "StockMarket",
     "ValueInvesting",
     "SecurityAnalysis",
+]
+
+# Single-stock communities, only searched for tickers they have produced
+# relevant posts for (see SubredditRouter)
+TICKER_SUBREDDITS = [
     "TSMC",
     "NVDA",
     "TSLA",
     "Apple",
 ]
 
-# Common stock tickers to check for to avoid cross-contamination
+# Summarization only uses the most relevant posts per subreddit, truncated to a
+# fixed length, so comments are only loaded for posts that survive this selection
+MAX_POSTS_PER_SUBREDDIT = 5
+MAX_POST_CHARS = 3000
+MAX_COMMENTS_PER_POST = 5
+
+# Comment loading concurrency (each worker uses its own PRAW instance) and the
+# lifetime of cached top comments
+COMMENT_LOAD_WORKERS = int(os.environ.get("REDDIT_COMMENT_LOAD_WORKERS", "4"))
+COMMENT_CACHE_TTL_SECONDS = int(os.environ.get("REDDIT_COMMENT_CACHE_TTL", "900"))
+
+# Common stock tickers to check for to avoid cross-contamination. The watchlist
+# universe is added on top of these via RedditClient.start_run
 COMMON_TICKERS = [
     "AAPL",
     "TSLA",
@@ -48,7 +77,7 @@ COMMON_TICKERS = [
 ]
 
 
-class RedditClient:
+class RedditClient(SharedInstanceMixin):
     """Client for interacting with the Reddit API."""
 
     def __init__(
@@ -57,24 +86,115 @@ class RedditClient:
         client_secret: Optional[str] = None,
         user_agent: Optional[str] = None,
         subreddits: Optional[List[str]] = None,
+        search_planner: Optional[RedditSearchPlanner] = None,
+        ingestion_store: Optional[RedditIngestionStore] = None,
+        scheduler: Optional[RedditRequestScheduler] = None,
+        router: Optional[SubredditRouter] = None,
     ):
         """Initialize the Reddit client.
 
+        No network I/O happens here: the PRAW instance is created and the
+        credentials are verified on first use.
+
         Args:
             client_id: Reddit API client ID (defaults to environment variable)
             client_secret: Reddit API client secret (defaults to environment variable)
             user_agent: Reddit API user agent (defaults to environment variable)
-            subreddits: List of subreddits to search (defaults to DEFAULT_SUBREDDITS)
+            subreddits: List of subreddits to search for every ticker (defaults to
+                routing GENERAL_SUBREDDITS plus learned TICKER_SUBREDDITS)
+            search_planner: Planner for multi-subreddit searches
+            ingestion_store: Persistent store for incremental listing ingestion
+            scheduler: Ratelimit-aware scheduler every Reddit request goes through
+            router: Ticker-to-subreddit router
         """
         self.client_id = client_id or REDDIT_CLIENT_ID
         self.client_secret = client_secret or REDDIT_CLIENT_SECRET
         self.user_agent = user_agent or REDDIT_USER_AGENT
-        self.subreddits = subreddits or DEFAULT_SUBREDDITS
+        self.router = router or SubredditRouter(
+            general_subreddits=subreddits or GENERAL_SUBREDDITS,
+            specific_subreddits=[] if subreddits else TICKER_SUBREDDITS,
+        )
         self.reddit = None
-        self.setup_client()
+        self.search_planner = search_planner or RedditSearchPlanner()
+        self.ingestion_store = ingestion_store or RedditIngestionStore()
+        self.scheduler = scheduler or RedditRequestScheduler(
+            limits_provider=self._get_rate_limits
+        )
+        # Rendered top comments keyed by permalink
+        self.comment_cache = TTLCache(COMMENT_CACHE_TTL_SECONDS)
+        # PRAW instances of the comment loading workers, idle ones in the queue
+        self._comment_clients = queue.LifoQueue()
+        self._all_comment_clients: List[Any] = []
+        self._comment_clients_lock = threading.Lock()
+        self.mention_extractor = MentionExtractor.from_tickers(COMMON_TICKERS)
+        # Title/body mentions per permalink, so listings shared across tickers are
+        # only scanned once per run
+        self._mention_cache: Dict[
+            str, Tuple[Dict[str, Mention], Dict[str, Mention]]
+        ] = {}
+        self._setup_attempted = False
+
+    def start_run(self, universe: Dict[str, Optional[str]]) -> None:
+        """Prepare the client for a new run over a watchlist.
+
+        Compiles the mention extractor for the run's ticker universe, resets the
+        per-run search yield statistics, re-enables listing ingestion and advances
+        the subreddit routing run counter.
+
+        Args:
+            universe: Dictionary mapping watchlist tickers to company names
+        """
+        self.search_planner.reset()
+        self.ingestion_store.start_run()
+        self.router.start_run()
+        combined = {ticker: None for ticker in COMMON_TICKERS}
+        combined.update(universe)
+        self.mention_extractor = MentionExtractor(combined)
+        self._mention_cache = {}
+        logger.info(
+            f"Compiled Reddit mention extractor for {len(self.mention_extractor.tickers)} tickers"
+        )
+
+    def _get_mention_extractor(self, ticker: str) -> MentionExtractor:
+        """Get a mention extractor that knows about the given ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            MentionExtractor covering the ticker universe plus the ticker
+        """
+        if ticker.upper() not in self.mention_extractor.tickers:
+            universe = dict(self.mention_extractor.universe)
+            universe[ticker.upper()] = None
+            self.mention_extractor = MentionExtractor(universe)
+            self._mention_cache = {}
+        return self.mention_extractor
+
+    def _extract_mentions(
+        self, submission, extractor: MentionExtractor
+    ) -> Tuple[Dict[str, Mention], Dict[str, Mention]]:
+        """Get the title and body ticker mentions of a submission.
+
+        Args:
+            submission: PRAW Submission object
+            extractor: Mention extractor for the current universe
+
+        Returns:
+            Tuple of (title mentions, body mentions)
+        """
+        cached = self._mention_cache.get(submission.permalink)
+        if cached is None:
+            cached = (
+                extractor.extract(submission.title),
+                extractor.extract(getattr(submission, "selftext", "")),
+            )
+            self._mention_cache[submission.permalink] = cached
+        return cached
 
     def setup_client(self) -> None:
-        """Set up the Reddit API client."""
+        """Set up the Reddit API client and verify the credentials."""
+        self._setup_attempted = True
         if not all([self.client_id, self.client_secret, self.user_agent]):
             logger.warning(
                 "Reddit API credentials not complete. Reddit search will be skipped."
@@ -82,13 +202,7 @@ class RedditClient:
             return
 
         try:
-            self.reddit = praw.Reddit(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                user_agent=self.user_agent,
-                check_for_async=False,
-                read_only=True,
-            )
+            self.reddit = self._create_praw()
             # Verify the authentication worked
             logger.info(
                 f"Reddit client initialized (read-only: {self.reddit.read_only})"
@@ -100,20 +214,118 @@ class RedditClient:
             logger.error(f"Failed to initialize Reddit client: {str(e)}")
             self.reddit = None
 
+    def _create_praw(self):
+        """Create a read-only PRAW instance with the client's credentials.
+
+        Returns:
+            praw.Reddit instance
+        """
+        # Imported lazily so runs without Reddit work don't pay for PRAW
+        import praw
+
+        return praw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent=self.user_agent,
+            check_for_async=False,
+            read_only=True,
+        )
+
+    @contextlib.contextmanager
+    def _comment_client(self) -> Iterator[Any]:
+        """Check out a PRAW instance for a comment loading worker.
+
+        PRAW instances (their requestor and ratelimit state) aren't thread-safe,
+        so each concurrent worker uses its own. Instances are kept for reuse, so
+        at most COMMENT_LOAD_WORKERS are ever created.
+
+        Yields:
+            praw.Reddit instance used by no other thread meanwhile
+        """
+        try:
+            reddit = self._comment_clients.get_nowait()
+        except queue.Empty:
+            reddit = self._create_praw()
+            with self._comment_clients_lock:
+                self._all_comment_clients.append(reddit)
+        try:
+            yield reddit
+        finally:
+            self._comment_clients.put(reddit)
+
+    def _get_rate_limits(self) -> Dict[str, Any]:
+        """Get the ratelimit state PRAW parsed from the latest response headers.
+
+        The budget is shared by every PRAW instance of the client, so the state
+        of the instance that saw the latest window (and the least remaining
+        requests in it) is used.
+
+        Returns:
+            Dictionary with remaining, used and reset_timestamp entries
+        """
+        if self.reddit is None:
+            return {}
+        with self._comment_clients_lock:
+            instances = [self.reddit] + self._all_comment_clients
+        limits = [dict(reddit.auth.limits) for reddit in instances]
+        return max(
+            limits,
+            key=lambda state: (
+                state.get("reset_timestamp") or 0.0,
+                -(state.get("remaining") or 0.0),
+            ),
+        )
+
+    def get_rate_limit_metrics(self) -> Dict[str, Any]:
+        """Get Reddit ratelimit budget usage and scheduling metrics.
+
+        Returns:
+            Dictionary of budget and scheduler metrics
+        """
+        return self.scheduler.get_metrics()
+
+    def _scheduled(self) -> Callable[[Callable[[], Any]], Any]:
+        """Build a wrapper that runs requests through the scheduler.
+
+        Returns:
+            Callable that runs a request callable via the scheduler
+        """
+        return self.scheduler.run
+
+    def _ensure_client(self) -> bool:
+        """Set up the Reddit API client on first use.
+
+        Returns:
+            True if the Reddit API client is available, False otherwise
+        """
+        if self.reddit is None and not self._setup_attempted:
+            self.setup_client()
+        return self.reddit is not None
+
     def get_posts(
-        self, ticker: str, search_query: Optional[str] = None, days: int = 2
-    ) -> List[NewsArticle]:
+        self,
+        ticker: str,
+        search_query: Optional[str] = None,
+        days: int = 2,
+        max_posts_per_subreddit: int = MAX_POSTS_PER_SUBREDDIT,
+        company_name: Optional[str] = None,
+    ) -> List[ArticleRecord]:
         """Get posts and comments from Reddit about the stock.
 
+        Only the max_posts_per_subreddit posts of each subreddit most worth
+        summarizing are returned, and comments are only loaded for those posts.
+
         Args:
             ticker: Stock ticker symbol
             search_query: Search query in the form of "{ticker} {company_name}" (optional)
             days: How many days back to search for posts
+            max_posts_per_subreddit: Number of posts to keep per subreddit
+            company_name: Company name used to rank posts by relevance (optional)
 
         Returns:
-            List of NewsArticle objects containing Reddit posts and discussions
+            List of ArticleRecord objects containing Reddit posts and discussions
         """
-        if not self.reddit:
+        if not self._ensure_client():
             logger.warning("Reddit client not available. Skipping Reddit search.")
             return []
 
@@ -124,59 +336,46 @@ class RedditClient:
         cutoff_time = datetime.now() - timedelta(days=days)
 
         try:
+            # Only query the subreddits that are useful for this ticker
+            subreddits = self.router.route(ticker)
+
             # We can search multiple subreddits at once using the '+' notation
-            combined_subreddits = "+".join(self.subreddits)
+            combined_subreddits = "+".join(subreddits)
             logger.info(f"Searching combined subreddits: {combined_subreddits}")
 
             # Create the multi-subreddit instance
             multi_subreddit = self.reddit.subreddit(combined_subreddits)
 
-            # Search queries to try
-            search_queries = []
-
-            # If we have a search query (ticker + company name), use it for more targeted searches
-            if search_query:
-                search_queries = [
-                    search_query,
-                    f"{search_query} stock",
-                    f"{search_query} price",
-                ]
-            else:
-                # Fall back to ticker-only searches
-                search_queries = [
-                    ticker,
-                    f"{ticker} stock",
-                    f"{ticker} price",
-                ]
-
-            processed_permalinks: Set[str] = (
-                set()
-            )  # Keep track of already processed submissions
-            other_tickers = [t for t in COMMON_TICKERS if t != ticker]
+            # Keep track of already processed submissions, keyed by permalink
+            processed_submissions: Dict[str, Any] = {}
+            call = self._scheduled()
+            extractor = self._get_mention_extractor(ticker)
 
-            # Search for the ticker with different queries
+            # Search for the ticker with one query per sort order
             articles.extend(
                 self._search_with_queries(
                     multi_subreddit,
-                    search_queries,
+                    effective_query,
                     ticker,
-                    other_tickers,
-                    processed_permalinks,
+                    extractor,
+                    processed_submissions,
                     cutoff_time,
+                    call,
                 )
             )
 
-            # Also search individual subreddits for better coverage
-            for subreddit_name in self.subreddits:
+            # Also check recent posts of individual subreddits for better coverage
+            for subreddit_name in subreddits:
                 try:
                     subreddit = self.reddit.subreddit(subreddit_name)
                     articles.extend(
                         self._search_subreddit_listings(
                             subreddit,
                             ticker,
-                            other_tickers,
-                            processed_permalinks,
+                            extractor,
+                            processed_submissions,
                             cutoff_time,
+                            call,
                         )
                     )
                 except Exception as sr_e:
@@ -188,6 +387,18 @@ class RedditClient:
             logger.info(
                 f"Found {len(articles)} Reddit posts for {ticker} across all subreddits"
             )
+            self.router.record(
+                ticker, subreddits, {article.subreddit for article in articles}
+            )
+
+            # Only load comments for the posts summarization will actually use
+            articles = self._select_per_subreddit(
+                articles, ticker, company_name, max_posts_per_subreddit
+            )
+            logger.info(f"Loading comments for {len(articles)} selected posts")
+            self._load_comments(articles, processed_submissions, call)
+            for article in articles:
+                article.store_content()
 
         except Exception as e:
             logger.error(f"Error in Reddit search process for {ticker}: {str(e)}")
@@ -197,50 +408,42 @@ class RedditClient:
     def _search_with_queries(
         self,
         multi_subreddit,
-        search_queries: List[str],
+        search_query: str,
         ticker: str,
-        other_tickers: List[str],
-        processed_permalinks: Set[str],
+        extractor: MentionExtractor,
+        processed_submissions: Dict[str, Any],
         cutoff_time: datetime,
-    ) -> List[NewsArticle]:
-        """Search Reddit with multiple queries.
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> List[ArticleRecord]:
+        """Search Reddit with the planned queries.
 
         Args:
             multi_subreddit: PRAW Subreddit object for searching multiple subreddits
-            search_queries: List of search queries to try
+            search_query: Base search query (ticker, optionally with company name)
             ticker: Stock ticker symbol
-            other_tickers: List of other tickers to check for cross-contamination
-            processed_permalinks: Set of already processed permalinks
+            extractor: Mention extractor used to check for cross-contamination
+            processed_submissions: Already processed submissions keyed by permalink
             cutoff_time: Cutoff time for posts
+            call: Wrapper each Reddit request is run through
 
         Returns:
-            List of NewsArticle objects
+            List of ArticleRecord objects
         """
         articles = []
 
-        for search_query in search_queries:
-            logger.info(f"Searching with query: {search_query}")
-
-            # Try different sort methods for more comprehensive results
-            for sort in ["relevance", "hot", "new", "top"]:
-                try:
-                    for submission in multi_subreddit.search(
-                        search_query, sort=sort, time_filter="week", limit=5
-                    ):
-                        article = self._process_submission(
-                            submission,
-                            ticker,
-                            other_tickers,
-                            processed_permalinks,
-                            cutoff_time,
-                        )
-                        if article:
-                            articles.append(article)
-                except Exception as sort_e:
-                    logger.warning(
-                        f"Error with sort '{sort}' and query '{search_query}': {str(sort_e)}"
-                    )
-                    continue  # Try next sort method
+        # Submissions come back deduplicated by permalink across all sorts
+        for submission in self.search_planner.collect(
+            multi_subreddit, search_query, exclude=processed_submissions, call=call
+        ):
+            article = self._process_submission(
+                submission,
+                ticker,
+                extractor,
+                processed_submissions,
+                cutoff_time,
+            )
+            if article:
+                articles.append(article)
 
         return articles
 
@@ -248,153 +451,151 @@ class RedditClient:
         self,
         subreddit,
         ticker: str,
-        other_tickers: List[str],
-        processed_permalinks: Set[str],
+        extractor: MentionExtractor,
+        processed_submissions: Dict[str, Any],
         cutoff_time: datetime,
-    ) -> List[NewsArticle]:
-        """Search a subreddit's listings for posts about a ticker.
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> List[ArticleRecord]:
+        """Search a subreddit's recent posts for posts about a ticker.
+
+        Recent posts come from the incremental ingestion store, so the
+        subreddit's listing is only paged down to content seen in earlier runs.
 
         Args:
             subreddit: PRAW Subreddit object
             ticker: Stock ticker symbol
-            other_tickers: List of other tickers to check for cross-contamination
-            processed_permalinks: Set of already processed permalinks
+            extractor: Mention extractor used to check for cross-contamination
+            processed_submissions: Already processed submissions keyed by permalink
             cutoff_time: Cutoff time for posts
+            call: Wrapper each Reddit request is run through
 
         Returns:
-            List of NewsArticle objects
+            List of ArticleRecord objects
         """
         articles = []
 
-        # Check top and hot posts that might mention the ticker
-        for listing_method in [subreddit.hot, subreddit.top]:
-            try:
-                for submission in listing_method(limit=50):
-                    # Check if this post is relevant to the ticker
-                    title_lower = submission.title.lower()
-                    selftext_lower = (
-                        submission.selftext.lower()
-                        if hasattr(submission, "selftext")
-                        else ""
-                    )
+        try:
+            recent_posts = self.ingestion_store.get_recent_posts(
+                subreddit, cutoff_time.timestamp(), call
+            )
+        except Exception as listing_e:
+            logger.warning(
+                f"Error with listing in r/{subreddit.display_name}: {str(listing_e)}"
+            )
+            return articles
 
-                    # Determine if the post is primarily about this ticker
-                    is_relevant = self._is_submission_relevant(
-                        submission, ticker, other_tickers, title_lower, selftext_lower
-                    )
+        for post in recent_posts:
+            # Scan title and body once for every ticker in the universe
+            title_mentions, body_mentions = self._extract_mentions(post, extractor)
 
-                    if not is_relevant:
-                        continue
+            # Determine if the post is primarily about this ticker
+            is_relevant = self._is_submission_relevant(
+                ticker, title_mentions, body_mentions
+            )
 
-                    # Process the submission if it's relevant
-                    article = self._process_submission(
-                        submission,
-                        ticker,
-                        other_tickers,
-                        processed_permalinks,
-                        cutoff_time,
-                    )
-                    if article:
-                        articles.append(article)
-            except Exception as listing_e:
-                logger.warning(
-                    f"Error with listing method in r/{subreddit.display_name}: {str(listing_e)}"
-                )
+            if not is_relevant:
                 continue
 
+            # Process the post if it's relevant
+            article = self._process_submission(
+                post,
+                ticker,
+                extractor,
+                processed_submissions,
+                cutoff_time,
+                title_mentions,
+            )
+            if article:
+                articles.append(article)
+
         return articles
 
     def _is_submission_relevant(
         self,
-        submission,
         ticker: str,
-        other_tickers: List[str],
-        title_lower: str,
-        selftext_lower: str,
+        title_mentions: Dict[str, Mention],
+        body_mentions: Dict[str, Mention],
     ) -> bool:
         """Determine if a submission is relevant to the ticker.
 
         Args:
-            submission: PRAW Submission object
             ticker: Stock ticker symbol
-            other_tickers: List of other tickers to check for cross-contamination
-            title_lower: Lowercase title of the submission
-            selftext_lower: Lowercase selftext of the submission
+            title_mentions: Ticker mentions found in the submission title
+            body_mentions: Ticker mentions found in the submission body
 
         Returns:
             True if the submission is relevant, False otherwise
         """
-        ticker_lower = ticker.lower()
-
-        if ticker_lower in title_lower:
-            # Check if another ticker appears more prominently in the title
-            for other_ticker in other_tickers:
-                if other_ticker.lower() in title_lower and title_lower.find(
-                    other_ticker.lower()
-                ) < title_lower.find(ticker_lower):
-                    return False
+        ticker = ticker.upper()
 
+        if ticker in title_mentions:
             # If ticker is in the title and not overshadowed, it's likely relevant
-            return True
-        elif ticker_lower in selftext_lower:
-            # If ticker is only in the body, check if it's mentioned prominently
-            # Count occurrences of this ticker vs. other tickers
-            ticker_count = selftext_lower.count(ticker_lower)
-            other_ticker_counts = {
-                other: selftext_lower.count(other.lower()) for other in other_tickers
-            }
-
-            # Skip if another ticker is mentioned more frequently
-            if any(count > ticker_count for count in other_ticker_counts.values()):
-                return False
-
-            return True
+            return not self._is_overshadowed_in_title(ticker, title_mentions)
+        elif ticker in body_mentions:
+            # If ticker is only in the body, skip it if another ticker is
+            # mentioned more frequently
+            ticker_count = body_mentions[ticker].count
+            return not any(
+                mention.count > ticker_count for mention in body_mentions.values()
+            )
         else:
             # Ticker not found in title or body
             return False
 
+    def _is_overshadowed_in_title(
+        self, ticker: str, title_mentions: Dict[str, Mention]
+    ) -> bool:
+        """Check whether another ticker dominates the title.
+
+        Args:
+            ticker: Stock ticker symbol
+            title_mentions: Ticker mentions found in the submission title
+
+        Returns:
+            True if another ticker is in the title and this ticker isn't, or if
+            another ticker appears before this ticker in the title
+        """
+        own = title_mentions.get(ticker)
+        for other_ticker, mention in title_mentions.items():
+            if other_ticker == ticker:
+                continue
+            if own is None or mention.first_position < own.first_position:
+                return True
+        return False
+
     def _process_submission(
         self,
         submission,
         ticker: str,
-        other_tickers: List[str],
-        processed_permalinks: Set[str],
+        extractor: MentionExtractor,
+        processed_submissions: Dict[str, Any],
         cutoff_time: datetime,
-    ) -> Optional[NewsArticle]:
-        """Process a submission and create a NewsArticle if relevant.
+        title_mentions: Optional[Dict[str, Mention]] = None,
+    ) -> Optional[ArticleRecord]:
+        """Process a submission and create an ArticleRecord if relevant.
 
         Args:
             submission: PRAW Submission object
             ticker: Stock ticker symbol
-            other_tickers: List of other tickers to check for cross-contamination
-            processed_permalinks: Set of already processed permalinks
+            extractor: Mention extractor used to check for cross-contamination
+            processed_submissions: Already processed submissions keyed by permalink
             cutoff_time: Cutoff time for posts
+            title_mentions: Title mentions if the caller already extracted them
 
         Returns:
-            NewsArticle object if the submission is relevant, None otherwise
+            ArticleRecord object if the submission is relevant, None otherwise
         """
         # Skip if already processed
-        if submission.permalink in processed_permalinks:
+        if submission.permalink in processed_submissions:
             return None
 
-        # Check if this post is primarily about another ticker
-        title_lower = submission.title.lower()
-
-        # Skip if the title contains another ticker that appears more prominently
-        for other_ticker in other_tickers:
-            # If another ticker is in the title and our ticker isn't, or
-            # if another ticker appears before our ticker in the title
-            if (
-                other_ticker.lower() in title_lower
-                and ticker.lower() not in title_lower
-            ) or (
-                other_ticker.lower() in title_lower
-                and title_lower.find(other_ticker.lower())
-                < title_lower.find(ticker.lower())
-            ):
-                return None
-
-        processed_permalinks.add(submission.permalink)
+        # Skip if the title is primarily about another ticker
+        if title_mentions is None:
+            title_mentions, _ = self._extract_mentions(submission, extractor)
+        if self._is_overshadowed_in_title(ticker.upper(), title_mentions):
+            return None
+
+        processed_submissions[submission.permalink] = submission
 
         created_time = datetime.fromtimestamp(submission.created_utc)
         # Skip if post is older than cutoff
@@ -404,27 +605,123 @@ class RedditClient:
         # Get the actual subreddit name from the submission
         subreddit_name = submission.subreddit.display_name
 
-        # Compile content from post and top comments
+        # Comments are loaded later, and only if the post is selected
         post_content = submission.selftext if hasattr(submission, "selftext") else ""
-        content = f"Post: {post_content}\n\nTop comments:\n"
 
+        return ArticleRecord(
+            source="Reddit",
+            subreddit=subreddit_name,
+            title=submission.title,
+            url=f"{REDDIT_BASE_URL}{submission.permalink}",
+            content=f"Post: {post_content}",
+            published_at=created_time,
+            # Stored once the post is selected and its comments are loaded
+            inline=True,
+        )
+
+    def _select_per_subreddit(
+        self,
+        articles: List[ArticleRecord],
+        ticker: str,
+        company_name: Optional[str],
+        max_posts: int,
+    ) -> List[ArticleRecord]:
+        """Keep only the posts of each subreddit most worth summarizing.
+
+        Posts are ranked like summarization ranks them (recency, ticker mentions
+        in the title and BM25 relevance), so an older but more relevant post can
+        win over a newer one.
+
+        Args:
+            articles: List of ArticleRecord objects from Reddit
+            ticker: Stock ticker symbol
+            company_name: Company name used for relevance ranking (optional)
+            max_posts: Number of posts to keep per subreddit
+
+        Returns:
+            Selected ArticleRecord objects, highest priority first within each
+            subreddit
+        """
+        by_subreddit: Dict[str, List[ArticleRecord]] = {}
+        for article in articles:
+            by_subreddit.setdefault(article.subreddit, []).append(article)
+
+        selected = []
+        for sub_articles in by_subreddit.values():
+            ranked = rank_articles(sub_articles, ticker, company_name)
+            selected.extend(article for _, article in ranked[:max_posts])
+        return selected
+
+    def _load_comments(
+        self,
+        articles: List[ArticleRecord],
+        processed_submissions: Dict[str, Any],
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> None:
+        """Load top comments for the selected articles concurrently.
+
+        Up to COMMENT_LOAD_WORKERS posts are loaded at once, each on its own
+        PRAW instance, and every request still goes through the scheduler, which
+        serializes and paces them when the ratelimit budget runs low.
+
+        Args:
+            articles: Selected ArticleRecord objects, updated in place
+            processed_submissions: Processed submissions keyed by permalink
+            call: Wrapper each Reddit request is run through
+        """
+        pending = []
+        for article in articles:
+            content = article.content or ""
+            # Comments of long posts would be truncated away during summarization
+            if len(content) >= MAX_POST_CHARS:
+                continue
+            permalink = article.url[len(REDDIT_BASE_URL) :]
+            pending.append((article, content, permalink))
+        if not pending:
+            return
+
+        def load(article: ArticleRecord, content: str, permalink: str) -> None:
+            comments = self.comment_cache.get(permalink)
+            if comments is None:
+                submission_id = processed_submissions[permalink].id
+                with self._comment_client() as reddit:
+                    comments = call(
+                        lambda: self._fetch_top_comments(reddit, submission_id)
+                    )
+                if comments is not None:
+                    self.comment_cache.set(permalink, comments)
+            if comments is None:
+                comments = "(Unable to fetch comments)\n"
+            article.set_content(
+                f"{content}\n\nTop comments:\n{comments}", store=False
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(COMMENT_LOAD_WORKERS, len(pending)))
+        ) as executor:
+            list(executor.map(lambda args: load(*args), pending))
+
+    def _fetch_top_comments(self, reddit, submission_id: str) -> Optional[str]:
+        """Fetch and render the top comments of a submission.
+
+        Args:
+            reddit: PRAW instance used for the request
+            submission_id: Reddit submission ID
+
+        Returns:
+            Numbered top comments, or None if they could not be fetched
+        """
         # Try to get top comments, but don't fail the whole operation if it doesn't work
         try:
-            # Get top 5 comments
+            # A lazy Submission bound to the calling worker's PRAW instance
+            submission = reddit.submission(id=submission_id)
             submission.comment_sort = "top"
             submission.comments.replace_more(limit=0)  # Skip loading "more comments"
 
-            for i, comment in enumerate(submission.comments[:5]):
-                content += f"{i + 1}. {comment.body}\n"
+            comments = ""
+            for i, comment in enumerate(submission.comments[:MAX_COMMENTS_PER_POST]):
+                comments += f"{i + 1}. {comment.body}\n"
+            return comments
         except Exception as comment_e:
             logger.warning(f"Error getting comments: {str(comment_e)}")
-            content += "(Unable to fetch comments)\n"
-
-        return NewsArticle(
-            source="Reddit",
-            subreddit=subreddit_name,
-            title=submission.title,
-            url=f"https://www.reddit.com{submission.permalink}",
-            content=content,
-            published_at=created_time,
-        )
+            return None
@@ -0,0 +1,296 @@
+"""
+Incremental Reddit listing ingestion.
+
+This module keeps a persistent per-subreddit cache of recent posts together with a
+high-water mark (the newest created_utc down to which every post was ingested).
+Each run only pages a subreddit's `new` listing until it reaches content seen in
+a previous run, and reuses the cached posts for the rest of the lookback window.
+"""
+
+import logging
+import os
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from utils.state_store import JsonStateStore
+
+logger = logging.getLogger("news_agent")
+
+# How far back cached posts are kept
+INGEST_LOOKBACK_DAYS = float(os.environ.get("REDDIT_INGEST_LOOKBACK_DAYS", "2"))
+
+# Upper bound on posts paged from a `new` listing in one ingestion
+INGEST_MAX_POSTS = int(os.environ.get("REDDIT_INGEST_MAX_POSTS", "1000"))
+
+# Posts per listing page (the most Reddit returns per request)
+PAGE_SIZE = 100
+
+# Post bodies are stored truncated to keep the state file small
+STORED_SELFTEXT_CHARS = 10000
+
+
+class RedditPost:
+    """Lightweight stand-in for a PRAW Submission restored from the cache."""
+
+    __slots__ = ("id", "permalink", "title", "selftext", "created_utc", "subreddit")
+
+    def __init__(
+        self,
+        id: str,
+        permalink: str,
+        title: str,
+        selftext: str,
+        created_utc: float,
+        subreddit_name: str,
+    ):
+        """Initialize the post.
+
+        Args:
+            id: Reddit submission ID
+            permalink: Submission permalink
+            title: Submission title
+            selftext: Submission body
+            created_utc: Creation time as a UTC epoch timestamp
+            subreddit_name: Display name of the subreddit
+        """
+        self.id = id
+        self.permalink = permalink
+        self.title = title
+        self.selftext = selftext
+        self.created_utc = created_utc
+        # Mirrors submission.subreddit.display_name on PRAW objects
+        self.subreddit = SimpleNamespace(display_name=subreddit_name)
+
+    @classmethod
+    def from_submission(cls, submission, subreddit_name: str) -> "RedditPost":
+        """Build a post from a PRAW Submission.
+
+        Args:
+            submission: PRAW Submission object
+            subreddit_name: Display name of the subreddit being ingested
+
+        Returns:
+            RedditPost holding the submission's listing data
+        """
+        return cls(
+            id=submission.id,
+            permalink=submission.permalink,
+            title=submission.title,
+            selftext=(getattr(submission, "selftext", "") or "")[
+                :STORED_SELFTEXT_CHARS
+            ],
+            created_utc=float(submission.created_utc),
+            subreddit_name=subreddit_name,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict, subreddit_name: str) -> "RedditPost":
+        """Restore a post from its stored form."""
+        return cls(
+            id=data["id"],
+            permalink=data["permalink"],
+            title=data["title"],
+            selftext=data.get("selftext", ""),
+            created_utc=data["created_utc"],
+            subreddit_name=subreddit_name,
+        )
+
+    def to_dict(self) -> Dict:
+        """Return the post in its stored form."""
+        return {
+            "id": self.id,
+            "permalink": self.permalink,
+            "title": self.title,
+            "selftext": self.selftext,
+            "created_utc": self.created_utc,
+        }
+
+
+class RedditIngestionStore:
+    """Persistent per-subreddit post cache with high-water marks."""
+
+    def __init__(
+        self,
+        store: Optional[JsonStateStore] = None,
+        lookback_days: float = INGEST_LOOKBACK_DAYS,
+        max_posts: int = INGEST_MAX_POSTS,
+    ):
+        """Initialize the ingestion store.
+
+        Args:
+            store: Backing state store (defaults to reddit_ingestion.json in the cache dir)
+            lookback_days: How many days of posts to keep per subreddit
+            max_posts: Upper bound on posts paged per ingestion
+        """
+        self.store = store or JsonStateStore("reddit_ingestion.json")
+        self.lookback_days = lookback_days
+        self.max_posts = max_posts
+        self._ingested_this_run: Set[str] = set()
+
+    def start_run(self) -> None:
+        """Allow every subreddit to be ingested again in the new run."""
+        self._ingested_this_run = set()
+
+    def get_recent_posts(
+        self,
+        subreddit,
+        since_utc: float,
+        call: Optional[Callable[[Callable[[], Any]], Any]] = None,
+    ) -> List[RedditPost]:
+        """Get a subreddit's posts newer than a timestamp, ingesting new ones first.
+
+        Each subreddit is ingested at most once per run; later calls in the same
+        run are served from the cache.
+
+        Args:
+            subreddit: PRAW Subreddit object
+            since_utc: Only return posts created after this UTC epoch timestamp
+            call: Wrapper each listing page request is run through (e.g. a
+                scheduler)
+
+        Returns:
+            List of RedditPost objects, newest first
+        """
+        name = subreddit.display_name
+        if name not in self._ingested_this_run:
+            self._ingest(subreddit, call)
+            self._ingested_this_run.add(name)
+
+        state = self.store.get(name, {})
+        posts = [
+            RedditPost.from_dict(data, name)
+            for data in state.get("posts", {}).values()
+            if data["created_utc"] >= since_utc
+        ]
+        posts.sort(key=lambda post: post.created_utc, reverse=True)
+        return posts
+
+    def _ingest(
+        self,
+        subreddit,
+        call: Optional[Callable[[Callable[[], Any]], Any]] = None,
+    ) -> None:
+        """Page the subreddit's `new` listing down to the high-water mark.
+
+        Pages are fetched one request at a time, so each one counts against the
+        ratelimit budget. If max_posts stops paging above the mark, the listing
+        cursor is stored and the next run resumes from it after paging the
+        newer posts, so the mark only advances once there is no gap below it.
+
+        Args:
+            subreddit: PRAW Subreddit object
+            call: Wrapper each page request is run through
+        """
+        call = call or (lambda request: request())
+        name = subreddit.display_name
+        state = self.store.get(name, {})
+        posts: Dict[str, Dict] = dict(state.get("posts", {}))
+        high_water_mark = state.get("newest_created_utc", 0.0)
+        resume = state.get("resume")
+        window_start = time.time() - self.lookback_days * 86400
+        cached_count = len(posts)
+
+        try:
+            # Newest posts first, down to where the last run started paging
+            top_mark = resume["newest_created_utc"] if resume else high_water_mark
+            newest, fetched, after, complete = self._page(
+                subreddit, posts, None, top_mark, window_start, self.max_posts, call
+            )
+            newest = max(newest, top_mark)
+            if complete and resume:
+                # Then the gap the last run left above the mark
+                _, resumed, after, complete = self._page(
+                    subreddit,
+                    posts,
+                    resume["after"],
+                    high_water_mark,
+                    window_start,
+                    self.max_posts - fetched,
+                    call,
+                )
+                fetched += resumed
+        except Exception as e:
+            # Keep the previous state: advancing the mark past a partial page
+            # would leave a permanent gap in the cache. The cached posts are
+            # still served for this run.
+            logger.warning(f"Error ingesting r/{name}: {str(e)}")
+            return
+
+        if complete:
+            state = {"newest_created_utc": newest}
+        else:
+            logger.info(
+                f"Ingestion of r/{name} stopped at {self.max_posts} posts before "
+                "reaching content from earlier runs; resuming next run"
+            )
+            state = {
+                "newest_created_utc": high_water_mark,
+                "resume": {"after": after, "newest_created_utc": newest},
+            }
+        new_count = len(posts) - cached_count
+
+        # Drop posts that fell out of the lookback window
+        state["posts"] = {
+            permalink: data
+            for permalink, data in posts.items()
+            if data["created_utc"] >= window_start
+        }
+        self.store.set(name, state)
+        self.store.save()
+
+        logger.info(
+            f"Ingested {new_count} new posts from r/{name} "
+            f"({len(state['posts'])} cached)"
+        )
+
+    def _page(
+        self,
+        subreddit,
+        posts: Dict[str, Dict],
+        after: Optional[str],
+        stop_utc: float,
+        window_start: float,
+        max_posts: int,
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> Tuple[float, int, Optional[str], bool]:
+        """Page the `new` listing from a cursor down to a timestamp.
+
+        Args:
+            subreddit: PRAW Subreddit object
+            posts: Cached posts keyed by permalink, updated in place
+            after: Fullname of the post to page from (None for the newest)
+            stop_utc: Stop at posts created at or before this timestamp
+            window_start: Stop at posts older than the lookback window
+            max_posts: Upper bound on posts paged
+            call: Wrapper each page request is run through
+
+        Returns:
+            Newest created_utc seen (0.0 if none), posts paged, fullname of the
+            last post paged and whether paging reached stop_utc, the window or
+            the end of the listing
+        """
+        name = subreddit.display_name
+        newest = 0.0
+        fetched = 0
+        while fetched < max_posts:
+            limit = min(PAGE_SIZE, max_posts - fetched)
+            params = {"after": after} if after else {}
+            page = call(lambda: list(subreddit.new(limit=limit, params=params)))
+            fetched += len(page)
+            for submission in page:
+                created_utc = float(submission.created_utc)
+                # `new` is ordered newest first, so anything at or below the
+                # mark was ingested in a previous run
+                if created_utc <= stop_utc or created_utc < window_start:
+                    return newest, fetched, after, True
+                newest = max(newest, created_utc)
+                # Posts cached by a run cut off by max_posts are paged past
+                if submission.permalink not in posts:
+                    posts[submission.permalink] = RedditPost.from_submission(
+                        submission, name
+                    ).to_dict()
+            if len(page) < limit:
+                return newest, fetched, after, True
+            after = page[-1].fullname
+        return newest, fetched, after, False
@@ -0,0 +1,123 @@
+"""
+Learned ticker-to-subreddit routing.
+
+This module decides which subreddits to query for a ticker. General market
+subreddits are always queried; single-stock communities are only queried for
+tickers they have actually produced relevant posts for in past runs, with periodic
+exploration so new (ticker, subreddit) pairs can still be discovered.
+"""
+
+import logging
+import os
+from typing import Dict, Iterable, List, Optional
+
+from utils.state_store import JsonStateStore
+
+logger = logging.getLogger("news_agent")
+
+# Minimum hit rate for a single-stock subreddit to keep being queried for a ticker
+MIN_HIT_RATE = float(os.environ.get("REDDIT_ROUTING_MIN_HIT_RATE", "0.2"))
+
+# Every this many runs, pruned (ticker, subreddit) pairs are explored again
+EXPLORE_EVERY_RUNS = int(os.environ.get("REDDIT_ROUTING_EXPLORE_EVERY", "20"))
+
+
+class SubredditRouter:
+    """Routes tickers to subreddits using hit rates persisted across runs."""
+
+    def __init__(
+        self,
+        general_subreddits: List[str],
+        specific_subreddits: List[str],
+        store: Optional[JsonStateStore] = None,
+        min_hit_rate: float = MIN_HIT_RATE,
+        explore_every_runs: int = EXPLORE_EVERY_RUNS,
+    ):
+        """Initialize the router.
+
+        Args:
+            general_subreddits: Subreddits queried for every ticker
+            specific_subreddits: Single-stock subreddits queried only when useful
+            store: Backing state store (defaults to reddit_routing.json in the cache dir)
+            min_hit_rate: Minimum hit rate to keep querying a specific subreddit
+            explore_every_runs: Run interval for re-exploring pruned pairs
+        """
+        self.general_subreddits = general_subreddits
+        self.specific_subreddits = specific_subreddits
+        self.store = store or JsonStateStore("reddit_routing.json")
+        self.min_hit_rate = min_hit_rate
+        self.explore_every_runs = explore_every_runs
+
+    def start_run(self) -> None:
+        """Advance the persisted run counter."""
+        self.store.set("run", self.store.get("run", 0) + 1)
+        self.store.save()
+
+    def route(self, ticker: str) -> List[str]:
+        """Get the subreddits to query for a ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            General subreddits plus the specific subreddits worth querying
+        """
+        run = self.store.get("run", 0)
+        pairs = self.store.get("pairs", {}).get(ticker.upper(), {})
+
+        routed = list(self.general_subreddits)
+        for subreddit in self.specific_subreddits:
+            stats = pairs.get(subreddit.lower())
+            if stats is None or stats["queries"] == 0:
+                # Never tried for this ticker: explore it
+                routed.append(subreddit)
+            elif stats["hits"] / stats["queries"] >= self.min_hit_rate:
+                routed.append(subreddit)
+            elif run - stats.get("last_queried_run", 0) >= self.explore_every_runs:
+                routed.append(subreddit)
+        return routed
+
+    def record(
+        self, ticker: str, queried: Iterable[str], hit_subreddits: Iterable[str]
+    ) -> None:
+        """Record which queried subreddits produced relevant posts for a ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+            queried: Subreddits that were queried for the ticker
+            hit_subreddits: Subreddits of the relevant posts that were found
+        """
+        specific = {subreddit.lower() for subreddit in self.specific_subreddits}
+        hits = {subreddit.lower() for subreddit in hit_subreddits if subreddit}
+        run = self.store.get("run", 0)
+
+        all_pairs: Dict[str, Dict] = self.store.get("pairs", {})
+        pairs = all_pairs.setdefault(ticker.upper(), {})
+        for subreddit in queried:
+            key = subreddit.lower()
+            if key not in specific:
+                continue
+            stats = pairs.setdefault(key, {"queries": 0, "hits": 0})
+            stats["queries"] += 1
+            stats["last_queried_run"] = run
+            if key in hits:
+                stats["hits"] += 1
+
+        self.store.set("pairs", all_pairs)
+        self.store.save()
+
+    def get_hit_rates(self, ticker: str) -> Dict[str, float]:
+        """Get the recorded hit rates of specific subreddits for a ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Dictionary mapping subreddit names to hit rates
+        """
+        pairs = self.store.get("pairs", {}).get(ticker.upper(), {})
+        return {
+            subreddit: stats["hits"] / stats["queries"]
+            for subreddit, stats in pairs.items()
+            if stats["queries"]
+        }
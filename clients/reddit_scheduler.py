@@ -0,0 +1,158 @@
+"""
+Ratelimit-aware request scheduler for the Reddit API.
+
+This module provides a scheduler that every Reddit request goes through. It reads
+the OAuth ratelimit state PRAW keeps from Reddit's response headers (remaining,
+used, reset), adapts concurrency and pacing so the budget lasts until the window
+resets, and serves waiting requests in arrival order.
+"""
+
+import collections
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger("news_agent")
+
+# Maximum concurrent Reddit requests while the budget is healthy
+MAX_CONCURRENCY = int(os.environ.get("REDDIT_MAX_CONCURRENCY", "4"))
+
+# Below this many remaining requests the scheduler serializes and paces requests
+LOW_BUDGET_THRESHOLD = int(os.environ.get("REDDIT_LOW_BUDGET_THRESHOLD", "100"))
+
+
+class RedditRequestScheduler:
+    """Scheduler that paces Reddit requests against the ratelimit budget."""
+
+    def __init__(
+        self,
+        limits_provider: Optional[Callable[[], Dict[str, Any]]] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        low_budget_threshold: int = LOW_BUDGET_THRESHOLD,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            limits_provider: Callable returning PRAW's auth.limits dictionary
+            max_concurrency: Maximum concurrent requests while the budget is healthy
+            low_budget_threshold: Remaining budget below which requests are paced
+        """
+        self.limits_provider = limits_provider
+        self.max_concurrency = max_concurrency
+        self.low_budget_threshold = low_budget_threshold
+
+        self._condition = threading.Condition()
+        self._queue: Deque[int] = collections.deque()
+        self._sequence = itertools.count()
+        self._active = 0
+        self._concurrency = max_concurrency
+        self._interval = 0.0
+        self._next_start = 0.0
+
+        self._remaining: Optional[float] = None
+        self._used: Optional[int] = None
+        self._reset_timestamp: Optional[float] = None
+        self._requests = 0
+        self._wait_seconds = 0.0
+        self._max_queue_depth = 0
+
+    def run(self, request: Callable[[], Any]) -> Any:
+        """Run a request once the ratelimit budget allows it.
+
+        Args:
+            request: Callable performing a single Reddit request
+
+        Returns:
+            Whatever the request returns
+        """
+        ticket = next(self._sequence)
+        queued_at = time.monotonic()
+
+        with self._condition:
+            self._queue.append(ticket)
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            while True:
+                now = time.monotonic()
+                if (
+                    self._queue[0] == ticket
+                    and self._active < self._concurrency
+                    and now >= self._next_start
+                ):
+                    break
+                timeout = None
+                if self._queue[0] == ticket and self._active < self._concurrency:
+                    timeout = self._next_start - now
+                self._condition.wait(timeout)
+
+            self._queue.popleft()
+            self._active += 1
+            self._next_start = time.monotonic() + self._interval
+            self._wait_seconds += time.monotonic() - queued_at
+            # Let the next request in line re-check whether it can start
+            self._condition.notify_all()
+
+        try:
+            return request()
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._requests += 1
+                self._update_budget()
+                self._condition.notify_all()
+
+    def _update_budget(self) -> None:
+        """Re-read the ratelimit state and adapt concurrency and pacing."""
+        if self.limits_provider is None:
+            return
+        try:
+            limits = self.limits_provider() or {}
+        except Exception as e:
+            logger.debug(f"Could not read Reddit ratelimit state: {str(e)}")
+            return
+
+        self._remaining = limits.get("remaining")
+        self._used = limits.get("used")
+        self._reset_timestamp = limits.get("reset_timestamp")
+
+        if self._remaining is None or self._reset_timestamp is None:
+            self._concurrency = self.max_concurrency
+            self._interval = 0.0
+            return
+
+        seconds_to_reset = max(0.0, self._reset_timestamp - time.time())
+        if self._remaining <= 0:
+            # Budget exhausted: hold everything until the window resets
+            self._concurrency = 1
+            self._interval = 0.0
+            self._next_start = time.monotonic() + seconds_to_reset
+        elif self._remaining < self.low_budget_threshold:
+            # Spread what's left evenly over the rest of the window
+            self._concurrency = 1
+            self._interval = seconds_to_reset / self._remaining
+        else:
+            self._concurrency = self.max_concurrency
+            self._interval = 0.0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get ratelimit budget and scheduling metrics.
+
+        Returns:
+            Dictionary of budget usage and scheduler statistics
+        """
+        with self._condition:
+            seconds_to_reset = None
+            if self._reset_timestamp is not None:
+                seconds_to_reset = round(max(0.0, self._reset_timestamp - time.time()))
+            return {
+                "requests": self._requests,
+                "remaining": self._remaining,
+                "used": self._used,
+                "seconds_to_reset": seconds_to_reset,
+                "concurrency": self._concurrency,
+                "pacing_interval_seconds": round(self._interval, 3),
+                "total_wait_seconds": round(self._wait_seconds, 3),
+                "max_queue_depth": self._max_queue_depth,
+            }
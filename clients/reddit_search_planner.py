@@ -0,0 +1,153 @@
+"""
+Search planner for Reddit ticker searches.
+
+This module provides a planner that collapses the Reddit search fan-out into one
+search per sort order, keeps per-run yield statistics for each sort, and stops
+issuing sorts that never add new submissions.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger("news_agent")
+
+# Sort orders to search, in priority order
+SEARCH_SORTS = ["relevance", "hot", "new", "top"]
+
+# Results requested per search
+SEARCH_RESULT_LIMIT = 15
+
+# Number of searches a sort must have run before it can be dropped for low yield
+MIN_SORT_OBSERVATIONS = 3
+
+
+class SortYield:
+    """Per-run yield statistics for a single sort order."""
+
+    __slots__ = ("searches", "results", "new_permalinks")
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.searches = 0
+        self.results = 0
+        self.new_permalinks = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the statistics as a dictionary."""
+        return {
+            "searches": self.searches,
+            "results": self.results,
+            "new_permalinks": self.new_permalinks,
+        }
+
+
+class RedditSearchPlanner:
+    """Planner that issues one search per useful sort order."""
+
+    def __init__(
+        self,
+        sorts: Optional[List[str]] = None,
+        result_limit: int = SEARCH_RESULT_LIMIT,
+        min_observations: int = MIN_SORT_OBSERVATIONS,
+    ):
+        """Initialize the search planner.
+
+        Args:
+            sorts: Sort orders to search, in priority order (defaults to SEARCH_SORTS)
+            result_limit: Results requested per search
+            min_observations: Searches a sort must run before it can be dropped
+        """
+        self.sorts = sorts or SEARCH_SORTS
+        self.result_limit = result_limit
+        self.min_observations = min_observations
+        self.yields: Dict[str, SortYield] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset the per-run yield statistics."""
+        self.yields = {sort: SortYield() for sort in self.sorts}
+
+    def active_sorts(self) -> List[str]:
+        """Get the sort orders that are still worth searching this run.
+
+        A sort (other than the first) is dropped once it has been searched at
+        least min_observations times without contributing a single new permalink.
+
+        Returns:
+            List of sort orders to search
+        """
+        active = []
+        for index, sort in enumerate(self.sorts):
+            stats = self.yields[sort]
+            if (
+                index > 0
+                and stats.searches >= self.min_observations
+                and stats.new_permalinks == 0
+            ):
+                continue
+            active.append(sort)
+        return active
+
+    def collect(
+        self,
+        multi_subreddit,
+        base_query: str,
+        exclude: Optional[Set[str]] = None,
+        call: Optional[Callable[[Callable[[], Any]], Any]] = None,
+    ) -> List:
+        """Run the planned searches and return unique submissions.
+
+        Args:
+            multi_subreddit: PRAW Subreddit object for searching multiple subreddits
+            base_query: Base search query (ticker, optionally with company name)
+            exclude: Permalinks that have already been processed
+            call: Wrapper each search request is run through (e.g. a scheduler)
+
+        Returns:
+            List of PRAW Submission objects, deduplicated by permalink
+        """
+        seen: Set[str] = set(exclude or ())
+        call = call or (lambda request: request())
+        candidates = []
+
+        logger.info(f"Searching with query: {base_query}")
+        for sort in self.active_sorts():
+            stats = self.yields[sort]
+            try:
+                results = call(
+                    lambda: list(
+                        multi_subreddit.search(
+                            base_query,
+                            sort=sort,
+                            time_filter="week",
+                            limit=self.result_limit,
+                        )
+                    )
+                )
+            except Exception as sort_e:
+                logger.warning(
+                    f"Error with sort '{sort}' and query '{base_query}': {str(sort_e)}"
+                )
+                continue  # Try next sort method
+
+            new_count = 0
+            for submission in results:
+                if submission.permalink in seen:
+                    continue
+                seen.add(submission.permalink)
+                candidates.append(submission)
+                new_count += 1
+
+            stats.searches += 1
+            stats.results += len(results)
+            stats.new_permalinks += new_count
+
+        return candidates
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the per-run yield statistics.
+
+        Returns:
+            Dictionary mapping sort orders to their yield statistics
+        """
+        return {sort: stats.as_dict() for sort, stats in self.yields.items()}
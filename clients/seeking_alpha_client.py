@@ -7,12 +7,19 @@ news articles and analysis related to specific stocks.
 
 import logging
 import os
-import json
-import http.client
-from typing import List, Optional, Dict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Dict
 from datetime import datetime, timedelta
-from models.news_models import NewsArticle
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from models.news_models import ArticleRecord
+from utils.state_store import JsonStateStore
 from clients.openai_client import OpenAIClient
+from clients.prompt_builder import build_messages
+from utils.shared_instance import SharedInstanceMixin
 
 logger = logging.getLogger("news_agent")
 
@@ -22,8 +29,31 @@ SEEKING_ALPHA_HOST = os.environ.get(
     "SEEKING_ALPHA_HOST", "seeking-alpha.p.rapidapi.com"
 )
 
+# Transport settings: (connect, read) timeouts in seconds, retries on 429/5xx
+REQUEST_TIMEOUT = (5, 20)
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+POOL_SIZE = 4
+
+# List results are cached per ticker: within the TTL no request is made, after it
+# only a small page is fetched and merged unless it shows a gap
+LIST_SIZE = 20
+INCREMENTAL_PAGE_SIZE = 5
+LIST_CACHE_TTL_SECONDS = int(os.environ.get("SEEKING_ALPHA_CACHE_TTL", "3600"))
+
+# When true, get_news condenses titles into one LLM-written article (two LLM round
+# trips per ticker). By default raw items are returned and summarized in one pass
+# by SummarizationService
+CONDENSE_TITLES = (
+    os.environ.get("SEEKING_ALPHA_CONDENSE_TITLES", "false").lower() == "true"
+)
+
+# Warn once the RapidAPI quota for the billing period is nearly used up
+QUOTA_WARNING_THRESHOLD = 50
+
 
-class SeekingAlphaClient:
+class SeekingAlphaClient(SharedInstanceMixin):
     """Client for interacting with the Seeking Alpha API."""
 
     def __init__(
@@ -31,24 +61,78 @@ class SeekingAlphaClient:
         api_key: Optional[str] = None,
         host: Optional[str] = None,
         openai_client: Optional[OpenAIClient] = None,
+        list_cache: Optional[JsonStateStore] = None,
+        cache_ttl_seconds: int = LIST_CACHE_TTL_SECONDS,
+        condense_titles: bool = CONDENSE_TITLES,
     ):
         """Initialize the Seeking Alpha client.
 
         Args:
             api_key: Seeking Alpha API key (defaults to environment variable)
             host: Seeking Alpha API host (defaults to environment variable)
-            openai_client: OpenAI client for summarization
+            openai_client: OpenAI client for summarization (defaults to the shared client)
+            list_cache: Persistent per-ticker list cache (defaults to
+                seeking_alpha_lists.json in the cache dir)
+            cache_ttl_seconds: How long cached list results are served without a request
+            condense_titles: Condense titles into a single LLM-summarized article
+                instead of returning the raw items
         """
         self.api_key = api_key or SEEKING_ALPHA_KEY
         self.host = host or SEEKING_ALPHA_HOST
-        self.openai_client = openai_client or OpenAIClient()
+        self._openai_client = openai_client
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self.quota: Dict[str, Any] = {"requests": 0}
+        self.list_cache = list_cache or JsonStateStore("seeking_alpha_lists.json")
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.condense_titles = condense_titles
 
         if not self.api_key:
             logger.warning(
                 "Seeking Alpha API key not set. Seeking Alpha search will be skipped."
             )
 
-    def get_news(self, ticker: str, days: int = 2) -> List[NewsArticle]:
+    @property
+    def openai_client(self) -> OpenAIClient:
+        """Get the OpenAI client, falling back to the shared instance."""
+        if self._openai_client is None:
+            self._openai_client = OpenAIClient.shared()
+        return self._openai_client
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the pooled keep-alive HTTP session, creating it on first use.
+
+        The session is shared across tickers, reuses connections to the RapidAPI
+        host and retries 429/5xx responses with exponential backoff (honouring
+        Retry-After).
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    retry = Retry(
+                        total=MAX_RETRIES,
+                        backoff_factor=RETRY_BACKOFF_FACTOR,
+                        status_forcelist=RETRY_STATUS_CODES,
+                        allowed_methods=["GET"],
+                        respect_retry_after_header=True,
+                        raise_on_status=False,
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=retry
+                    )
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.headers.update(
+                        {
+                            "x-rapidapi-key": self.api_key,
+                            "x-rapidapi-host": self.host,
+                        }
+                    )
+                    self._session = session
+        return self._session
+
+    def get_news(self, ticker: str, days: int = 2) -> List[ArticleRecord]:
         """Get news articles from Seeking Alpha API.
 
         Args:
@@ -56,7 +140,8 @@ class SeekingAlphaClient:
             days: How many days back to search for news
 
         Returns:
-            List of NewsArticle objects containing news articles
+            List of ArticleRecord objects containing the raw analysis and news items,
+            or a single LLM-condensed article if condense_titles is enabled
         """
         if not self.api_key:
             logger.warning(
@@ -68,18 +153,12 @@ class SeekingAlphaClient:
         articles = []
 
         try:
-            conn = http.client.HTTPSConnection(self.host)
-
-            headers = {
-                "x-rapidapi-key": self.api_key,
-                "x-rapidapi-host": self.host,
-            }
-
-            # Get analysis articles
-            analysis_articles = self._get_analysis_articles(conn, headers, ticker)
-
-            # Get news articles
-            news_articles = self._get_news_articles(conn, headers, ticker)
+            # Fetch the analysis and news endpoints concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                analysis_future = executor.submit(self._get_analysis_articles, ticker)
+                news_future = executor.submit(self._get_news_articles, ticker)
+                analysis_articles = analysis_future.result()
+                news_articles = news_future.result()
 
             # Combine articles
             all_articles = analysis_articles + news_articles
@@ -93,6 +172,13 @@ class SeekingAlphaClient:
                     if article.published_at and article.published_at >= cutoff_date
                 ]
 
+            if not self.condense_titles:
+                # Raw items are summarized in a single pass by SummarizationService
+                logger.info(
+                    f"Found {len(all_articles)} Seeking Alpha articles for {ticker}"
+                )
+                return all_articles
+
             # Create a single article with summarized content
             if all_articles:
                 # Extract titles for summarization
@@ -102,7 +188,7 @@ class SeekingAlphaClient:
                 summary = self._summarize_titles(ticker, titles)
 
                 # Create a single article with the summary
-                summary_article = NewsArticle(
+                summary_article = ArticleRecord(
                     source="SeekingAlpha",
                     title=f"Seeking Alpha articles about {ticker}",
                     url=f"https://seekingalpha.com/symbol/{ticker}",
@@ -121,137 +207,251 @@ class SeekingAlphaClient:
             logger.error(f"Error fetching Seeking Alpha news for {ticker}: {str(e)}")
             return []
 
-    def _get_analysis_articles(self, conn, headers, ticker: str) -> List[NewsArticle]:
-        """Get analysis articles from Seeking Alpha API.
+    def _request(self, endpoint: str) -> Dict[str, Any]:
+        """Make a GET request to the Seeking Alpha API.
 
         Args:
-            conn: HTTP connection
-            headers: HTTP headers
-            ticker: Stock ticker symbol
+            endpoint: API path including the query string
+
+        Returns:
+            Decoded JSON response
+        """
+        response = self.session.get(
+            f"https://{self.host}{endpoint}", timeout=REQUEST_TIMEOUT
+        )
+        self._track_quota(response)
+        response.raise_for_status()
+        return response.json()
+
+    def _track_quota(self, response: requests.Response) -> None:
+        """Record RapidAPI quota usage from the response headers.
+
+        Args:
+            response: HTTP response from the RapidAPI host
+        """
+        with self._session_lock:
+            self.quota["requests"] += 1
+            for header, key in [
+                ("x-ratelimit-requests-limit", "limit"),
+                ("x-ratelimit-requests-remaining", "remaining"),
+                ("x-ratelimit-requests-reset", "reset_seconds"),
+            ]:
+                value = response.headers.get(header)
+                if value is not None and value.isdigit():
+                    self.quota[key] = int(value)
+
+        remaining = self.quota.get("remaining")
+        if remaining is not None and remaining < QUOTA_WARNING_THRESHOLD:
+            logger.warning(f"Seeking Alpha RapidAPI quota low: {remaining} requests left")
+
+    def get_quota(self) -> Dict[str, Any]:
+        """Get RapidAPI quota usage observed so far.
 
         Returns:
-            List of NewsArticle objects containing analysis articles
+            Dictionary with the request count and the latest limit, remaining
+            and reset values reported by RapidAPI
+        """
+        with self._session_lock:
+            return dict(self.quota)
+
+    def _parse_articles(self, data: Dict[str, Any]) -> List[ArticleRecord]:
+        """Parse a Seeking Alpha list response into articles.
+
+        Args:
+            data: Decoded list response
+
+        Returns:
+            List of ArticleRecord objects
         """
         articles = []
-        analysis_endpoint = f"/analysis/v2/list?id={ticker.lower()}&size=20&number=1"
-        logger.info(f"Requesting Seeking Alpha analysis: {analysis_endpoint}")
+        for item in data.get("data") or []:
+            # Extract basic article info without getting details
+            attributes = item.get("attributes", {})
+            title = attributes.get("title", "Unknown Title")
+
+            # Get publish time
+            publish_time_str = attributes.get("publishOn")
+            published_date = None
+            if publish_time_str:
+                try:
+                    # Parse the date and make it timezone-naive to avoid comparison issues
+                    dt = datetime.fromisoformat(
+                        publish_time_str.replace("-05:00", "-0500")
+                    )
+                    # Convert to naive datetime by replacing with local time
+                    published_date = datetime(
+                        dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second
+                    )
+                except (ValueError, TypeError):
+                    # If we can't parse the date, just use current time
+                    published_date = datetime.now()
+
+            # Get URL
+            url = None
+            if "links" in item and "self" in item["links"]:
+                url = f"https://seekingalpha.com{item['links']['self']}"
+
+            # Create article object
+            articles.append(
+                ArticleRecord(
+                    source="SeekingAlpha",
+                    title=title,
+                    url=url,
+                    content=title,  # Just use title as content
+                    published_at=published_date,
+                )
+            )
+        return articles
+
+    def _get_list_items(
+        self, kind: str, ticker: str, endpoint_template: str
+    ) -> List[Dict[str, Any]]:
+        """Get list items for a ticker, using the persistent cache when possible.
+
+        Fresh cache entries are returned without a request. Stale entries are
+        refreshed incrementally: a small first page is fetched and only items
+        newer than the last seen one are merged in. If that page holds no item
+        seen before, there may be a gap, so the full list is fetched instead.
+        If the refresh fails, the stale cached list is returned.
+
+        Args:
+            kind: List kind used in the cache key ("analysis" or "news")
+            ticker: Stock ticker symbol
+            endpoint_template: Endpoint with {ticker} and {size} placeholders
+
+        Returns:
+            Raw list items, newest first
+        """
+        key = f"{kind}:{ticker.upper()}"
+        cached = self.list_cache.get(key)
+        now = time.time()
+
+        if cached and now - cached["fetched_at"] < self.cache_ttl_seconds:
+            logger.info(f"Using cached Seeking Alpha {kind} list for {ticker}")
+            return cached["items"]
 
         try:
-            conn.request("GET", analysis_endpoint, headers=headers)
-            res = conn.getresponse()
-            analysis_data = json.loads(res.read().decode("utf-8"))
-
-            # Process analysis articles
-            if "data" in analysis_data and analysis_data["data"]:
-                for article in analysis_data["data"]:
-                    # Extract basic article info without getting details
-                    article_attributes = article.get("attributes", {})
-                    title = article_attributes.get("title", "Unknown Title")
-
-                    # Get publish time
-                    publish_time_str = article_attributes.get("publishOn")
-                    published_date = None
-                    if publish_time_str:
-                        try:
-                            # Parse the date and make it timezone-naive to avoid comparison issues
-                            dt = datetime.fromisoformat(
-                                publish_time_str.replace("-05:00", "-0500")
-                            )
-                            # Convert to naive datetime by replacing with local time
-                            published_date = datetime(
-                                dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second
-                            )
-                        except (ValueError, TypeError):
-                            # If we can't parse the date, just use current time
-                            published_date = datetime.now()
-
-                    # Get URL
-                    url = None
-                    if "links" in article and "self" in article["links"]:
-                        url = f"https://seekingalpha.com{article['links']['self']}"
-
-                    # Create article object
-                    articles.append(
-                        NewsArticle(
-                            source="SeekingAlpha",
-                            title=title,
-                            url=url,
-                            content=title,  # Just use title as content
-                            published_at=published_date,
-                        )
-                    )
+            items = self._refresh_list_items(kind, ticker, endpoint_template, cached)
+        except Exception as e:
+            if not (cached and cached["items"]):
+                raise
+            # Serve the stale list rather than nothing; the next call retries
+            logger.warning(
+                f"Error refreshing Seeking Alpha {kind} list for {ticker}, "
+                f"using cached items: {str(e)}"
+            )
+            return cached["items"]
+
+        self.list_cache.set(key, {"fetched_at": now, "items": items})
+        self.list_cache.save()
+        return items
+
+    def _refresh_list_items(
+        self,
+        kind: str,
+        ticker: str,
+        endpoint_template: str,
+        cached: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Fetch list items, merging a small first page into the cached list.
+
+        Args:
+            kind: List kind ("analysis" or "news")
+            ticker: Stock ticker symbol
+            endpoint_template: Endpoint with {ticker} and {size} placeholders
+            cached: Stale cache entry for the list, if any
+
+        Returns:
+            Raw list items, newest first
+        """
+        if cached and cached["items"]:
+            endpoint = endpoint_template.format(
+                ticker=ticker.lower(), size=INCREMENTAL_PAGE_SIZE
+            )
+            logger.info(f"Requesting new Seeking Alpha {kind} items: {endpoint}")
+            page = self._request(endpoint).get("data") or []
+            seen_ids = {item.get("id") for item in cached["items"]}
+            last_seen = max(
+                item["attributes"].get("publishOn") or "" for item in cached["items"]
+            )
+            new_items = [
+                item
+                for item in page
+                if item.get("id") not in seen_ids
+                and (item.get("attributes", {}).get("publishOn") or "") >= last_seen
+            ]
+            if len(new_items) < len(page) or not page:
+                items = [self._compact_item(item) for item in new_items]
+                return (items + cached["items"])[:LIST_SIZE]
+
+        endpoint = endpoint_template.format(ticker=ticker.lower(), size=LIST_SIZE)
+        logger.info(f"Requesting Seeking Alpha {kind}: {endpoint}")
+        page = self._request(endpoint).get("data") or []
+        return [self._compact_item(item) for item in page]
+
+    def _compact_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the fields of a list item that are used downstream.
+
+        Args:
+            item: Raw list item
+
+        Returns:
+            Compact list item with the same structure
+        """
+        attributes = item.get("attributes", {})
+        # Missing fields stay missing, so the parser's defaults still apply
+        compact = {
+            "id": item.get("id"),
+            "attributes": {
+                field: attributes[field]
+                for field in ("title", "publishOn")
+                if field in attributes
+            },
+        }
+        if "links" in item and "self" in item["links"]:
+            compact["links"] = {"self": item["links"]["self"]}
+        return compact
+
+    def _get_analysis_articles(self, ticker: str) -> List[ArticleRecord]:
+        """Get analysis articles from Seeking Alpha API.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            List of ArticleRecord objects containing analysis articles
+        """
+        try:
+            items = self._get_list_items(
+                "analysis", ticker, "/analysis/v2/list?id={ticker}&size={size}&number=1"
+            )
+            return self._parse_articles({"data": items})
         except Exception as e:
             logger.error(
                 f"Error fetching Seeking Alpha analysis for {ticker}: {str(e)}"
             )
+            return []
 
-        return articles
-
-    def _get_news_articles(self, conn, headers, ticker: str) -> List[NewsArticle]:
+    def _get_news_articles(self, ticker: str) -> List[ArticleRecord]:
         """Get news articles from Seeking Alpha API.
 
         Args:
-            conn: HTTP connection
-            headers: HTTP headers
             ticker: Stock ticker symbol
 
         Returns:
-            List of NewsArticle objects containing news articles
+            List of ArticleRecord objects containing news articles
         """
-        articles = []
-        news_endpoint = f"/news/v2/list?id={ticker.lower()}&size=20"
-        logger.info(f"Requesting Seeking Alpha news: {news_endpoint}")
-
         try:
-            conn.request("GET", news_endpoint, headers=headers)
-            news_res = conn.getresponse()
-            news_data = json.loads(news_res.read().decode("utf-8"))
-
-            # Process news articles
-            if "data" in news_data and news_data["data"]:
-                for news_item in news_data["data"]:
-                    # Extract basic article info without getting details
-                    news_attributes = news_item.get("attributes", {})
-                    title = news_attributes.get("title", "Unknown Title")
-
-                    # Get publish time
-                    publish_time_str = news_attributes.get("publishOn")
-                    published_date = None
-                    if publish_time_str:
-                        try:
-                            # Parse the date and make it timezone-naive to avoid comparison issues
-                            dt = datetime.fromisoformat(
-                                publish_time_str.replace("-05:00", "-0500")
-                            )
-                            # Convert to naive datetime by replacing with local time
-                            published_date = datetime(
-                                dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second
-                            )
-                        except (ValueError, TypeError):
-                            # If we can't parse the date, just use current time
-                            published_date = datetime.now()
-
-                    # Get URL
-                    url = None
-                    if "links" in news_item and "self" in news_item["links"]:
-                        url = f"https://seekingalpha.com{news_item['links']['self']}"
-
-                    # Create article object
-                    articles.append(
-                        NewsArticle(
-                            source="SeekingAlpha",
-                            title=title,
-                            url=url,
-                            content=title,  # Just use title as content
-                            published_at=published_date,
-                        )
-                    )
-            else:
+            items = self._get_list_items(
+                "news", ticker, "/news/v2/list?id={ticker}&size={size}"
+            )
+            articles = self._parse_articles({"data": items})
+            if not articles:
                 logger.info(f"No news articles found for {ticker}")
+            return articles
         except Exception as e:
             logger.error(f"Error fetching Seeking Alpha news for {ticker}: {str(e)}")
-
-        return articles
+            return []
 
     def _summarize_titles(self, ticker: str, titles: List[str]) -> str:
         """Summarize article titles using OpenAI.
@@ -271,33 +471,25 @@ class SeekingAlphaClient:
             return "Recent Seeking Alpha headlines:\n- " + "\n- ".join(titles[:5])
 
         try:
-            # Create prompt for OpenAI
-            prompt = f"""
-            Here are recent Seeking Alpha article titles about {ticker} stock:
-            
-            {chr(10).join(["- " + title for title in titles])}
-            
-            Based on these headlines, provide a single concise sentence that summarizes 
-            the overall sentiment and key themes in Seeking Alpha's coverage of {ticker}.
-            """
+            headlines = "\n".join(f"- {title}" for title in titles)
+            messages = build_messages(
+                "headline_condensation",
+                f"Ticker: {ticker}\n\nRecent Seeking Alpha headlines:\n{headlines}",
+            )
+
+            route = self.openai_client.route("headline_condensation", headlines)
 
             # Call OpenAI API
-            response = self.openai_client.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a financial analyst specializing in stock market analysis. Provide concise, insightful summaries of financial news headlines.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            summary = self.openai_client.chat_completion(
+                model=route.model,
+                messages=messages,
                 temperature=0.3,
-                max_tokens=100,
+                max_tokens=route.max_tokens,
+                call_type="headline_condensation",
+                tickers=(ticker,),
+                source="seeking_alpha",
             )
 
-            # Extract and return the summary
-            summary = response.choices[0].message.content.strip()
-
             # Add the titles as reference
             full_content = f"{summary}\n\nRecent headlines:\n" + "\n".join(
                 [f"- {title}" for title in titles[:10]]
@@ -0,0 +1,317 @@
+"""
+Per-run accounting and budgeting of OpenAI usage.
+
+This module records the tokens, latency, model and estimated cost of every
+OpenAI call, tagged by ticker, source and call type, and enforces per-run and
+per-ticker token budgets: calls are downgraded to the small model once a budget
+is mostly used and refused once it is exhausted (callers then fall back to the
+local summarizer). A report of the run's usage is produced at the end.
+"""
+
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger("news_agent")
+
+# Token budgets (prompt plus completion tokens) of a run and of each ticker;
+# 0 means unlimited
+RUN_TOKEN_BUDGET = int(os.environ.get("OPENAI_RUN_TOKEN_BUDGET", "0"))
+TICKER_TOKEN_BUDGET = int(os.environ.get("OPENAI_TICKER_TOKEN_BUDGET", "0"))
+
+# Fraction of a budget after which calls are downgraded to the small model
+BUDGET_DOWNGRADE_RATIO = float(os.environ.get("OPENAI_BUDGET_DOWNGRADE_RATIO", "0.8"))
+
+
+class TokenBudgetExceeded(RuntimeError):
+    """Raised for calls refused because a token budget is exhausted."""
+
+
+class UsageRecord(NamedTuple):
+    """Usage of a single OpenAI call."""
+
+    call_type: str
+    model: str
+    tickers: Tuple[str, ...]
+    source: Optional[str]
+    served_from: str  # "api", "batch" or "cache"
+    prompt_tokens: int
+    cached_tokens: int
+    completion_tokens: int
+    latency_seconds: float
+    cost_usd: float
+
+    @property
+    def tokens(self) -> int:
+        """Prompt plus completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+
+def _empty_totals() -> Dict[str, Any]:
+    """Zeroed usage totals."""
+    return {
+        "calls": 0,
+        "cache_hits": 0,
+        "prompt_tokens": 0,
+        "cached_tokens": 0,
+        "completion_tokens": 0,
+        "latency_seconds": 0.0,
+        "max_latency_seconds": 0.0,
+        "cost_usd": 0.0,
+    }
+
+
+def _add(totals: Dict[str, Any], record: UsageRecord, share: float = 1.0) -> None:
+    """Add (a share of) a record to usage totals."""
+    if record.served_from == "cache":
+        totals["cache_hits"] += 1
+        return
+    totals["calls"] += 1
+    totals["prompt_tokens"] += round(record.prompt_tokens * share)
+    totals["cached_tokens"] += round(record.cached_tokens * share)
+    totals["completion_tokens"] += round(record.completion_tokens * share)
+    totals["latency_seconds"] += record.latency_seconds * share
+    totals["max_latency_seconds"] = max(
+        totals["max_latency_seconds"], record.latency_seconds
+    )
+    totals["cost_usd"] += record.cost_usd * share
+
+
+def _rounded(totals: Dict[str, Any]) -> Dict[str, Any]:
+    """Round usage totals for reporting."""
+    totals = dict(totals)
+    totals["latency_seconds"] = round(totals["latency_seconds"], 3)
+    totals["max_latency_seconds"] = round(totals["max_latency_seconds"], 3)
+    totals["cost_usd"] = round(totals["cost_usd"], 6)
+    return totals
+
+
+class UsageLedger:
+    """Thread-safe record of a run's OpenAI calls."""
+
+    def __init__(self):
+        """Initialize an empty ledger."""
+        self._lock = threading.Lock()
+        self.records: List[UsageRecord] = []
+        self.run_tokens = 0
+        self.ticker_tokens: Dict[str, float] = defaultdict(float)
+        # Estimated tokens of calls in flight, counted until their usage is added
+        self.reserved_run_tokens = 0
+        self.reserved_ticker_tokens: Dict[str, float] = defaultdict(float)
+
+    def start_run(self) -> None:
+        """Forget the usage of previous runs."""
+        with self._lock:
+            self.records = []
+            self.run_tokens = 0
+            self.ticker_tokens = defaultdict(float)
+            self.reserved_run_tokens = 0
+            self.reserved_ticker_tokens = defaultdict(float)
+
+    def add(self, record: UsageRecord) -> None:
+        """Record a call.
+
+        Args:
+            record: Usage of the call; tokens of multi-ticker calls are split
+                evenly between their tickers
+        """
+        with self._lock:
+            self.records.append(record)
+            self.run_tokens += record.tokens
+            for ticker in record.tickers:
+                self.ticker_tokens[ticker] += record.tokens / len(record.tickers)
+
+    def reserve(self, tickers: Sequence[str], tokens: int) -> None:
+        """Count the estimated tokens of a call in flight against the budgets.
+
+        Args:
+            tickers: Tickers the call is for (tokens are split evenly)
+            tokens: Estimated tokens of the call
+        """
+        self._adjust_reserved(tickers, tokens)
+
+    def release(self, tickers: Sequence[str], tokens: int) -> None:
+        """Stop counting a reservation, once the call is done or served otherwise.
+
+        Args:
+            tickers: Tickers the reservation was made for
+            tokens: Tokens that were reserved
+        """
+        self._adjust_reserved(tickers, -tokens)
+
+    def _adjust_reserved(self, tickers: Sequence[str], tokens: int) -> None:
+        """Add (or remove) reserved tokens."""
+        with self._lock:
+            self.reserved_run_tokens += tokens
+            for ticker in tickers:
+                self.reserved_ticker_tokens[ticker] += tokens / len(tickers)
+
+    def tokens_used(self, tickers: Iterable[str] = ()) -> Tuple[int, float]:
+        """Get the tokens used by the run and by the most expensive of some tickers.
+
+        Tokens reserved by calls in flight count as used.
+
+        Args:
+            tickers: Tickers to look up
+
+        Returns:
+            Run tokens and the largest token count among the tickers
+        """
+        with self._lock:
+            ticker_tokens = max(
+                (
+                    self.ticker_tokens.get(ticker, 0.0)
+                    + self.reserved_ticker_tokens.get(ticker, 0.0)
+                    for ticker in tickers
+                ),
+                default=0.0,
+            )
+            return self.run_tokens + self.reserved_run_tokens, ticker_tokens
+
+    def _group(self, key) -> Dict[str, Dict[str, Any]]:
+        """Aggregate records into usage totals per group."""
+        with self._lock:
+            records = list(self.records)
+        groups: Dict[str, Dict[str, Any]] = defaultdict(_empty_totals)
+        for record in records:
+            for name, share in key(record):
+                _add(groups[name], record, share)
+        return {name: _rounded(totals) for name, totals in groups.items()}
+
+    def totals(self) -> Dict[str, Any]:
+        """Get the run's usage totals, including the provider-side cached ratio.
+
+        Returns:
+            Dictionary of call, token, latency and cost totals
+        """
+        totals = self._group(lambda record: [("run", 1.0)]).get("run")
+        totals = totals or _rounded(_empty_totals())
+        totals["cached_ratio"] = (
+            round(totals["cached_tokens"] / totals["prompt_tokens"], 3)
+            if totals["prompt_tokens"]
+            else 0.0
+        )
+        return totals
+
+    def by_route(self) -> Dict[str, Dict[str, Any]]:
+        """Get usage totals per "call_type:model" route."""
+        return self._group(
+            lambda record: [(f"{record.call_type}:{record.model}", 1.0)]
+        )
+
+    def by_ticker(self) -> Dict[str, Dict[str, Any]]:
+        """Get usage totals per ticker (multi-ticker calls are split evenly)."""
+        return self._group(
+            lambda record: [
+                (ticker, 1.0 / len(record.tickers)) for ticker in record.tickers
+            ]
+            or [("(untagged)", 1.0)]
+        )
+
+    def by_source(self) -> Dict[str, Dict[str, Any]]:
+        """Get usage totals per content source."""
+        return self._group(lambda record: [(record.source or "(none)", 1.0)])
+
+    def report(self) -> str:
+        """Format the run's usage as a table per ticker with totals.
+
+        Returns:
+            Multi-line report
+        """
+        header = (
+            f"{'ticker':<12}{'calls':>7}{'cache':>7}{'prompt':>10}{'cached':>10}"
+            f"{'compl.':>9}{'latency s':>11}{'cost $':>11}"
+        )
+        lines = ["OpenAI usage report", header, "-" * len(header)]
+        rows = sorted(self.by_ticker().items()) + [("TOTAL", self.totals())]
+        for name, totals in rows:
+            if name == "TOTAL":
+                lines.append("-" * len(header))
+            lines.append(
+                f"{name:<12}{totals['calls']:>7}{totals['cache_hits']:>7}"
+                f"{totals['prompt_tokens']:>10}{totals['cached_tokens']:>10}"
+                f"{totals['completion_tokens']:>9}"
+                f"{totals['latency_seconds']:>11.2f}{totals['cost_usd']:>11.4f}"
+            )
+        return "\n".join(lines)
+
+
+class BudgetGovernor:
+    """Downgrades or refuses calls once the run's token budgets run low."""
+
+    def __init__(
+        self,
+        ledger: UsageLedger,
+        run_token_budget: int = RUN_TOKEN_BUDGET,
+        ticker_token_budget: int = TICKER_TOKEN_BUDGET,
+        downgrade_ratio: float = BUDGET_DOWNGRADE_RATIO,
+    ):
+        """Initialize the governor.
+
+        Args:
+            ledger: Ledger holding the run's usage
+            run_token_budget: Tokens the run may use (0 for unlimited)
+            ticker_token_budget: Tokens each ticker may use (0 for unlimited)
+            downgrade_ratio: Fraction of a budget after which calls are
+                downgraded to the small model
+        """
+        self.ledger = ledger
+        self.run_token_budget = run_token_budget
+        self.ticker_token_budget = ticker_token_budget
+        self.downgrade_ratio = downgrade_ratio
+        self._lock = threading.Lock()
+        self.metrics = {"downgraded": 0, "stopped": 0}
+
+    def check(self, tickers: Sequence[str] = (), reserve_tokens: int = 0) -> str:
+        """Decide what to do with a call, given the budgets used so far.
+
+        Budgets are checked against completed calls plus the reservations of
+        calls in flight. Calls that aren't refused reserve their estimated tokens
+        in the same step, so calls submitted together (e.g. into one Batch API
+        batch, whose usage only arrives at the end) can't all pass the check;
+        the caller must release the reservation once the call is done.
+
+        Args:
+            tickers: Tickers the call is for
+            reserve_tokens: Estimated tokens of the call, reserved unless refused
+
+        Returns:
+            "allow", "downgrade" or "stop"
+        """
+        with self._lock:
+            run_tokens, ticker_tokens = self.ledger.tokens_used(tickers)
+            used = max(
+                run_tokens / self.run_token_budget if self.run_token_budget else 0.0,
+                ticker_tokens / self.ticker_token_budget
+                if self.ticker_token_budget
+                else 0.0,
+            )
+            if used >= 1.0:
+                self.metrics["stopped"] += 1
+                return "stop"
+            if reserve_tokens:
+                self.ledger.reserve(tickers, reserve_tokens)
+            if used >= self.downgrade_ratio:
+                self.metrics["downgraded"] += 1
+                return "downgrade"
+            return "allow"
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get budgets and counts of downgraded and refused calls.
+
+        Returns:
+            Dictionary of governor settings and counters
+        """
+        with self._lock:
+            return {
+                "run_token_budget": self.run_token_budget,
+                "ticker_token_budget": self.ticker_token_budget,
+                **self.metrics,
+            }
+
+    def reset(self) -> None:
+        """Reset the counters for a new run."""
+        with self._lock:
+            self.metrics = {"downgraded": 0, "stopped": 0}
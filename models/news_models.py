@@ -2,11 +2,23 @@
 Data models for the news agent.
 
 This module defines the data models used throughout the news agent application.
+Articles are held internally as compact ArticleRecord objects and only turned
+into pydantic NewsArticle models at the API boundary.
 """
 
+import logging
+import sys
 from typing import Dict, List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from utils.blob_store import (
+    ARTICLE_BLOB_MIN_CHARS,
+    ARTICLE_BLOB_STORE_ENABLED,
+    BlobStore,
+)
+
+logger = logging.getLogger("news_agent")
 
 
 class NewsArticle(BaseModel):
@@ -24,6 +36,144 @@ class NewsArticle(BaseModel):
     subreddit: Optional[str] = Field(None, description="Subreddit name if from Reddit")
 
 
+class ArticleRecord:
+    """Compact internal representation of a news article.
+
+    Has the same attributes as NewsArticle, without validation or a per-instance
+    dict. Source and subreddit names are interned, so the thousands of records
+    of a run share a handful of strings, and the publication date is stored as
+    epoch seconds. Content of ARTICLE_BLOB_MIN_CHARS or more is kept in the
+    shared BlobStore and loaded on access, so records only hold its digest.
+    """
+
+    __slots__ = (
+        "source",
+        "title",
+        "url",
+        "_content",
+        "content_ref",
+        "published_ts",
+        "subreddit",
+    )
+
+    def __init__(
+        self,
+        source: str,
+        title: str,
+        url: Optional[str] = None,
+        content: Optional[str] = None,
+        published_at: Optional[datetime] = None,
+        subreddit: Optional[str] = None,
+        inline: bool = False,
+    ):
+        """Initialize the record.
+
+        Args:
+            source: Source of the news (SeekingAlpha, Reddit, Google)
+            title: Title of the article or post
+            url: URL to the article
+            content: Content or summary of the article
+            published_at: Publication date
+            subreddit: Subreddit name if from Reddit
+            inline: Keep the content in memory until store_content() is called
+                (for candidates that may still be dropped or extended)
+        """
+        self.source = sys.intern(source)
+        self.title = title
+        self.url = url
+        self.set_content(content, store=not inline)
+        self.published_ts = (
+            int(published_at.timestamp()) if published_at is not None else None
+        )
+        self.subreddit = sys.intern(subreddit) if subreddit is not None else None
+
+    @property
+    def published_at(self) -> Optional[datetime]:
+        """Publication date (local time, to the second)."""
+        if self.published_ts is None:
+            return None
+        return datetime.fromtimestamp(self.published_ts)
+
+    @property
+    def content(self) -> Optional[str]:
+        """Content or summary of the article, loaded from the blob store if needed."""
+        if self.content_ref is None:
+            return self._content
+        try:
+            return BlobStore.shared().get(self.content_ref)
+        except (KeyError, OSError, ValueError) as e:
+            logger.warning(f"Could not load content of {self!r}: {str(e)}")
+            return None
+
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        self.set_content(value)
+
+    def set_content(self, value: Optional[str], store: bool = True) -> None:
+        """Set the content, keeping long content in the blob store.
+
+        Args:
+            value: Content or summary of the article
+            store: Whether long content goes to the blob store right away (if
+                not, it stays in memory until store_content() is called)
+        """
+        self._content = value
+        self.content_ref = None
+        if (
+            store
+            and ARTICLE_BLOB_STORE_ENABLED
+            and value
+            and len(value) >= ARTICLE_BLOB_MIN_CHARS
+        ):
+            try:
+                self.content_ref = BlobStore.shared().put(value)
+                self._content = None
+            except OSError as e:
+                logger.warning(f"Could not store content of {self!r}: {str(e)}")
+
+    def store_content(self) -> None:
+        """Move content held in memory to the blob store, if it is long enough."""
+        if self.content_ref is None:
+            self.set_content(self._content)
+
+    def __repr__(self) -> str:
+        return f"ArticleRecord(source={self.source!r}, title={self.title!r})"
+
+    def to_model(self) -> NewsArticle:
+        """Materialize the record as a validated NewsArticle.
+
+        Returns:
+            NewsArticle with the record's fields
+        """
+        return NewsArticle(
+            source=self.source,
+            title=self.title,
+            url=self.url,
+            content=self.content,
+            published_at=self.published_at,
+            subreddit=self.subreddit,
+        )
+
+    @classmethod
+    def from_model(cls, article: NewsArticle) -> "ArticleRecord":
+        """Build a record from a NewsArticle.
+
+        Args:
+            article: NewsArticle object
+
+        Returns:
+            ArticleRecord with the article's fields
+        """
+        return cls(
+            source=article.source,
+            title=article.title,
+            url=article.url,
+            content=article.content,
+            published_at=article.published_at,
+            subreddit=article.subreddit,
+        )
+
+
 class StockNews(BaseModel):
     """Model representing all news for a specific stock."""
 
@@ -39,6 +189,20 @@ class StockNews(BaseModel):
     summary_reddit: Dict[str, str] = Field(
         default_factory=dict, description="Summaries from Reddit keyed by subreddit"
     )
-    articles: List[NewsArticle] = Field(
+    summary_events: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Summaries of events shared with other movers keyed by headline",
+    )
+    articles: List[ArticleRecord] = Field(
         default_factory=list, description="List of all news articles"
     )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def article_models(self) -> List[NewsArticle]:
+        """Materialize the articles as validated NewsArticle models.
+
+        Returns:
+            List of NewsArticle objects
+        """
+        return [article.to_model() for article in self.articles]
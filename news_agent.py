@@ -99,11 +99,45 @@ def filter_duplicate_tickers(watchlist_data):
     return filtered_data
 
 
-def main(use_mock_data=False):
+def print_result_header(ticker, price_change_percent):
+    """Print the console banner of a stock's news summary.
+
+    Args:
+        ticker: Stock ticker symbol
+        price_change_percent: Price change percentage
+    """
+    print("\n" + "=" * 80)
+    print(f"NEWS FOR {ticker} ({price_change_percent}%)")
+    print("=" * 80)
+
+
+class LiveSummaryPrinter:
+    """Prints each stock's bullet points to the console as they stream in."""
+
+    def __init__(self):
+        """Initialize the printer."""
+        self.printed_tickers = set()
+
+    def __call__(self, stock_news, chunk):
+        """Print a streamed chunk, preceded by the stock's banner on first use.
+
+        Args:
+            stock_news: StockNews object the chunk belongs to
+            chunk: Streamed text chunk
+        """
+        if stock_news.ticker not in self.printed_tickers:
+            self.printed_tickers.add(stock_news.ticker)
+            print_result_header(stock_news.ticker, stock_news.price_change_percent)
+            print("KEY FACTORS DRIVING PRICE CHANGE:")
+        print(chunk, end="", flush=True)
+
+
+def main(use_mock_data=False, stream_output=True):
     """Main function to run the News Agent.
 
     Args:
         use_mock_data: If True, use mock data instead of calling IBKR API
+        stream_output: If True, print bullet points live as they are generated
 
     Returns:
         List of dictionaries containing stock information and news summaries
@@ -136,13 +170,19 @@ def main(use_mock_data=False):
 
         # Create and run news service
         news_service = NewsService()
-        news_results = news_service.process_watchlist_results(filtered_watchlist_data)
-
-        # Print the results
+        printer = LiveSummaryPrinter() if stream_output else None
+        news_results = news_service.process_watchlist_results(
+            filtered_watchlist_data, on_summary_token=printer
+        )
+
+        # Print the results that weren't already streamed to the console
+        streamed = printer.printed_tickers if printer is not None else set()
+        if streamed:
+            print()
         for result in news_results:
-            print("\n" + "=" * 80)
-            print(f"NEWS FOR {result['ticker']} ({result['price_change_percent']}%)")
-            print("=" * 80)
+            if result["ticker"] in streamed:
+                continue
+            print_result_header(result["ticker"], result["price_change_percent"])
             print(result["news_summary"])
 
         # Return the results for further processing (e.g. database storage)
@@ -0,0 +1,181 @@
+"""
+Cross-ticker event clustering.
+
+This module groups news articles that concern several of the run's movers at
+once (sector news, macro events) into events, so each event can be summarized
+once and shared by every affected ticker instead of being summarized again for
+each of them.
+"""
+
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Set
+
+from models.news_models import ArticleRecord, StockNews
+from utils.mention_extractor import MentionExtractor
+from utils.relevance import tokenize
+
+logger = logging.getLogger("news_agent")
+
+# Cluster shared news into events summarized once for all affected tickers
+EVENT_CLUSTERING_ENABLED = (
+    os.environ.get("EVENT_CLUSTERING_ENABLED", "true").lower() == "true"
+)
+
+# Minimum number of movers an article (and an event) must concern
+EVENT_MIN_TICKERS = int(os.environ.get("EVENT_MIN_TICKERS", "2"))
+
+# Minimum title word overlap (Jaccard) for an article to join an existing event
+EVENT_TITLE_SIMILARITY = float(os.environ.get("EVENT_TITLE_SIMILARITY", "0.3"))
+
+# Words ignored when comparing titles
+TITLE_STOPWORDS = {
+    "a",
+    "an",
+    "and",
+    "are",
+    "as",
+    "at",
+    "by",
+    "for",
+    "from",
+    "in",
+    "is",
+    "it",
+    "its",
+    "of",
+    "on",
+    "or",
+    "the",
+    "to",
+    "with",
+}
+
+
+def article_key(article: ArticleRecord) -> str:
+    """Identify an article across the lists of different tickers.
+
+    Args:
+        article: ArticleRecord object
+
+    Returns:
+        The article's URL, or its normalized title if it has none
+    """
+    return article.url or article.title.strip().lower()
+
+
+def _title_words(title: str) -> Set[str]:
+    """Get the significant words of a title."""
+    return {word for word in tokenize(title) if word not in TITLE_STOPWORDS}
+
+
+def _similarity(first: Set[str], second: Set[str]) -> float:
+    """Jaccard similarity of two word sets."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class EventCluster:
+    """Articles about one event and the movers it concerns."""
+
+    __slots__ = ("articles", "article_keys", "tickers", "title_words")
+
+    def __init__(self):
+        """Initialize an empty event."""
+        self.articles: List[ArticleRecord] = []
+        self.article_keys: Set[str] = set()
+        self.tickers: Set[str] = set()
+        self.title_words: Set[str] = set()
+
+    @property
+    def label(self) -> str:
+        """Short label of the event (its first article's title)."""
+        return self.articles[0].title if self.articles else ""
+
+    def add(self, key: str, article: ArticleRecord, tickers: Iterable[str]) -> None:
+        """Add an article to the event.
+
+        Args:
+            key: Article key (see article_key)
+            article: ArticleRecord object
+            tickers: Movers the article concerns
+        """
+        self.articles.append(article)
+        self.article_keys.add(key)
+        self.tickers.update(tickers)
+        self.title_words |= _title_words(article.title)
+
+
+def cluster_shared_events(
+    stock_news_list: List[StockNews],
+    extractor: Optional[MentionExtractor] = None,
+    min_tickers: int = EVENT_MIN_TICKERS,
+    title_similarity: float = EVENT_TITLE_SIMILARITY,
+) -> List[EventCluster]:
+    """Group news articles concerning several movers into events.
+
+    An article concerns every mover it mentions, plus every mover whose news
+    list it appeared in when it appeared in several. Articles concerning at
+    least min_tickers movers are clustered greedily by title similarity. Reddit
+    posts are left out: they are discussion rather than event coverage, and are
+    summarized per subreddit.
+
+    Args:
+        stock_news_list: Collected (not yet summarized) news of the run's movers
+        extractor: Mention extractor for the movers (built from them if omitted)
+        min_tickers: Minimum number of movers an article must concern
+        title_similarity: Minimum title similarity for joining an existing event
+
+    Returns:
+        List of events concerning at least min_tickers movers
+    """
+    if extractor is None:
+        extractor = MentionExtractor(
+            {
+                stock_news.ticker: stock_news.company_name
+                for stock_news in stock_news_list
+            }
+        )
+    movers = {stock_news.ticker for stock_news in stock_news_list}
+
+    # Which movers each unique article mentions, and whose lists it appeared in
+    articles: Dict[str, ArticleRecord] = {}
+    mentioned: Dict[str, Set[str]] = {}
+    listed: Dict[str, Set[str]] = {}
+    for stock_news in stock_news_list:
+        for article in stock_news.articles:
+            if article.source == "Reddit":
+                continue
+            key = article_key(article)
+            if key not in articles:
+                articles[key] = article
+                text = f"{article.title}\n{article.content or ''}"
+                mentioned[key] = set(extractor.extract(text)) & movers
+                listed[key] = set()
+            listed[key].add(stock_news.ticker)
+
+    events: List[EventCluster] = []
+    for key, article in articles.items():
+        tickers = mentioned[key]
+        if len(listed[key]) > 1:
+            tickers = tickers | listed[key]
+        if len(tickers) < min_tickers:
+            continue
+        words = _title_words(article.title)
+        best, best_similarity = None, title_similarity
+        for event in events:
+            similarity = _similarity(words, event.title_words)
+            if similarity >= best_similarity:
+                best, best_similarity = event, similarity
+        if best is None:
+            best = EventCluster()
+            events.append(best)
+        best.add(key, article, tickers)
+
+    if events:
+        logger.info(
+            f"Clustered {sum(len(event.articles) for event in events)} shared articles "
+            f"into {len(events)} events"
+        )
+    return events
@@ -5,17 +5,30 @@ This module provides a service for retrieving and processing news about stocks
 from multiple sources, including Seeking Alpha, Google News, and Reddit.
 """
 
+import functools
 import logging
-from typing import Dict, List, Any, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 from models.news_models import StockNews
 from clients.seeking_alpha_client import SeekingAlphaClient
 from clients.google_news_client import GoogleNewsClient
 from clients.reddit_client import RedditClient
+from services.event_clustering import (
+    EVENT_CLUSTERING_ENABLED,
+    EventCluster,
+    article_key,
+    cluster_shared_events,
+)
 from services.summarization_service import SummarizationService
+from utils.blob_store import ARTICLE_BLOB_STORE_ENABLED, BlobStore
 
 logger = logging.getLogger("news_agent")
 
+# Stocks summarized concurrently, so their summary requests can be batched together
+SUMMARY_WORKERS = int(os.environ.get("NEWS_SUMMARY_WORKERS", "8"))
+
 
 class NewsService:
     """Service for retrieving and processing news about stocks."""
@@ -26,19 +39,53 @@ class NewsService:
         google_news_client: Optional[GoogleNewsClient] = None,
         reddit_client: Optional[RedditClient] = None,
         summarization_service: Optional[SummarizationService] = None,
+        cluster_events: bool = EVENT_CLUSTERING_ENABLED,
     ):
         """Initialize the news service.
 
+        Clients that are not provided are resolved lazily to the process-wide
+        shared instances, so nothing is constructed until a source is used.
+
         Args:
             seeking_alpha_client: Seeking Alpha client for retrieving news from Seeking Alpha
             google_news_client: Google News client for retrieving news from Google
             reddit_client: Reddit client for retrieving news from relevant subreddits
             summarization_service: Summarization service for generating summaries
+            cluster_events: Summarize news shared by several movers once per event
         """
-        self.seeking_alpha_client = seeking_alpha_client or SeekingAlphaClient()
-        self.google_news_client = google_news_client or GoogleNewsClient()
-        self.reddit_client = reddit_client or RedditClient()
-        self.summarization_service = summarization_service or SummarizationService()
+        self._seeking_alpha_client = seeking_alpha_client
+        self._google_news_client = google_news_client
+        self._reddit_client = reddit_client
+        self._summarization_service = summarization_service
+        self.cluster_events = cluster_events
+
+    @property
+    def seeking_alpha_client(self) -> SeekingAlphaClient:
+        """Get the Seeking Alpha client, falling back to the shared instance."""
+        if self._seeking_alpha_client is None:
+            self._seeking_alpha_client = SeekingAlphaClient.shared()
+        return self._seeking_alpha_client
+
+    @property
+    def google_news_client(self) -> GoogleNewsClient:
+        """Get the Google News client, falling back to the shared instance."""
+        if self._google_news_client is None:
+            self._google_news_client = GoogleNewsClient.shared()
+        return self._google_news_client
+
+    @property
+    def reddit_client(self) -> RedditClient:
+        """Get the Reddit client, falling back to the shared instance."""
+        if self._reddit_client is None:
+            self._reddit_client = RedditClient.shared()
+        return self._reddit_client
+
+    @property
+    def summarization_service(self) -> SummarizationService:
+        """Get the summarization service, creating it on first use."""
+        if self._summarization_service is None:
+            self._summarization_service = SummarizationService()
+        return self._summarization_service
 
     def process_stock(
         self,
@@ -56,6 +103,25 @@ class NewsService:
         Returns:
             StockNews object with all collected news and summaries
         """
+        stock_news = self.collect_stock_news(ticker, company_name, price_change_percent)
+        return self.summarize_stock_news(stock_news)
+
+    def collect_stock_news(
+        self,
+        ticker: str,
+        company_name: Optional[str] = None,
+        price_change_percent: Optional[float] = None,
+    ) -> StockNews:
+        """Collect news about a stock from all sources, without summarizing it.
+
+        Args:
+            ticker: Stock ticker symbol
+            company_name: Company name (optional)
+            price_change_percent: Price change percentage (optional)
+
+        Returns:
+            StockNews object with all collected articles
+        """
         logger.info(
             f"Processing news for {ticker} ({company_name if company_name else 'Unknown'})"
         )
@@ -76,36 +142,99 @@ class NewsService:
         seeking_alpha_articles = self.seeking_alpha_client.get_news(ticker)
         google_articles = self.google_news_client.get_news(search_query)
         # Using search_query for Reddit to get more relevant results
-        reddit_articles = self.reddit_client.get_posts(ticker, search_query)
+        reddit_articles = self.reddit_client.get_posts(
+            ticker, search_query, company_name=company_name
+        )
 
         # Add all articles to the stock news
         stock_news.articles.extend(seeking_alpha_articles)
         stock_news.articles.extend(google_articles)
         stock_news.articles.extend(reddit_articles)
+        return stock_news
+
+    def summarize_stock_news(
+        self, stock_news: StockNews, exclude: Optional[Set[str]] = None
+    ) -> StockNews:
+        """Summarize the collected news of a stock per source.
+
+        Args:
+            stock_news: StockNews object with collected articles, updated in place
+            exclude: Keys of articles already covered by shared event summaries
 
-        # Create summaries
-        stock_news.summary_seeking_alpha = (
-            self.summarization_service.summarize_seeking_alpha(
-                seeking_alpha_articles, ticker, price_change_percent
+        Returns:
+            The same StockNews object with its summaries set
+        """
+        for job in self._source_summary_jobs(stock_news, exclude):
+            job()
+        logger.info(f"Completed news processing for {stock_news.ticker}")
+        return stock_news
+
+    def _source_summary_jobs(
+        self, stock_news: StockNews, exclude: Optional[Set[str]] = None
+    ) -> List[Callable[[], None]]:
+        """Build the jobs summarizing a stock's news, one per source.
+
+        The jobs are independent of each other, so they can run concurrently
+        (and have their requests batched together).
+
+        Args:
+            stock_news: StockNews object with collected articles, updated in place
+            exclude: Keys of articles already covered by shared event summaries
+
+        Returns:
+            List of callables, each setting one of the stock's source summaries
+        """
+        ticker = stock_news.ticker
+        price_change_percent = stock_news.price_change_percent
+        company_name = stock_news.company_name
+        articles = [
+            article
+            for article in stock_news.articles
+            if not exclude or article_key(article) not in exclude
+        ]
+        seeking_alpha_articles = [
+            article for article in articles if article.source == "SeekingAlpha"
+        ]
+        google_articles = [
+            article for article in articles if article.source.startswith("Google News")
+        ]
+        reddit_articles = [
+            article for article in articles if article.source == "Reddit"
+        ]
+
+        def summarize_seeking_alpha() -> None:
+            stock_news.summary_seeking_alpha = (
+                self.summarization_service.summarize_seeking_alpha(
+                    seeking_alpha_articles, ticker, price_change_percent, company_name
+                )
             )
-        )
-        stock_news.summary_google = self.summarization_service.summarize_google_news(
-            google_articles, ticker, price_change_percent
-        )
-        stock_news.summary_reddit = (
-            self.summarization_service.summarize_reddit_by_subreddit(
-                reddit_articles, ticker, price_change_percent
+
+        def summarize_google() -> None:
+            stock_news.summary_google = (
+                self.summarization_service.summarize_google_news(
+                    google_articles, ticker, price_change_percent, company_name
+                )
             )
-        )
 
-        logger.info(f"Completed news processing for {ticker}")
-        return stock_news
+        def summarize_reddit() -> None:
+            stock_news.summary_reddit = (
+                self.summarization_service.summarize_reddit_by_subreddit(
+                    reddit_articles, ticker, price_change_percent, company_name
+                )
+            )
 
-    def format_final_summary(self, stock_news: StockNews) -> str:
+        return [summarize_seeking_alpha, summarize_google, summarize_reddit]
+
+    def format_final_summary(
+        self,
+        stock_news: StockNews,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """Format the final summary text.
 
         Args:
             stock_news: StockNews object with all summaries
+            on_token: Optional callback receiving the bullet points as they stream
 
         Returns:
             Formatted summary text with only the 3 bullet points
@@ -127,16 +256,16 @@ class NewsService:
 
         # Generate concise bullet points if price change is available
         if stock_news.price_change_percent is not None:
-            # Get the summarization service
-            summarization_service = SummarizationService()
-
             # Generate concise bullet points
-            bullet_points = summarization_service.generate_concise_bullet_points(
+            bullet_points = self.summarization_service.generate_concise_bullet_points(
                 stock_news.ticker,
                 stock_news.price_change_percent,
                 stock_news.summary_seeking_alpha,
                 stock_news.summary_google,
                 stock_news.summary_reddit,
+                on_token=on_token,
+                company_name=stock_news.company_name,
+                event_summaries=stock_news.summary_events,
             )
 
             # Add bullet points to summary
@@ -148,56 +277,308 @@ class NewsService:
         return "\n".join(summary)
 
     def process_watchlist_results(
-        self, results: Dict[str, List[Dict[str, Any]]]
+        self,
+        results: Dict[str, List[Dict[str, Any]]],
+        on_summary_token: Optional[Callable[[StockNews, str], None]] = None,
     ) -> List[Dict[str, Any]]:
         """Process watchlist results from IBKR agent to collect news for volatile stocks.
 
         Args:
             results: Dictionary of watchlist results from IBKR agent
+            on_summary_token: Optional callback receiving each stock's bullet points
+                as they stream; stocks are then finalized one at a time in order
+                (ignored in batch mode, where nothing is streamed)
 
         Returns:
             List of dictionaries containing stock information and news summaries
         """
         logger.info("Processing watchlist results from IBKR agent")
 
-        news_results = []
-
+        if not any(results.values()):
+            logger.info("No instruments to process")
+            return []
+
+        # Compile the Reddit mention extractor once for the whole watchlist universe
+        # and reset per-run Reddit statistics
+        universe = {
+            instrument.get("ticker"): instrument.get("name")
+            for instruments in results.values()
+            for instrument in instruments
+            if instrument.get("ticker")
+        }
+        self.reddit_client.start_run(universe)
+        self.summarization_service.openai_client.start_run()
+
+        entries: List[Tuple[str, Dict[str, Any]]] = []
         for watchlist_name, instruments in results.items():
             logger.info(f"Processing watchlist: {watchlist_name}")
 
             for instrument in instruments:
-                ticker = instrument.get("ticker")
-                name = instrument.get("name")
-                change_percent = instrument.get("change_percent")
-
-                if not ticker:
+                if not instrument.get("ticker"):
                     logger.warning(f"Skipping instrument without ticker: {instrument}")
                     continue
+                entries.append((watchlist_name, instrument))
+
+        # Collect news sequentially: Reddit requests are already paced by the
+        # ratelimit scheduler and per-run ingestion assumes one caller at a time.
+        # The biggest movers go first, so they are served before the Reddit
+        # ratelimit budget runs low; results keep the watchlist order
+        by_move = sorted(
+            range(len(entries)),
+            key=lambda index: abs(entries[index][1].get("change_percent") or 0.0),
+            reverse=True,
+        )
+        stock_news_by_entry: Dict[int, StockNews] = {}
+        for index in by_move:
+            instrument = entries[index][1]
+            stock_news_by_entry[index] = self.collect_stock_news(
+                instrument["ticker"],
+                instrument.get("name"),
+                instrument.get("change_percent"),
+            )
+        collected: List[Tuple[str, Dict[str, Any], StockNews]] = [
+            (watchlist_name, instrument, stock_news_by_entry[index])
+            for index, (watchlist_name, instrument) in enumerate(entries)
+        ]
+
+        stock_news_list = [stock_news for _, _, stock_news in collected]
+        batch_mode = self.summarization_service.batch_mode != "off"
+        if batch_mode:
+            on_summary_token = None
+
+        # News shared by several movers is summarized once per event; those
+        # articles are left out of the own summaries of the tickers in the event
+        events, event_article_keys = self._cluster_shared_events(stock_news_list)
+
+        # Event summaries and every stock's per-source summaries don't depend on
+        # each other, so they all run concurrently: the summarization service
+        # batches their requests across tickers, and in batch mode they form a
+        # single Batch API batch
+        jobs: List[Callable[[], Any]] = [
+            functools.partial(self._summarize_event, event, stock_news_list)
+            for event in events
+        ]
+        for stock_news in stock_news_list:
+            jobs.extend(
+                self._source_summary_jobs(
+                    stock_news, event_article_keys.get(stock_news.ticker)
+                )
+            )
+        summaries = self._run_summary_jobs(jobs)
+        self._attach_event_summaries(events, summaries[: len(events)], stock_news_list)
+        for stock_news in stock_news_list:
+            logger.info(f"Completed news processing for {stock_news.ticker}")
+
+        # The bullet points build on those summaries, so they take a second round
+        if on_summary_token is None:
+            news_results = self._run_summary_jobs(
+                [functools.partial(self._build_result, *entry) for entry in collected]
+            )
+
+        # Streamed bullet points are generated one stock at a time so the live
+        # output of different stocks doesn't interleave
+        else:
+            news_results = [
+                self._build_result(
+                    watchlist_name,
+                    instrument,
+                    stock_news,
+                    on_token=lambda chunk, stock_news=stock_news: on_summary_token(
+                        stock_news, chunk
+                    ),
+                )
+                for watchlist_name, instrument, stock_news in collected
+            ]
+
+        logger.info(
+            f"Reddit search yield by sort: {self.reddit_client.search_planner.get_stats()}"
+        )
+        logger.info(
+            f"Reddit ratelimit budget: {self.reddit_client.get_rate_limit_metrics()}"
+        )
+        logger.info(
+            f"Seeking Alpha RapidAPI quota: {self.seeking_alpha_client.get_quota()}"
+        )
+        logger.info(
+            f"LLM response cache: {self.summarization_service.openai_client.get_cache_metrics()}"
+        )
+        logger.info(
+            f"Summary prompt tokens by source: {self.summarization_service.get_token_usage()}"
+        )
+        logger.info(
+            f"Cross-ticker summary batching: {self.summarization_service.get_batch_metrics()}"
+        )
+        logger.info(
+            f"OpenAI dispatch budget: {self.summarization_service.openai_client.get_dispatch_metrics()}"
+        )
+        if batch_mode:
+            logger.info(
+                f"OpenAI Batch API: {self.summarization_service.get_batch_api_metrics()}"
+            )
+        logger.info(
+            f"Summarization backend: {self.summarization_service.get_backend_metrics()}"
+        )
+        logger.info(
+            f"LLM streaming latency: {self.summarization_service.openai_client.get_latency_metrics()}"
+        )
+        logger.info(
+            f"OpenAI token usage (prompt caching): {self.summarization_service.openai_client.get_usage_metrics()}"
+        )
+        logger.info(
+            f"OpenAI latency and cost by route: {self.summarization_service.openai_client.get_route_metrics()}"
+        )
+        logger.info(
+            f"OpenAI token budgets: {self.summarization_service.openai_client.get_budget_metrics()}"
+        )
+        logger.info(self.summarization_service.openai_client.get_usage_report())
+        if ARTICLE_BLOB_STORE_ENABLED:
+            logger.info(f"Article blob store: {BlobStore.shared().get_metrics()}")
+        logger.info(
+            f"Completed processing {len(news_results)} stocks from watchlist results"
+        )
+        return news_results
 
-                # Process the stock
-                stock_news = self.process_stock(ticker, name, change_percent)
+    def _summary_workers(self, jobs: int) -> int:
+        """Get the number of threads summarizing jobs concurrently.
 
-                # Format the summary
-                summary_text = self.format_final_summary(stock_news)
+        In batch mode every job gets its own thread, so all of their requests
+        end up in the same batch.
 
-                # Create result dictionary suitable for database storage
-                result = {
-                    "ticker": ticker,
-                    "company_name": name,
-                    "price_change_percent": change_percent,
-                    "news_summary": summary_text,
-                    "summary_seeking_alpha": stock_news.summary_seeking_alpha,
-                    "summary_google": stock_news.summary_google,
-                    "summary_reddit": stock_news.summary_reddit,
-                    "timestamp": datetime.now().isoformat(),
-                    "watchlist": watchlist_name,
-                }
+        Args:
+            jobs: Number of jobs to summarize
 
-                news_results.append(result)
+        Returns:
+            Number of worker threads
+        """
+        if self.summarization_service.batch_mode != "off":
+            return max(1, jobs)
+        return max(1, SUMMARY_WORKERS)
 
-                logger.info(f"Completed news summary for {ticker}")
+    def _build_result(
+        self,
+        watchlist_name: str,
+        instrument: Dict[str, Any],
+        stock_news: StockNews,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Format a summarized stock into a result dictionary.
 
-        logger.info(
-            f"Completed processing {len(news_results)} stocks from watchlist results"
+        Args:
+            watchlist_name: Name of the watchlist the instrument belongs to
+            instrument: Instrument dictionary from the IBKR agent
+            stock_news: StockNews object with its summaries set
+            on_token: Optional callback receiving the bullet points as they stream
+
+        Returns:
+            Result dictionary suitable for database storage
+        """
+        ticker = stock_news.ticker
+
+        # Format the summary
+        summary_text = self.format_final_summary(stock_news, on_token=on_token)
+
+        # Create result dictionary suitable for database storage
+        result = {
+            "ticker": ticker,
+            "company_name": instrument.get("name"),
+            "price_change_percent": instrument.get("change_percent"),
+            "news_summary": summary_text,
+            "summary_seeking_alpha": stock_news.summary_seeking_alpha,
+            "summary_google": stock_news.summary_google,
+            "summary_reddit": stock_news.summary_reddit,
+            "summary_events": stock_news.summary_events,
+            # Articles are validated as NewsArticle models on the way out
+            "articles": [
+                article.model_dump(mode="json")
+                for article in stock_news.article_models()
+            ],
+            "timestamp": datetime.now().isoformat(),
+            "watchlist": watchlist_name,
+        }
+
+        logger.info(f"Completed news summary for {ticker}")
+        return result
+
+    def _run_summary_jobs(self, jobs: List[Callable[[], Any]]) -> List[Any]:
+        """Run summarization jobs concurrently, each in its own batch participant.
+
+        Args:
+            jobs: Callables making LLM requests
+
+        Returns:
+            The jobs' return values, in order
+        """
+
+        def run(job: Callable[[], Any]) -> Any:
+            with self.summarization_service.batch_participant():
+                return job()
+
+        if not jobs:
+            return []
+        workers = self._summary_workers(len(jobs))
+        with self.summarization_service.batch_workers(len(jobs)):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(run, jobs))
+
+    def _cluster_shared_events(
+        self, stock_news_list: List[StockNews]
+    ) -> Tuple[List[EventCluster], Dict[str, Set[str]]]:
+        """Cluster news shared by several movers into events.
+
+        Args:
+            stock_news_list: Collected (not yet summarized) news of the run's movers
+
+        Returns:
+            Events, and a dictionary mapping each ticker to the keys of the
+            articles covered by the events it is part of
+        """
+        if not self.cluster_events or len(stock_news_list) < 2:
+            return [], {}
+
+        events: List[EventCluster] = cluster_shared_events(stock_news_list)
+        covered: Dict[str, Set[str]] = {}
+        for event in events:
+            for ticker in event.tickers:
+                # Articles in events a ticker isn't part of stay in its summaries
+                covered.setdefault(ticker, set()).update(event.article_keys)
+        return events, covered
+
+    def _summarize_event(
+        self, event: EventCluster, stock_news_list: List[StockNews]
+    ) -> str:
+        """Summarize an event once for all the movers it concerns.
+
+        Args:
+            event: Event to summarize
+            stock_news_list: Collected news of the run's movers
+
+        Returns:
+            Event summary
+        """
+        price_changes = {}
+        for stock_news in stock_news_list:
+            if stock_news.ticker in event.tickers:
+                price_changes.setdefault(
+                    stock_news.ticker, stock_news.price_change_percent
+                )
+        return self.summarization_service.summarize_event(
+            event.articles, dict(sorted(price_changes.items()))
         )
-        return news_results
+
+    def _attach_event_summaries(
+        self,
+        events: List[EventCluster],
+        summaries: List[str],
+        stock_news_list: List[StockNews],
+    ) -> None:
+        """Attach each event's summary to every affected mover's StockNews.
+
+        Args:
+            events: Summarized events
+            summaries: Summary of each event
+            stock_news_list: Collected news of the run's movers, updated in place
+        """
+        for event, summary in zip(events, summaries):
+            for stock_news in stock_news_list:
+                if stock_news.ticker in event.tickers:
+                    stock_news.summary_events[event.label] = summary
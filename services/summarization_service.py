@@ -5,37 +5,404 @@ This module provides a service for generating summaries of news articles and
 discussions using the OpenAI API.
 """
 
+import contextlib
 import logging
-from typing import Dict, List, Optional
-from models.news_models import NewsArticle
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from models.news_models import ArticleRecord
+from clients.openai_batch import (
+    OPENAI_BATCH_MODE,
+    BatchRequestCollector,
+    LocalBatchEndpoint,
+    OpenAIBatchEndpoint,
+    OpenAIBatchRunner,
+)
 from clients.openai_client import OpenAIClient
+from clients.prompt_builder import build_messages, describe_move
+from clients.usage_ledger import TokenBudgetExceeded
+from services.summary_batcher import SummaryBatcher
+from utils.extractive_summarizer import ExtractiveSummarizer
+from utils.relevance import rank_articles
+from utils.token_packer import PackResult, clean_text, pack_items
 
 logger = logging.getLogger("news_agent")
 
+# Prompt token budgets per source (Reddit budgets are per subreddit)
+SEEKING_ALPHA_TOKEN_BUDGET = int(
+    os.environ.get("SUMMARY_TOKEN_BUDGET_SEEKING_ALPHA", "3000")
+)
+GOOGLE_NEWS_TOKEN_BUDGET = int(os.environ.get("SUMMARY_TOKEN_BUDGET_GOOGLE", "2000"))
+EVENT_TOKEN_BUDGET = int(os.environ.get("SUMMARY_TOKEN_BUDGET_EVENT", "2500"))
+REDDIT_TOKEN_BUDGET = int(os.environ.get("SUMMARY_TOKEN_BUDGET_REDDIT", "2500"))
+
+# Per-item token caps, so a single long item can't crowd out the rest
+MAX_ITEM_TOKENS = {"seeking_alpha": 1250, "news": 250, "reddit": 750, "event": 500}
+
+# Most relevant items kept per prompt (Reddit is per subreddit)
+RELEVANCE_TOP_K = {
+    "seeking_alpha": int(os.environ.get("SUMMARY_TOP_K_SEEKING_ALPHA", "15")),
+    "news": int(os.environ.get("SUMMARY_TOP_K_GOOGLE", "10")),
+    "reddit": int(os.environ.get("SUMMARY_TOP_K_REDDIT", "5")),
+    "event": int(os.environ.get("SUMMARY_TOP_K_EVENT", "10")),
+}
+
+# Summarize all subreddits of a ticker in one structured request instead of one
+# request per subreddit
+REDDIT_COMBINED_SUMMARY = (
+    os.environ.get("REDDIT_COMBINED_SUMMARY", "true").lower() == "true"
+)
+
+# Batch concurrent single-source summaries of different tickers into one request
+SUMMARY_BATCH_ENABLED = (
+    os.environ.get("SUMMARY_BATCH_ENABLED", "true").lower() == "true"
+)
+
+# Summarization backend: "openai" (LLM only), "extractive" (local only) or "auto"
+# (LLM with the local summarizer as fallback when it is missing, fails or is slow)
+SUMMARIZATION_BACKEND = os.environ.get("SUMMARIZATION_BACKEND", "auto").lower()
+
+# In auto mode, LLM calls taking longer than this are answered locally instead
+LLM_DEADLINE_SECONDS = float(os.environ.get("SUMMARY_LLM_DEADLINE_SECONDS", "30"))
+
+# Worker threads running deadline-bound LLM calls
+LLM_DEADLINE_WORKERS = 32
+
+# LLM results starting with these are failure placeholders
+LLM_FAILURE_PREFIXES = ("Error generating", "GPT-4 summarization not available")
+
 
 class SummarizationService:
     """Service for generating summaries of news articles and discussions."""
 
-    def __init__(self, openai_client: Optional[OpenAIClient] = None):
+    def __init__(
+        self,
+        openai_client: Optional[OpenAIClient] = None,
+        combine_reddit: bool = REDDIT_COMBINED_SUMMARY,
+        batch_summaries: bool = SUMMARY_BATCH_ENABLED,
+        backend: str = SUMMARIZATION_BACKEND,
+        llm_deadline_seconds: float = LLM_DEADLINE_SECONDS,
+        batch_mode: str = OPENAI_BATCH_MODE,
+    ):
         """Initialize the summarization service.
 
         Args:
-            openai_client: OpenAI client for generating summaries
+            openai_client: OpenAI client for generating summaries (defaults to the
+                shared client)
+            combine_reddit: Summarize all subreddits of a ticker in one request
+            batch_summaries: Batch concurrent summaries of different tickers
+            backend: Summarization backend ("openai", "extractive" or "auto")
+            llm_deadline_seconds: In auto mode, how long an LLM call may take
+                before the local summarizer answers instead
+            batch_mode: Run LLM calls made inside batch_participant() scopes
+                through the Batch API ("openai"), the offline stand-in
+                ("local"), or synchronously ("off")
+        """
+        if backend not in ("openai", "extractive", "auto"):
+            logger.warning(f"Unknown summarization backend '{backend}', using auto")
+            backend = "auto"
+        if batch_mode not in ("off", "openai", "local"):
+            logger.warning(f"Unknown batch mode '{batch_mode}', using off")
+            batch_mode = "off"
+        self._openai_client = openai_client
+        self.combine_reddit = combine_reddit
+        # The Batch API already batches (and discounts) every request
+        self.batch_summaries = batch_summaries and batch_mode == "off"
+        self.batch_mode = batch_mode
+        self.backend = backend
+        self.llm_deadline_seconds = llm_deadline_seconds
+        self.extractive_summarizer = ExtractiveSummarizer()
+        self._batcher: Optional[SummaryBatcher] = None
+        self._batch_collector: Optional[BatchRequestCollector] = None
+        self._llm_executor: Optional[ThreadPoolExecutor] = None
+        self.token_usage: Dict[str, Dict[str, int]] = {}
+        self.backend_metrics = {"llm": 0, "extractive": 0, "fallbacks": 0}
+        self._lock = threading.Lock()
+
+    @property
+    def openai_client(self) -> OpenAIClient:
+        """Get the OpenAI client, falling back to the shared instance."""
+        if self._openai_client is None:
+            self._openai_client = OpenAIClient.shared()
+        return self._openai_client
+
+    @property
+    def batcher(self) -> SummaryBatcher:
+        """Get the cross-ticker summary batcher, creating it on first use."""
+        with self._lock:
+            if self._batcher is None:
+                self._batcher = SummaryBatcher(self.openai_client)
+            return self._batcher
+
+    @property
+    def batch_collector(self) -> Optional[BatchRequestCollector]:
+        """Get the Batch API request collector, creating it on first use."""
+        if self.batch_mode == "off":
+            return None
+        with self._lock:
+            if self._batch_collector is None:
+                endpoint = (
+                    LocalBatchEndpoint()
+                    if self.batch_mode == "local"
+                    else OpenAIBatchEndpoint(self.openai_client)
+                )
+                self._batch_collector = BatchRequestCollector(
+                    OpenAIBatchRunner(endpoint)
+                )
+            return self._batch_collector
+
+    def batch_participant(self):
+        """Scope whose LLM calls are batched with those of other scopes.
+
+        Concurrent workers each summarize inside their own scope; their requests
+        are submitted together once every worker is waiting on one. Outside batch
+        mode this is a no-op.
+
+        Returns:
+            Context manager
+        """
+        if self.batch_collector is None:
+            return contextlib.nullcontext()
+        return self.batch_collector.participant()
+
+    def batch_workers(self, count: int):
+        """Scope around starting workers that each run in a batch_participant().
+
+        Args:
+            count: Number of workers about to start
+
+        Returns:
+            Context manager
+        """
+        if self.batch_collector is None:
+            return contextlib.nullcontext()
+        return self.batch_collector.reserve(count)
+
+    def get_batch_api_metrics(self) -> Dict[str, Any]:
+        """Get Batch API execution metrics.
+
+        Returns:
+            Dictionary of batch metrics (empty outside batch mode)
+        """
+        if self._batch_collector is None:
+            return {}
+        return self._batch_collector.get_metrics()
+
+    def _count(self, metric: str) -> None:
+        """Increment a backend metric."""
+        with self._lock:
+            self.backend_metrics[metric] += 1
+
+    def _uses_llm(self) -> bool:
+        """Check whether summaries should be requested from the LLM at all."""
+        if self.backend == "extractive":
+            return False
+        return self.backend == "openai" or self.openai_client.available
+
+    def _with_fallback(self, llm_call: Callable[[], Any], fallback: Callable[[], Any]):
+        """Run an LLM call, answering locally per the configured backend.
+
+        In auto mode the LLM call runs under the deadline; if it is slow, fails
+        or returns a failure placeholder, the local fallback answers instead (a
+        timed-out call keeps running and still fills the response cache). Batched
+        calls are not put under the deadline. In every mode an exhausted token
+        budget is answered by the fallback.
+
+        Args:
+            llm_call: Callable producing the LLM result
+            fallback: Callable producing the local result
+
+        Returns:
+            The LLM result, or the fallback result
+        """
+        if not self._uses_llm():
+            self._count("extractive")
+            return fallback()
+        # Batched calls wait for the whole batch, far beyond any deadline
+        if self.backend == "openai" or self.batch_mode != "off":
+            try:
+                result = llm_call()
+            except TokenBudgetExceeded as e:
+                logger.warning(f"{str(e)}, using extractive summary")
+                self._count("fallbacks")
+                return fallback()
+            if (
+                self.backend == "auto"
+                and isinstance(result, str)
+                and result.startswith(LLM_FAILURE_PREFIXES)
+            ):
+                self._count("fallbacks")
+                return fallback()
+            self._count("llm")
+            return result
+
+        with self._lock:
+            if self._llm_executor is None:
+                self._llm_executor = ThreadPoolExecutor(
+                    max_workers=LLM_DEADLINE_WORKERS
+                )
+            executor = self._llm_executor
+        future = executor.submit(llm_call)
+        try:
+            result = future.result(timeout=self.llm_deadline_seconds)
+        except FuturesTimeoutError:
+            logger.warning(
+                f"LLM call exceeded {self.llm_deadline_seconds}s deadline, "
+                "using extractive summary"
+            )
+            result = None
+        except Exception as e:
+            logger.warning(f"LLM call failed, using extractive summary: {str(e)}")
+            result = None
+
+        if result is None or (
+            isinstance(result, str) and result.startswith(LLM_FAILURE_PREFIXES)
+        ):
+            self._count("fallbacks")
+            return fallback()
+        self._count("llm")
+        return result
+
+    def _summarize(
+        self,
+        content: str,
+        ticker: str,
+        price_change_percent: Optional[float],
+        source: str,
+        company_name: Optional[str] = None,
+    ) -> str:
+        """Summarize content with the configured backend.
+
+        LLM summaries go through the batcher when batching is enabled.
+
+        Args:
+            content: The content to summarize
+            ticker: Stock ticker symbol
+            price_change_percent: Price change percentage (optional)
+            source: Source of the content (e.g., "reddit", "news", "seeking_alpha")
+            company_name: Company name (optional)
+
+        Returns:
+            Summary text
+        """
+
+        def llm_call() -> str:
+            if self.batch_summaries and self.openai_client.api_key:
+                return self.batcher.summarize(
+                    content, ticker, price_change_percent, source
+                )
+            return self.openai_client.generate_summary(
+                content, ticker, price_change_percent, source
+            )
+
+        return self._with_fallback(
+            llm_call,
+            lambda: self.extractive_summarizer.summarize(content, ticker, company_name),
+        )
+
+    def get_backend_metrics(self) -> Dict[str, Any]:
+        """Get how summaries were produced.
+
+        Returns:
+            Dictionary with the backend and counts of LLM, extractive and
+            fallback summaries
+        """
+        with self._lock:
+            return {"backend": self.backend, **self.backend_metrics}
+
+    def get_batch_metrics(self) -> Dict[str, int]:
+        """Get cross-ticker batching metrics.
+
+        Returns:
+            Dictionary of batching metrics (empty if nothing was batched)
+        """
+        if self._batcher is None:
+            return {}
+        return self._batcher.get_metrics()
+
+    @staticmethod
+    def _prioritize(
+        articles: List[ArticleRecord],
+        ticker: str,
+        company_name: Optional[str] = None,
+        source: str = "news",
+    ) -> List[Tuple[float, ArticleRecord]]:
+        """Rank articles locally and keep the top-k most worth summarizing.
+
+        Articles are ranked by recency, ticker mentions in the title and BM25
+        relevance (see utils.relevance.rank_articles).
+
+        Args:
+            articles: List of ArticleRecord objects
+            ticker: Stock ticker symbol
+            company_name: Company name (optional)
+            source: Source type (seeking_alpha, news, reddit), selecting top-k
+
+        Returns:
+            List of (priority, article) tuples, highest priority first
+        """
+        scored = rank_articles(articles, ticker, company_name)
+        return scored[: RELEVANCE_TOP_K.get(source, len(scored))]
+
+    def _pack(
+        self,
+        source: str,
+        items: List[Tuple[float, str]],
+        budget_tokens: int,
+        header: str = "",
+    ) -> PackResult:
+        """Pack rendered items into a prompt and record the tokens used.
+
+        Args:
+            source: Source type (seeking_alpha, news, reddit)
+            items: List of (priority, rendered item text) tuples
+            budget_tokens: Token budget for the packed content
+            header: Text placed before the items
+
+        Returns:
+            PackResult with the packed content
+        """
+        packed = pack_items(items, budget_tokens, header, MAX_ITEM_TOKENS.get(source))
+        with self._lock:
+            usage = self.token_usage.setdefault(
+                source,
+                {"prompts": 0, "tokens": 0, "items_included": 0, "items_total": 0},
+            )
+            usage["prompts"] += 1
+            usage["tokens"] += packed.tokens
+            usage["items_included"] += packed.items_included
+            usage["items_total"] += packed.items_total
+        logger.info(
+            f"Packed {packed.items_included}/{packed.items_total} {source} items "
+            f"into {packed.tokens} tokens (budget {budget_tokens})"
+        )
+        return packed
+
+    def get_token_usage(self) -> Dict[str, Dict[str, int]]:
+        """Get the prompt content tokens packed per source.
+
+        Returns:
+            Dictionary mapping source types to prompt, token and item counts
         """
-        self.openai_client = openai_client or OpenAIClient()
+        with self._lock:
+            return {source: dict(usage) for source, usage in self.token_usage.items()}
 
     def summarize_seeking_alpha(
         self,
-        articles: List[NewsArticle],
+        articles: List[ArticleRecord],
         ticker: str,
         price_change_percent: Optional[float] = None,
+        company_name: Optional[str] = None,
     ) -> str:
         """Summarize Seeking Alpha articles using GPT-4.
 
         Args:
-            articles: List of NewsArticle objects from Seeking Alpha
+            articles: List of ArticleRecord objects from Seeking Alpha
             ticker: Stock ticker symbol
             price_change_percent: Price change percentage (optional)
+            company_name: Company name used for relevance ranking (optional)
 
         Returns:
             Summary text of key points from Seeking Alpha
@@ -43,36 +410,50 @@ class SummarizationService:
         if not articles:
             return "No relevant Seeking Alpha articles found."
 
-        # Prepare content for GPT-4
-        content = ""
-        for article in articles:
+        # Prepare content for GPT-4. Raw list items only carry a title, which is
+        # summarized here in the same pass as everything else
+        items = []
+        for priority, article in self._prioritize(
+            articles, ticker, company_name, "seeking_alpha"
+        ):
             title = article.title
             article_content = article.content or ""
-            # Truncate very long articles to avoid token limits
-            if len(article_content) > 5000:
-                article_content = article_content[:5000] + "... [truncated]"
-            content += f"ARTICLE: {title}\n\n{article_content}\n\n---\n\n"
+            if article_content == title:
+                published = (
+                    f" ({article.published_at:%Y-%m-%d %H:%M})"
+                    if article.published_at
+                    else ""
+                )
+                items.append((priority, f"ARTICLE: {title}{published}\n---\n"))
+                continue
+            article_content = clean_text(article_content)
+            items.append(
+                (priority, f"ARTICLE: {title}\n\n{article_content}\n\n---\n\n")
+            )
+        content = self._pack("seeking_alpha", items, SEEKING_ALPHA_TOKEN_BUDGET).text
 
         # Generate summary using GPT-4
         if content:
-            return self.openai_client.generate_summary(
-                content, ticker, price_change_percent, "seeking_alpha"
+            return self._summarize(
+                content, ticker, price_change_percent, "seeking_alpha", company_name
             )
         else:
             return "No content available from Seeking Alpha articles."
 
     def summarize_google_news(
         self,
-        articles: List[NewsArticle],
+        articles: List[ArticleRecord],
         ticker: str,
         price_change_percent: Optional[float] = None,
+        company_name: Optional[str] = None,
     ) -> str:
         """Summarize Google News articles using GPT-4.
 
         Args:
-            articles: List of NewsArticle objects from Google News
+            articles: List of ArticleRecord objects from Google News
             ticker: Stock ticker symbol
             price_change_percent: Price change percentage (optional)
+            company_name: Company name used for relevance ranking (optional)
 
         Returns:
             Summary text explaining key news factors affecting the stock price
@@ -80,46 +461,41 @@ class SummarizationService:
         if not articles:
             return "No relevant Google News articles found."
 
-        # Prepare content for GPT-4
-        content = "Recent headlines and news:\n\n"
-
-        # Sort by published date (newest first)
-        sorted_articles = sorted(
-            articles,
-            key=lambda x: x.published_at if x.published_at else None,
-            reverse=True,
-        )
-
-        # Take up to 15 most recent articles
-        for article in sorted_articles[:15]:
+        # Prepare content for GPT-4, filling the token budget by priority
+        items = []
+        for priority, article in self._prioritize(
+            articles, ticker, company_name, "news"
+        ):
             source = article.source.replace("Google News - ", "")
             title = article.title
-            article_content = article.content or ""
-            # Truncate very long descriptions
-            if len(article_content) > 1000:
-                article_content = article_content[:1000] + "... [truncated]"
-            content += f"HEADLINE: {title} ({source})\n"
+            article_content = clean_text(article.content)
+            item = f"HEADLINE: {title} ({source})\n"
             if article_content:
-                content += f"CONTENT: {article_content}\n"
-            content += "---\n"
+                item += f"CONTENT: {article_content}\n"
+            items.append((priority, item + "---\n"))
+        content = self._pack(
+            "news", items, GOOGLE_NEWS_TOKEN_BUDGET, "Recent headlines and news:\n\n"
+        ).text
 
         # Generate summary using GPT-4
-        return self.openai_client.generate_summary(
-            content, ticker, price_change_percent, "news"
+        return self._summarize(
+            content, ticker, price_change_percent, "news", company_name
         )
 
     def summarize_reddit_by_subreddit(
         self,
-        articles: List[NewsArticle],
+        articles: List[ArticleRecord],
         ticker: str,
         price_change_percent: Optional[float] = None,
+        company_name: Optional[str] = None,
     ) -> Dict[str, str]:
         """Summarize Reddit posts grouped by subreddit using GPT-4.
 
         Args:
-            articles: List of NewsArticle objects from Reddit
+            articles: List of ArticleRecord objects from Reddit
             ticker: Stock ticker symbol
             price_change_percent: Price change percentage (optional)
+            company_name: Company name used for relevance ranking (optional)
 
         Returns:
             Dictionary mapping subreddit names to summary text
@@ -134,35 +510,92 @@ class SummarizationService:
                     subreddit_articles[article.subreddit] = []
                 subreddit_articles[article.subreddit].append(article)
 
-        # Generate summary for each subreddit
+        # Pack content for each subreddit
+        subreddit_contents = {}
         for subreddit, sub_articles in subreddit_articles.items():
             if not sub_articles:
                 continue
 
-            # Sort by published date (newest first)
-            sorted_articles = sorted(
-                sub_articles,
-                key=lambda x: x.published_at if x.published_at else None,
-                reverse=True,
+            # Prepare content for GPT-4, filling the token budget by priority
+            items = [
+                (
+                    priority,
+                    f"POST: {article.title}\n{clean_text(article.content)}\n---\n",
+                )
+                for priority, article in self._prioritize(
+                    sub_articles, ticker, company_name, "reddit"
+                )
+            ]
+            subreddit_contents[subreddit] = self._pack(
+                "reddit",
+                items,
+                REDDIT_TOKEN_BUDGET,
+                f"Reddit discussions from r/{subreddit} about {ticker}:\n\n",
+            ).text
+
+        # Summarize all subreddits in one structured request when there are several
+        if self.combine_reddit and len(subreddit_contents) > 1:
+            subreddit_summaries = self._with_fallback(
+                lambda: self.openai_client.generate_subreddit_summaries(
+                    subreddit_contents, ticker, price_change_percent
+                ),
+                lambda: {
+                    subreddit: self.extractive_summarizer.summarize(
+                        content, ticker, company_name
+                    )
+                    for subreddit, content in subreddit_contents.items()
+                },
+            )
+            missing = len(subreddit_contents) - len(subreddit_summaries)
+            if missing:
+                logger.warning(
+                    f"Combined Reddit summary for {ticker} missed {missing} "
+                    "subreddit(s), summarizing them separately"
+                )
+
+        # Generate summary for each remaining subreddit
+        for subreddit, content in subreddit_contents.items():
+            if subreddit in subreddit_summaries:
+                continue
+            subreddit_summaries[subreddit] = self._summarize(
+                content, ticker, price_change_percent, "reddit", company_name
             )
 
-            # Prepare content for GPT-4
-            content = f"Reddit discussions from r/{subreddit} about {ticker}:\n\n"
+        return subreddit_summaries
 
-            for article in sorted_articles[:5]:  # Take up to 5 most recent discussions
-                title = article.title
-                post_content = article.content or ""
-                # Truncate very long posts
-                if len(post_content) > 3000:
-                    post_content = post_content[:3000] + "... [truncated]"
-                content += f"POST: {title}\n{post_content}\n---\n"
+    def summarize_event(
+        self,
+        articles: List[ArticleRecord],
+        price_changes: Dict[str, Optional[float]],
+    ) -> str:
+        """Summarize the articles of an event shared by several movers.
 
-            # Generate summary using GPT-4
-            subreddit_summaries[subreddit] = self.openai_client.generate_summary(
-                content, ticker, price_change_percent, "reddit"
-            )
+        Args:
+            articles: List of ArticleRecord objects about the event
+            price_changes: Dictionary mapping affected tickers to price changes
 
-        return subreddit_summaries
+        Returns:
+            Summary text of the event
+        """
+        tickers = sorted(price_changes)
+        if not articles or not tickers:
+            return "No shared event articles found."
+
+        # Rank against the first ticker, with the others as extra subject terms
+        lead, others = tickers[0], " ".join(tickers[1:])
+        items = []
+        for priority, article in self._prioritize(articles, lead, others, "event"):
+            item = f"HEADLINE: {article.title} ({article.source})\n"
+            article_content = clean_text(article.content)
+            if article_content and article_content != article.title:
+                item += f"CONTENT: {article_content}\n"
+            items.append((priority, item + "---\n"))
+        content = self._pack("event", items, EVENT_TOKEN_BUDGET).text
+
+        return self._with_fallback(
+            lambda: self.openai_client.generate_event_summary(content, price_changes),
+            lambda: self.extractive_summarizer.summarize(content, lead, others),
+        )
 
     def generate_concise_bullet_points(
         self,
@@ -171,6 +604,9 @@ class SummarizationService:
         seeking_alpha_summary: str,
         google_summary: str,
         reddit_summaries: Dict[str, str],
+        on_token: Optional[Callable[[str], None]] = None,
+        company_name: Optional[str] = None,
+        event_summaries: Optional[Dict[str, str]] = None,
     ) -> str:
         """Generate concise bullet points summarizing all sources.
 
@@ -180,56 +616,115 @@ class SummarizationService:
             seeking_alpha_summary: Summary from Seeking Alpha
             google_summary: Summary from Google News
             reddit_summaries: Summaries from Reddit by subreddit
+            on_token: Optional callback receiving the bullet points as they are
+                streamed from the model
+            company_name: Company name (optional)
+            event_summaries: Summaries of events shared with other movers,
+                keyed by headline (optional)
 
         Returns:
             Three concise bullet points capturing the essence of the price change
         """
-        if not self.openai_client or not self.openai_client.api_key:
+        # Combine all summaries
+        combined_content = f"Seeking Alpha Summary:\n{seeking_alpha_summary}\n\n"
+        combined_content += f"Google News Summary:\n{google_summary}\n\n"
+
+        for subreddit, summary in reddit_summaries.items():
+            combined_content += f"Reddit r/{subreddit} Summary:\n{summary}\n\n"
+
+        for headline, summary in (event_summaries or {}).items():
+            combined_content += f"Shared Event Summary ({headline}):\n{summary}\n\n"
+
+        def extractive() -> str:
+            bullet_points = self.extractive_summarizer.summarize(
+                combined_content, ticker, company_name
+            )
+            if on_token is not None:
+                on_token(bullet_points)
+            return bullet_points
+
+        def llm_call() -> str:
+            return self._generate_llm_bullet_points(
+                ticker, price_change_percent, combined_content, on_token
+            )
+
+        # Streamed output can't be taken back, so it isn't put under the deadline
+        if on_token is not None and self.backend == "auto" and self._uses_llm():
+            try:
+                bullet_points = llm_call()
+            except TokenBudgetExceeded as e:
+                logger.warning(f"{str(e)}, using extractive summary")
+                self._count("fallbacks")
+                return extractive()
+            if bullet_points.startswith(LLM_FAILURE_PREFIXES):
+                self._count("fallbacks")
+                return extractive()
+            self._count("llm")
+            return bullet_points
+        return self._with_fallback(llm_call, extractive)
+
+    def _generate_llm_bullet_points(
+        self,
+        ticker: str,
+        price_change_percent: float,
+        combined_content: str,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Generate concise bullet points with the LLM.
+
+        Args:
+            ticker: Stock ticker symbol
+            price_change_percent: Price change percentage
+            combined_content: Summaries of all sources
+            on_token: Optional callback receiving the bullet points as they are
+                streamed from the model
+
+        Returns:
+            Three concise bullet points, or an error message
+
+        Raises:
+            TokenBudgetExceeded: If a token budget of the run is exhausted
+        """
+        if not self.openai_client or not self.openai_client.available:
             return "GPT-4 summarization not available (API key not set)."
 
         try:
-            # Combine all summaries
-            combined_content = f"Seeking Alpha Summary:\n{seeking_alpha_summary}\n\n"
-            combined_content += f"Google News Summary:\n{google_summary}\n\n"
-
-            for subreddit, summary in reddit_summaries.items():
-                combined_content += f"Reddit r/{subreddit} Summary:\n{summary}\n\n"
-
-            # Create prompt for OpenAI
-            direction = "increase" if price_change_percent > 0 else "decrease"
-            prompt = f"""
-            Based on the following summaries about {ticker} stock, create exactly 3 concise bullet points 
-            that capture the most important factors driving the stock's {direction} of {abs(price_change_percent):.2f}%.
-            
-            Focus on the most significant and impactful factors mentioned across multiple sources.
-            Each bullet point should be clear, specific, and directly related to the stock price movement.
-            
-            {combined_content}
-            
-            Return ONLY the 3 bullet points, numbered 1-3, with no introduction or conclusion.
-            Each bullet point should be 1-2 sentences maximum.
-            ENSURE THAT ALL BULLET POINTS ARE STRICTLY RELATED TO THE STOCK PRICE MOVMENT, PLEASE DO NOT INCLUDE FILLER NEWS THAT ARE NOT DIRECTLY RELATED TO THE STOCK
-            IF THERE ARE NO NEWS ASSOCIATED WITH THE STOCK PRICE MOVEMENT, PLEASE JUST OMIT THE BULLET POINTS
-            """
+            messages = build_messages(
+                "bullet_points",
+                f"{describe_move(ticker, price_change_percent)}\n\n{combined_content}",
+            )
+
+            route = self.openai_client.route("bullet_points", combined_content)
+
+            # Stream the bullet points through when a callback wants them live
+            if on_token is not None:
+                chunks = []
+                for chunk in self.openai_client.stream_chat_completion(
+                    messages=messages,
+                    model=route.model,
+                    temperature=0.3,
+                    max_tokens=route.max_tokens,
+                    call_type="bullet_points",
+                    tickers=(ticker,),
+                ):
+                    on_token(chunk)
+                    chunks.append(chunk)
+                return "".join(chunks).strip()
 
             # Call OpenAI API
-            response = self.openai_client.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a financial analyst specializing in stock market analysis. Provide concise, insightful bullet points explaining stock price movements.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            bullet_points = self.openai_client.chat_completion(
+                model=route.model,
+                messages=messages,
                 temperature=0.3,
-                max_tokens=300,
+                max_tokens=route.max_tokens,
+                call_type="bullet_points",
+                tickers=(ticker,),
             )
 
-            # Extract and return the bullet points
-            bullet_points = response.choices[0].message.content.strip()
             return bullet_points
 
+        except TokenBudgetExceeded:
+            raise
         except Exception as e:
             logger.error(
                 f"Error generating concise bullet points for {ticker}: {str(e)}"
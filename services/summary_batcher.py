@@ -0,0 +1,284 @@
+"""
+Cross-ticker batching of summarization requests.
+
+This module provides a batcher that collects pending single-source summarization
+jobs from concurrent callers for a short window (or until a token limit is
+reached) and sends them to the LLM as one multi-ticker request, splitting the
+structured response back into per-ticker summaries. Jobs whose summary is
+already cached are answered without joining a batch.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from clients.openai_client import OpenAIClient
+from utils.token_packer import count_tokens
+
+logger = logging.getLogger("news_agent")
+
+# How long the first job of a batch waits for others to join it
+SUMMARY_BATCH_WINDOW_SECONDS = float(
+    os.environ.get("SUMMARY_BATCH_WINDOW_SECONDS", "0.25")
+)
+
+# A batch is sent as soon as its content reaches this many tokens...
+SUMMARY_BATCH_MAX_TOKENS = int(os.environ.get("SUMMARY_BATCH_MAX_TOKENS", "12000"))
+
+# ...or holds this many tickers
+SUMMARY_BATCH_MAX_JOBS = int(os.environ.get("SUMMARY_BATCH_MAX_JOBS", "8"))
+
+
+class SummaryJob:
+    """A pending summarization job for one ticker and source."""
+
+    __slots__ = ("ticker", "content", "price_change_percent", "tokens", "future")
+
+    def __init__(
+        self, ticker: str, content: str, price_change_percent: Optional[float]
+    ):
+        """Initialize the job.
+
+        Args:
+            ticker: Stock ticker symbol
+            content: The content to summarize
+            price_change_percent: Price change percentage (optional)
+        """
+        self.ticker = ticker
+        self.content = content
+        self.price_change_percent = price_change_percent
+        self.tokens = count_tokens(content)
+        self.future: Future = Future()
+
+
+class _PendingBatch:
+    """Jobs of one source waiting to be sent together."""
+
+    __slots__ = ("jobs", "tokens", "timer")
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.jobs: Dict[str, SummaryJob] = {}
+        self.tokens = 0
+        self.timer: Optional[threading.Timer] = None
+
+
+class SummaryBatcher:
+    """Collects summarization jobs and sends them as multi-ticker requests."""
+
+    def __init__(
+        self,
+        openai_client: OpenAIClient,
+        window_seconds: float = SUMMARY_BATCH_WINDOW_SECONDS,
+        max_batch_tokens: int = SUMMARY_BATCH_MAX_TOKENS,
+        max_batch_jobs: int = SUMMARY_BATCH_MAX_JOBS,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            openai_client: OpenAI client the batches are sent through
+            window_seconds: How long the first job of a batch waits for others
+            max_batch_tokens: Content tokens at which a batch is sent immediately
+            max_batch_jobs: Number of tickers at which a batch is sent immediately
+        """
+        self.openai_client = openai_client
+        self.window_seconds = window_seconds
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_jobs = max_batch_jobs
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._lock = threading.Lock()
+        # Runs the single-ticker fallbacks of a batch, created on first use
+        self._fallback_executor: Optional[ThreadPoolExecutor] = None
+        self.metrics = {
+            "jobs": 0,
+            "cache_hits": 0,
+            "batches": 0,
+            "batched_jobs": 0,
+            "fallbacks": 0,
+        }
+
+    def summarize(
+        self,
+        content: str,
+        ticker: str,
+        price_change_percent: Optional[float] = None,
+        source: str = "news",
+    ) -> str:
+        """Summarize content, waiting for the batch it joins to be answered.
+
+        Args:
+            content: The content to summarize
+            ticker: Stock ticker symbol
+            price_change_percent: Price change percentage (optional)
+            source: Source of the content (e.g., "reddit", "news", "seeking_alpha")
+
+        Returns:
+            Summary text
+        """
+        return self.submit(content, ticker, price_change_percent, source).result()
+
+    def submit(
+        self,
+        content: str,
+        ticker: str,
+        price_change_percent: Optional[float] = None,
+        source: str = "news",
+    ) -> Future:
+        """Add a job to the pending batch of its source.
+
+        Args:
+            content: The content to summarize
+            ticker: Stock ticker symbol
+            price_change_percent: Price change percentage (optional)
+            source: Source of the content (e.g., "reddit", "news", "seeking_alpha")
+
+        Returns:
+            Future resolving to the summary text
+        """
+        job = SummaryJob(ticker, content, price_change_percent)
+        ready: List[List[SummaryJob]] = []
+
+        cached = self.openai_client.get_cached_summary(
+            content, ticker, price_change_percent, source
+        )
+        if cached is not None:
+            with self._lock:
+                self.metrics["jobs"] += 1
+                self.metrics["cache_hits"] += 1
+            job.future.set_result(cached)
+            return job.future
+
+        with self._lock:
+            self.metrics["jobs"] += 1
+            batch = self._pending.get(source)
+            # The same ticker can't appear twice in one response object
+            if batch is not None and ticker in batch.jobs:
+                ready.append(self._take(source))
+                batch = None
+            if batch is None:
+                batch = self._pending[source] = _PendingBatch()
+                batch.timer = threading.Timer(
+                    self.window_seconds, self._flush_expired, (source, batch)
+                )
+                batch.timer.daemon = True
+                batch.timer.start()
+            batch.jobs[ticker] = job
+            batch.tokens += job.tokens
+            if (
+                batch.tokens >= self.max_batch_tokens
+                or len(batch.jobs) >= self.max_batch_jobs
+            ):
+                ready.append(self._take(source))
+
+        for jobs in ready:
+            self._run_batch(jobs, source)
+        return job.future
+
+    def flush(self) -> None:
+        """Send every pending batch right away."""
+        with self._lock:
+            ready = [(source, self._take(source)) for source in list(self._pending)]
+        for source, jobs in ready:
+            self._run_batch(jobs, source)
+
+    def _take(self, source: str) -> List[SummaryJob]:
+        """Remove a source's pending batch (the lock must be held).
+
+        Args:
+            source: Source type
+
+        Returns:
+            The batch's jobs
+        """
+        batch = self._pending.pop(source)
+        if batch.timer is not None:
+            batch.timer.cancel()
+        return list(batch.jobs.values())
+
+    def _flush_expired(self, source: str, batch: _PendingBatch) -> None:
+        """Send a batch whose window has expired, unless it was already sent.
+
+        Args:
+            source: Source type
+            batch: The batch the timer was started for
+        """
+        with self._lock:
+            if self._pending.get(source) is not batch:
+                return
+            jobs = self._take(source)
+        self._run_batch(jobs, source)
+
+    def _run_batch(self, jobs: List[SummaryJob], source: str) -> None:
+        """Summarize a batch, falling back to single calls for missed tickers.
+
+        The fallbacks run in parallel on the fallback executor rather than one
+        after another on the thread that sent the batch.
+
+        Args:
+            jobs: Jobs to summarize
+            source: Source type shared by the jobs
+        """
+        summaries: Dict[str, str] = {}
+        if len(jobs) > 1:
+            logger.info(
+                f"Sending batched {source} summary for {len(jobs)} tickers "
+                f"({sum(job.tokens for job in jobs)} tokens)"
+            )
+            summaries = self.openai_client.generate_ticker_summaries(
+                {job.ticker: job.content for job in jobs},
+                {job.ticker: job.price_change_percent for job in jobs},
+                source,
+            )
+            with self._lock:
+                self.metrics["batches"] += 1
+                self.metrics["batched_jobs"] += len(summaries)
+
+        missed = []
+        for job in jobs:
+            summary = summaries.get(job.ticker)
+            if summary is None:
+                missed.append(job)
+            else:
+                job.future.set_result(summary)
+        if not missed:
+            return
+        if len(jobs) == 1:
+            self._run_single(missed[0], source)
+            return
+
+        with self._lock:
+            self.metrics["fallbacks"] += len(missed)
+            if self._fallback_executor is None:
+                self._fallback_executor = ThreadPoolExecutor(
+                    max_workers=self.max_batch_jobs
+                )
+            executor = self._fallback_executor
+        for job in missed:
+            executor.submit(self._run_single, job, source)
+
+    def _run_single(self, job: SummaryJob, source: str) -> None:
+        """Summarize one job with a single-ticker request.
+
+        Args:
+            job: Job to summarize
+            source: Source type of the job
+        """
+        try:
+            job.future.set_result(
+                self.openai_client.generate_summary(
+                    job.content, job.ticker, job.price_change_percent, source
+                )
+            )
+        except Exception as e:
+            job.future.set_exception(e)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Get batching metrics.
+
+        Returns:
+            Dictionary of job, cache hit, batch, batched job and fallback counts
+        """
+        with self._lock:
+            return dict(self.metrics)
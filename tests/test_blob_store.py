@@ -0,0 +1,94 @@
+"""
+Tests for the content-addressed article blob store.
+"""
+
+import os
+import time
+
+import pytest
+
+import utils.blob_store as blob_store
+from utils.blob_store import BlobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs.bin"))
+    yield store
+    store.close()
+
+
+def test_put_get_round_trip_and_deduplication(store):
+    digest = store.put("Shares rose after earnings. — été")
+
+    assert store.get(digest) == "Shares rose after earnings. — été"
+    assert store.put("Shares rose after earnings. — été") == digest
+    assert digest in store
+
+    metrics = store.get_metrics()
+    assert metrics["blobs"] == 1
+    assert metrics["puts"] == 2
+    assert metrics["deduplicated"] == 1
+
+
+def test_get_unknown_digest_raises_key_error(store):
+    with pytest.raises(KeyError):
+        store.get(b"\0" * 32)
+
+
+def test_blobs_survive_reopening(store):
+    digest = store.put("persisted body")
+    store.close()
+
+    reopened = BlobStore(store.path)
+    try:
+        assert reopened.get(digest) == "persisted body"
+    finally:
+        reopened.close()
+
+
+def test_partial_entry_is_truncated_on_open(store):
+    digest = store.put("complete body")
+    size = store.get_metrics()["bytes"]
+    store.close()
+    with open(store.path, "ab") as f:
+        f.write(blob_store.MAGIC + b"\0\0")
+
+    reopened = BlobStore(store.path)
+    try:
+        assert reopened.get(digest) == "complete body"
+        assert reopened.get_metrics()["bytes"] == size
+        assert os.path.getsize(store.path) == size
+    finally:
+        reopened.close()
+
+
+def test_compaction_keeps_used_blobs_and_drops_stale_ones(store, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(blob_store.time, "time", lambda: now - 30 * 86400)
+    stale = store.put("stale body")
+    touched = store.put("touched body")
+
+    monkeypatch.setattr(blob_store.time, "time", lambda: now)
+    # Reusing an old blob appends a touch entry that keeps it alive
+    assert store.put("touched body") == touched
+    fresh = store.put("fresh body")
+
+    result = store.compact(max_age_days=14)
+
+    assert result["before"]["blobs"] == 3
+    assert result["after"]["blobs"] == 2
+    assert result["after"]["bytes"] < result["before"]["bytes"]
+    assert stale not in store
+    assert store.get(touched) == "touched body"
+    assert store.get(fresh) == "fresh body"
+
+    # The compacted file holds no touch entries and indexes the same blobs
+    store.close()
+    reopened = BlobStore(store.path)
+    try:
+        assert reopened.get(touched) == "touched body"
+        assert reopened.get(fresh) == "fresh body"
+        assert reopened.get_metrics()["bytes"] == result["after"]["bytes"]
+    finally:
+        reopened.close()
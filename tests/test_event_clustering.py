@@ -0,0 +1,100 @@
+"""
+Tests for clustering news shared by several movers into events.
+"""
+
+from models.news_models import ArticleRecord, StockNews
+from services.event_clustering import article_key, cluster_shared_events
+
+
+def article(title: str, content: str = "", url=None, source="Google"):
+    return ArticleRecord(
+        source=source, title=title, url=url, content=content, inline=True
+    )
+
+
+def news(ticker: str, company_name: str, *articles: ArticleRecord) -> StockNews:
+    return StockNews(ticker=ticker, company_name=company_name, articles=list(articles))
+
+
+def test_article_key_prefers_url_over_title():
+    assert article_key(article("Title", url="https://example.com/a")) == (
+        "https://example.com/a"
+    )
+    assert article_key(article("  Chip Stocks Fall ")) == "chip stocks fall"
+
+
+def test_articles_mentioning_several_movers_form_one_event():
+    tariffs = article(
+        "Chip stocks fall on new export tariffs",
+        "AMD and Nvidia shares dropped after the announcement.",
+        url="https://example.com/tariffs",
+    )
+    follow_up = article(
+        "Chip stocks fall further on export tariffs",
+        "NVDA and AMD extended losses.",
+        url="https://example.com/tariffs-2",
+    )
+    earnings = article("AMD earnings beat", "AMD revenue rose.")
+
+    events = cluster_shared_events(
+        [
+            news("AMD", "Advanced Micro Devices", tariffs, earnings, follow_up),
+            news("NVDA", "Nvidia Corp", follow_up),
+        ]
+    )
+
+    assert len(events) == 1
+    event = events[0]
+    assert event.tickers == {"AMD", "NVDA"}
+    assert event.articles == [tariffs, follow_up]
+    assert event.article_keys == {
+        "https://example.com/tariffs",
+        "https://example.com/tariffs-2",
+    }
+    assert event.label == tariffs.title
+
+
+def test_article_listed_under_several_movers_concerns_all_of_them():
+    shared = article("Semiconductor index slides", "Sector-wide selloff.")
+
+    events = cluster_shared_events(
+        [news("AMD", None, shared), news("INTC", None, shared)]
+    )
+
+    assert len(events) == 1
+    assert events[0].tickers == {"AMD", "INTC"}
+
+
+def test_dissimilar_titles_form_separate_events():
+    events = cluster_shared_events(
+        [
+            news(
+                "AMD",
+                None,
+                article("Fed holds rates steady", "AMD and INTC moved."),
+                article("Chip export tariffs announced", "AMD and INTC fell."),
+            ),
+            news("INTC", None),
+        ]
+    )
+
+    assert [event.label for event in events] == [
+        "Fed holds rates steady",
+        "Chip export tariffs announced",
+    ]
+
+
+def test_reddit_posts_and_single_ticker_news_are_left_out():
+    events = cluster_shared_events(
+        [
+            news(
+                "AMD",
+                None,
+                article("AMD and INTC thread", "AMD vs INTC?", source="Reddit"),
+                article("AMD launches new chip", "Only about AMD."),
+            ),
+            news("INTC", None),
+        ]
+    )
+
+    assert events == []
@@ -0,0 +1,51 @@
+"""
+Tests for the local extractive summarizer.
+"""
+
+from utils.extractive_summarizer import ExtractiveSummarizer, split_sentences
+
+CONTENT = """Google News Summary:
+HEADLINE: AMD shares jump after earnings beat estimates
+CONTENT: AMD shares jumped 8% after quarterly earnings beat analyst estimates. The weather in Austin was sunny and warm all week long. AMD raised its full-year revenue guidance on strong data center demand.
+---
+Reddit discussions from r/stocks about AMD:
+- AMD shares jumped 8% after quarterly earnings beat analyst estimates today.
+- Too short.
+"""
+
+
+def test_split_sentences_drops_scaffolding_markers_and_short_sentences():
+    sentences = split_sentences(CONTENT)
+
+    assert sentences[0] == "AMD shares jump after earnings beat estimates"
+    assert "Too short." not in sentences
+    assert not any(
+        sentence.startswith(("HEADLINE", "CONTENT", "Google News", "Reddit", "- "))
+        for sentence in sentences
+    )
+    assert (
+        "AMD raised its full-year revenue guidance on strong data center demand."
+        in sentences
+    )
+
+
+def test_key_points_are_relevant_and_not_redundant():
+    points = ExtractiveSummarizer(max_points=2).key_points(
+        CONTENT, "AMD", "Advanced Micro Devices"
+    )
+
+    assert len(points) == 2
+    assert any("guidance" in point for point in points)
+    assert not any("weather" in point for point in points)
+    # The headline and the two "shares jumped" sentences count once
+    assert sum("jump" in point for point in points) == 1
+
+
+def test_summarize_numbers_points_and_handles_empty_content():
+    summarizer = ExtractiveSummarizer(max_points=1)
+
+    summary = summarizer.summarize(CONTENT, "AMD")
+
+    assert summary.startswith("1. ")
+    assert "\n" not in summary
+    assert summarizer.summarize("", "AMD") == "No key points found."
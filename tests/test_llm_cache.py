@@ -0,0 +1,87 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+import pytest
+
+import clients.llm_cache as llm_cache
+from clients.llm_cache import LLMResponseCache
+
+MESSAGES = [{"role": "user", "content": "Summarize AMD news"}]
+
+
+class Clock:
+    """Controllable replacement for time.time()."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(llm_cache.time, "time", clock)
+    return clock
+
+
+def make_cache(tmp_path, **kwargs) -> LLMResponseCache:
+    return LLMResponseCache(str(tmp_path / "llm_cache.sqlite3"), **kwargs)
+
+
+def test_make_key_depends_on_model_messages_and_params():
+    key = LLMResponseCache.make_key("gpt-4o", MESSAGES, temperature=0.3)
+
+    assert key == LLMResponseCache.make_key("gpt-4o", MESSAGES, temperature=0.3)
+    assert key != LLMResponseCache.make_key("gpt-4o-mini", MESSAGES, temperature=0.3)
+    assert key != LLMResponseCache.make_key("gpt-4o", MESSAGES, temperature=0.5)
+    assert key != LLMResponseCache.make_key(
+        "gpt-4o", [{"role": "user", "content": "Summarize NVDA news"}], temperature=0.3
+    )
+
+
+def test_hit_and_miss(tmp_path, clock):
+    cache = make_cache(tmp_path)
+
+    assert cache.get("key") is None
+    cache.set("key", "summary")
+    assert cache.get("key") == "summary"
+
+    metrics = cache.get_metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl_seconds=60)
+    cache.set("key", "summary")
+
+    clock.now += 60
+    assert cache.get("key") == "summary"
+    clock.now += 1
+    assert cache.get("key") is None
+    assert cache.get_metrics()["expirations"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.set("first", "1")
+    clock.now += 1
+    cache.set("second", "2")
+    clock.now += 1
+    # Reading "first" makes "second" the least recently used entry
+    assert cache.get("first") == "1"
+    clock.now += 1
+    cache.set("third", "3")
+
+    assert cache.get("second") is None
+    assert cache.get("first") == "1"
+    assert cache.get("third") == "3"
+    assert cache.get_metrics()["evictions"] == 1
+
+
+def test_entries_persist_across_instances(tmp_path, clock):
+    make_cache(tmp_path).set("key", "summary")
+
+    assert make_cache(tmp_path).get("key") == "summary"
@@ -0,0 +1,61 @@
+"""
+Tests for the compiled ticker mention extractor.
+"""
+
+from utils.mention_extractor import Mention, MentionExtractor, normalize_company_name
+
+
+def test_normalize_company_name_strips_suffixes():
+    assert normalize_company_name("Tesla, Inc.") == "Tesla"
+    assert normalize_company_name("Alphabet Inc. Class A") == "Alphabet"
+    assert normalize_company_name("Taiwan Semiconductor Manufacturing Co. Ltd") == (
+        "Taiwan Semiconductor Manufacturing"
+    )
+
+
+def test_normalize_company_name_rejects_short_or_empty_names():
+    assert normalize_company_name(None) is None
+    assert normalize_company_name("") is None
+    assert normalize_company_name("GE Co.") is None
+
+
+def test_counts_mentions_and_first_position():
+    extractor = MentionExtractor.from_tickers(["AMD", "NVDA"])
+
+    mentions = extractor.extract("NVDA beat, AMD fell. AMD guidance was weak.")
+
+    assert mentions == {
+        "NVDA": Mention(count=1, first_position=0),
+        "AMD": Mention(count=2, first_position=11),
+    }
+
+
+def test_bare_tickers_are_case_sensitive_but_cashtags_are_not():
+    extractor = MentionExtractor.from_tickers(["ON", "AMD"])
+
+    assert extractor.extract("turned on the lights") == {}
+    assert extractor.extract("ON semi rallied")["ON"].count == 1
+    assert extractor.extract("bought $on and $amd")["ON"].count == 1
+    assert extractor.extract("bought $on and $amd")["AMD"].count == 1
+
+
+def test_tickers_only_match_on_word_boundaries():
+    extractor = MentionExtractor.from_tickers(["GS", "GOOG", "GOOGL"])
+
+    assert extractor.extract("things GSX") == {}
+    assert extractor.extract("GOOGL up") == {"GOOGL": Mention(1, 0)}
+    assert extractor.extract("GOOG up") == {"GOOG": Mention(1, 0)}
+
+
+def test_company_names_match_case_insensitively():
+    extractor = MentionExtractor({"TSLA": "Tesla, Inc.", "AAPL": "Apple Inc."})
+
+    mentions = extractor.extract("tesla and APPLE reported; Apple Inc. too")
+
+    assert mentions["TSLA"] == Mention(1, 0)
+    assert mentions["AAPL"].count == 2
+
+
+def test_empty_universe_and_text():
+    assert MentionExtractor({}).extract("AMD") == {}
+    assert MentionExtractor.from_tickers(["AMD"]).extract(None) == {}
@@ -0,0 +1,86 @@
+"""
+Tests for BM25 relevance ranking of articles.
+"""
+
+from datetime import datetime, timedelta
+
+from models.news_models import ArticleRecord
+from utils.relevance import BM25Ranker, build_query, rank_articles, tokenize
+
+NOW = datetime(2026, 1, 15, 16, 0)
+
+
+def article(title: str, content: str = "", hours_ago: float = 0.0) -> ArticleRecord:
+    return ArticleRecord(
+        source="Google",
+        title=title,
+        content=content,
+        published_at=NOW - timedelta(hours=hours_ago),
+        inline=True,
+    )
+
+
+def test_tokenize_lowercases_and_keeps_decimals():
+    assert tokenize("NVDA rose 3.5% on Q4 earnings") == [
+        "nvda",
+        "rose",
+        "3.5",
+        "on",
+        "q4",
+        "earnings",
+    ]
+    assert tokenize(None) == []
+
+
+def test_build_query_weights_ticker_and_company_name():
+    query = build_query("AMD", "Advanced Micro Devices, Inc.")
+
+    assert query.count("amd") == 3
+    assert query.count("micro") == 3
+    assert "inc" not in query
+    assert "earnings" in query
+
+
+def test_bm25_scores_matching_documents_higher():
+    ranker = BM25Ranker(
+        ["nvda earnings beat estimates", "weather report for today", "nvda"]
+    )
+
+    scores = ranker.score(["nvda", "earnings"])
+
+    assert scores[0] > scores[2] > scores[1] == 0.0
+
+
+def test_rank_articles_prefers_relevant_over_recent():
+    recent = article("Markets wrap: stocks mixed", "Traders await data.", 1)
+    relevant = article(
+        "Why AMD stock jumped today",
+        "AMD shares rose after earnings beat and raised guidance.",
+        30,
+    )
+
+    ranked = rank_articles([recent, relevant], "AMD", "Advanced Micro Devices")
+
+    assert [item for _, item in ranked] == [relevant]
+
+
+def test_rank_articles_orders_by_priority():
+    older = article("AMD earnings beat", "AMD revenue rose.", 20)
+    newer = article("AMD earnings beat", "AMD revenue rose.", 2)
+    untitled = article("Chip stocks", "AMD revenue rose after earnings.", 1)
+
+    ranked = rank_articles([older, untitled, newer], "AMD")
+
+    priorities = [priority for priority, _ in ranked]
+    assert priorities == sorted(priorities, reverse=True)
+    # Same text, so recency breaks the tie; the title mention outweighs recency
+    assert [item for _, item in ranked] == [newer, older, untitled]
+
+
+def test_rank_articles_keeps_everything_without_any_relevance():
+    articles = [article("Weather", "Sunny.", 1), article("Sports", "Game on.", 2)]
+
+    ranked = rank_articles(articles, "AMD")
+
+    assert [item for _, item in ranked] == articles
+    assert rank_articles([], "AMD") == []
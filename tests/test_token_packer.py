@@ -0,0 +1,79 @@
+"""
+Tests for token counting, text cleaning and prompt packing.
+"""
+
+from utils.token_packer import (
+    TRUNCATION_MARKER,
+    clean_text,
+    count_tokens,
+    pack_items,
+    truncate_to_tokens,
+)
+
+
+def words(count: int, word: str = "word") -> str:
+    return " ".join([word] * count)
+
+
+def test_count_tokens_of_empty_text():
+    assert count_tokens(None) == 0
+    assert count_tokens("") == 0
+    assert count_tokens("shares") > 0
+
+
+def test_truncate_keeps_text_within_budget():
+    text = words(200)
+
+    assert truncate_to_tokens(text, count_tokens(text)) == text
+
+    truncated = truncate_to_tokens(text, 50)
+    assert truncated.endswith(TRUNCATION_MARKER)
+    assert count_tokens(truncated) <= 50
+    assert text.startswith(truncated[: -len(TRUNCATION_MARKER)])
+
+
+def test_clean_text_strips_urls_tags_and_boilerplate():
+    text = (
+        "<p>Shares   rose</p> https://example.com/a?b=1 today.\n\n\n\n"
+        "Click here to subscribe. [removed] Read more at the source"
+    )
+
+    cleaned = clean_text(text)
+    assert cleaned.startswith("Shares rose today.\n\n")
+    for removed in ("<p>", "http", "example.com", "Click here", "[removed]", "Read"):
+        assert removed not in cleaned
+    assert clean_text(None) == ""
+
+
+def test_pack_items_takes_items_by_priority():
+    result = pack_items(
+        [(0.1, "low "), (0.9, "high "), (0.5, "mid ")], 1000, header="Posts: "
+    )
+
+    assert result.text == "Posts: high mid low "
+    assert result.items_included == 3
+    assert result.items_total == 3
+    assert result.tokens == count_tokens("Posts: ") + sum(
+        count_tokens(text) for text in ("high ", "mid ", "low ")
+    )
+
+
+def test_pack_items_cuts_the_item_that_overflows_and_skips_the_rest():
+    first, second, third = words(100, "alpha"), words(100, "beta"), words(100, "gamma")
+    budget = count_tokens(first) + 60
+
+    result = pack_items([(3, first), (2, second), (1, third)], budget)
+
+    assert result.tokens <= budget
+    assert result.items_included == 2
+    assert result.text.startswith(first)
+    assert result.text.endswith(TRUNCATION_MARKER)
+    assert "gamma" not in result.text
+
+
+def test_pack_items_caps_each_item():
+    result = pack_items([(1, words(100)), (0, words(100))], 1000, max_item_tokens=30)
+
+    assert result.items_included == 2
+    assert result.tokens <= 60
+    assert result.text.count(TRUNCATION_MARKER) == 2
@@ -0,0 +1,99 @@
+"""
+Tests for the usage ledger and the token budget governor.
+"""
+
+from clients.usage_ledger import BudgetGovernor, UsageLedger, UsageRecord
+
+
+def record(tickers=("AMD",), prompt=600, completion=400, served_from="api"):
+    return UsageRecord(
+        call_type="summary_news",
+        model="gpt-4o",
+        tickers=tuple(tickers),
+        source="news",
+        served_from=served_from,
+        prompt_tokens=prompt,
+        cached_tokens=0,
+        completion_tokens=completion,
+        latency_seconds=0.5,
+        cost_usd=0.01,
+    )
+
+
+def test_multi_ticker_usage_is_split_between_tickers():
+    ledger = UsageLedger()
+    ledger.add(record(("AMD", "NVDA")))
+    ledger.add(record(("AMD",)))
+
+    assert ledger.tokens_used(["AMD"]) == (2000, 1500.0)
+    assert ledger.tokens_used(["NVDA"]) == (2000, 500.0)
+    assert ledger.by_ticker()["NVDA"]["prompt_tokens"] == 300
+    assert ledger.totals()["calls"] == 2
+
+
+def test_cache_hits_are_counted_without_tokens():
+    ledger = UsageLedger()
+    ledger.add(record(prompt=0, completion=0, served_from="cache"))
+
+    totals = ledger.totals()
+    assert (totals["calls"], totals["cache_hits"], totals["prompt_tokens"]) == (0, 1, 0)
+
+
+def test_reservations_count_as_used_until_released():
+    ledger = UsageLedger()
+    ledger.reserve(("AMD", "NVDA"), 1000)
+
+    assert ledger.tokens_used(["AMD"]) == (1000, 500.0)
+
+    ledger.release(("AMD", "NVDA"), 1000)
+    assert ledger.tokens_used(["AMD"]) == (0, 0.0)
+
+
+def test_start_run_forgets_usage_and_reservations():
+    ledger = UsageLedger()
+    ledger.add(record())
+    ledger.reserve(("AMD",), 500)
+
+    ledger.start_run()
+
+    assert ledger.tokens_used(["AMD"]) == (0, 0.0)
+    assert ledger.records == []
+
+
+def test_governor_downgrades_then_stops_at_the_run_budget():
+    ledger = UsageLedger()
+    governor = BudgetGovernor(ledger, run_token_budget=1000, downgrade_ratio=0.8)
+
+    assert governor.check(("AMD",)) == "allow"
+    ledger.add(record(prompt=500, completion=300))
+    assert governor.check(("AMD",)) == "downgrade"
+    ledger.add(record(prompt=100, completion=100))
+    assert governor.check(("AMD",)) == "stop"
+    assert governor.get_metrics()["downgraded"] == 1
+    assert governor.get_metrics()["stopped"] == 1
+
+
+def test_governor_applies_the_ticker_budget_per_ticker():
+    ledger = UsageLedger()
+    governor = BudgetGovernor(ledger, ticker_token_budget=1000)
+    ledger.add(record(("AMD",)))
+
+    assert governor.check(("AMD",)) == "stop"
+    assert governor.check(("NVDA",)) == "allow"
+
+
+def test_governor_reserves_allowed_calls_so_concurrent_ones_cannot_overrun():
+    ledger = UsageLedger()
+    governor = BudgetGovernor(ledger, run_token_budget=1000, downgrade_ratio=1.0)
+
+    assert governor.check(("AMD",), reserve_tokens=600) == "allow"
+    assert governor.check(("NVDA",), reserve_tokens=600) == "allow"
+    # The two reservations already exceed the budget
+    assert governor.check(("INTC",), reserve_tokens=600) == "stop"
+    assert ledger.tokens_used() == (1200, 0.0)
+
+    # Refused calls reserve nothing; finished ones release what they reserved
+    ledger.release(("AMD",), 600)
+    ledger.release(("NVDA",), 600)
+    assert ledger.tokens_used() == (0, 0.0)
+    assert governor.check(("INTC",), reserve_tokens=600) == "allow"
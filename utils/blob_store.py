@@ -0,0 +1,278 @@
+"""
+Content-addressed blob store for article bodies.
+
+This module keeps article content in an append-only file in the agent's cache
+directory, addressed by the SHA-256 digest of the content and read back through
+a memory map. Articles hold only the digest and load their content on access,
+so a body shared by several tickers (or fetched again in a later run) is stored
+once, and the run's resident memory doesn't grow with the text it collects.
+
+The file is a sequence of entries, each a fixed header followed by its data:
+
+    magic (4 bytes) | kind (1) | stamp (uint32) | digest (32) | length (uint32)
+
+Data entries carry the UTF-8 content; touch entries have no data and only mark
+an existing blob as used again, so unused blobs can be dropped by compaction:
+
+    python -m utils.blob_store [--max-age-days N]
+
+Compaction rewrites the file, so it must not run while the agent is running.
+The store is safe to use from several threads, but only one process at a time
+may append to it.
+"""
+
+import argparse
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.shared_instance import SharedInstanceMixin
+from utils.state_store import CACHE_DIR
+
+logger = logging.getLogger("news_agent")
+
+# Keep article content in the blob store (false: hold it in memory)
+ARTICLE_BLOB_STORE_ENABLED = (
+    os.environ.get("ARTICLE_BLOB_STORE_ENABLED", "true").lower() == "true"
+)
+
+# Content shorter than this many characters is held in memory
+ARTICLE_BLOB_MIN_CHARS = int(os.environ.get("ARTICLE_BLOB_MIN_CHARS", "256"))
+
+# Blobs not used for this many days are dropped by compaction
+ARTICLE_BLOB_MAX_AGE_DAYS = float(os.environ.get("ARTICLE_BLOB_MAX_AGE_DAYS", "14"))
+
+# A blob reused after this many seconds is marked as used again
+TOUCH_INTERVAL_SECONDS = 12 * 3600
+
+HEADER = struct.Struct("<4sBI32sI")
+MAGIC = b"NAB1"
+KIND_DATA = 0
+KIND_TOUCH = 1
+
+
+class BlobStore(SharedInstanceMixin):
+    """Append-only, memory-mapped store of UTF-8 blobs addressed by SHA-256."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the blob store.
+
+        The file is opened and indexed on first access.
+
+        Args:
+            path: Path of the blob file (defaults to article_blobs.bin in CACHE_DIR)
+        """
+        self.path = path or os.path.join(CACHE_DIR, "article_blobs.bin")
+        self._lock = threading.Lock()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._size = 0
+        # digest -> (data offset, length, last used epoch seconds)
+        self._index: Dict[bytes, Tuple[int, int, int]] = {}
+        self.metrics = {"puts": 0, "deduplicated": 0, "bytes_written": 0, "reads": 0}
+
+    def _open(self) -> None:
+        """Open the blob file and index its entries, if not done yet."""
+        if self._file is not None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "a+b")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._remap()
+        self._index, valid_size = self._scan()
+        if valid_size < self._size:
+            # A run interrupted mid-write leaves a partial entry at the end
+            logger.warning(
+                f"Truncating {self._size - valid_size} bytes of partial entries "
+                f"from blob store {self.path}"
+            )
+            self._file.truncate(valid_size)
+            self._size = valid_size
+            self._remap()
+
+    def _remap(self) -> None:
+        """Map the whole file, as far as it has been written."""
+        # Readers holding the previous map keep it alive until they're done
+        self._map = (
+            mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+            if self._size
+            else None
+        )
+
+    def _scan(self) -> Tuple[Dict[bytes, Tuple[int, int, int]], int]:
+        """Index the entries of the mapped file.
+
+        Returns:
+            Index of the blobs and the size of the file's valid entries
+        """
+        index: Dict[bytes, Tuple[int, int, int]] = {}
+        offset = 0
+        while offset + HEADER.size <= self._size:
+            magic, kind, stamp, digest, length = HEADER.unpack_from(self._map, offset)
+            data_offset = offset + HEADER.size
+            if magic != MAGIC or data_offset + length > self._size:
+                break
+            if kind == KIND_DATA:
+                index[digest] = (data_offset, length, stamp)
+            elif digest in index:
+                data, size, last_used = index[digest]
+                index[digest] = (data, size, max(last_used, stamp))
+            offset = data_offset + length
+        return index, offset
+
+    def _append(self, kind: int, digest: bytes, data: bytes = b"") -> int:
+        """Append an entry to the file.
+
+        Returns:
+            Offset of the entry's data
+        """
+        self._file.write(HEADER.pack(MAGIC, kind, int(time.time()), digest, len(data)))
+        self._file.write(data)
+        self._file.flush()
+        data_offset = self._size + HEADER.size
+        self._size = data_offset + len(data)
+        return data_offset
+
+    def put(self, content: str) -> bytes:
+        """Store content, unless a blob with the same content exists.
+
+        Args:
+            content: Text to store
+
+        Returns:
+            Digest addressing the content
+        """
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).digest()
+        with self._lock:
+            self._open()
+            self.metrics["puts"] += 1
+            entry = self._index.get(digest)
+            now = int(time.time())
+            if entry is not None:
+                self.metrics["deduplicated"] += 1
+                data_offset, length, last_used = entry
+                if now - last_used >= TOUCH_INTERVAL_SECONDS:
+                    self._append(KIND_TOUCH, digest)
+                    self._index[digest] = (data_offset, length, now)
+                return digest
+            data_offset = self._append(KIND_DATA, digest, data)
+            self._index[digest] = (data_offset, len(data), now)
+            self.metrics["bytes_written"] += HEADER.size + len(data)
+        return digest
+
+    def get(self, digest: bytes) -> str:
+        """Load content by digest.
+
+        Args:
+            digest: Digest returned by put()
+
+        Returns:
+            The stored text
+
+        Raises:
+            KeyError: If no blob has the digest
+        """
+        with self._lock:
+            self._open()
+            entry = self._index.get(digest)
+            if entry is None:
+                raise KeyError(f"No blob with digest {digest.hex()}")
+            data_offset, length, _ = entry
+            if self._map is None or data_offset + length > len(self._map):
+                self._remap()
+            blob_map = self._map
+            self.metrics["reads"] += 1
+        return blob_map[data_offset : data_offset + length].decode("utf-8")
+
+    def __contains__(self, digest: bytes) -> bool:
+        with self._lock:
+            self._open()
+            return digest in self._index
+
+    def compact(self, max_age_days: float = ARTICLE_BLOB_MAX_AGE_DAYS) -> Dict[str, Any]:
+        """Rewrite the file without touch entries and blobs unused for too long.
+
+        Args:
+            max_age_days: Blobs not used for this many days are dropped
+
+        Returns:
+            Dictionary of blob counts and file sizes before and after
+        """
+        with self._lock:
+            self._open()
+            before = {"blobs": len(self._index), "bytes": self._size}
+            # Blobs put since the file was mapped are not covered by the map yet
+            self._remap()
+            cutoff = time.time() - max_age_days * 86400
+            live = sorted(
+                (
+                    (data_offset, digest, length, last_used)
+                    for digest, (data_offset, length, last_used) in self._index.items()
+                    if last_used >= cutoff
+                ),
+            )
+
+            temp_path = f"{self.path}.compact"
+            with open(temp_path, "wb") as f:
+                for data_offset, digest, length, last_used in live:
+                    f.write(HEADER.pack(MAGIC, KIND_DATA, last_used, digest, length))
+                    f.write(self._map[data_offset : data_offset + length])
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._file.close()
+            self._file = None
+            self._map = None
+            os.replace(temp_path, self.path)
+            self._open()
+            after = {"blobs": len(self._index), "bytes": self._size}
+        logger.info(f"Compacted blob store {self.path}: {before} -> {after}")
+        return {"before": before, "after": after}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get the store's size and its put, deduplication and read counters.
+
+        Returns:
+            Dictionary of store metrics
+        """
+        with self._lock:
+            self._open()
+            return {"blobs": len(self._index), "bytes": self._size, **self.metrics}
+
+    def close(self) -> None:
+        """Close the blob file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+            self._map = None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Compact the article blob store from the command line."""
+    parser = argparse.ArgumentParser(description="Compact the article blob store")
+    parser.add_argument("--path", help="Blob file (defaults to the agent's cache)")
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=ARTICLE_BLOB_MAX_AGE_DAYS,
+        help="Drop blobs not used for this many days",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    result = BlobStore(args.path).compact(args.max_age_days)
+    print(
+        f"Blobs: {result['before']['blobs']} -> {result['after']['blobs']}, "
+        f"bytes: {result['before']['bytes']} -> {result['after']['bytes']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Local extractive summarization.
+
+This module builds key-point summaries without any network access by scoring
+sentences of the source text (BM25 relevance to the stock and price-move
+vocabulary, plus position), removing redundant sentences, and returning the
+top few as numbered points. It runs in milliseconds and is used when the LLM
+is unavailable, disabled or too slow.
+"""
+
+import re
+from typing import List, Optional, Set
+
+from utils.relevance import BM25Ranker, build_query, tokenize
+
+# Prompt scaffolding lines that are not part of the source text
+SCAFFOLD_PATTERN = re.compile(
+    r"^(?:ARTICLE|HEADLINE|CONTENT|POST|Top comments)\s*:\s*"
+    r"|^-{3,}$"
+    r"|^Reddit discussions from .*:$"
+    r"|^Recent headlines and news:$"
+    r"|^(?:Seeking Alpha|Google News|Reddit r/\S+|Shared Event) Summary(?: \(.*\))?:$",
+    re.IGNORECASE,
+)
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'$])")
+LIST_MARKER_PATTERN = re.compile(r"^(?:[-*\u2022]|\d+[.)])\s+")
+
+# Sentences shorter or longer than this (in words) are not used as key points
+MIN_SENTENCE_WORDS = 5
+MAX_SENTENCE_WORDS = 60
+
+# Sentences sharing more than this fraction of their words count as redundant
+MAX_OVERLAP = 0.5
+
+
+def split_sentences(content: str) -> List[str]:
+    """Split prompt content into candidate sentences, dropping scaffolding.
+
+    Args:
+        content: Packed prompt content or free text
+
+    Returns:
+        List of sentences, in document order
+    """
+    sentences = []
+    for line in content.splitlines():
+        line = LIST_MARKER_PATTERN.sub("", SCAFFOLD_PATTERN.sub("", line.strip()))
+        if not line:
+            continue
+        for sentence in SENTENCE_PATTERN.split(line):
+            sentence = sentence.strip()
+            word_count = len(sentence.split())
+            if MIN_SENTENCE_WORDS <= word_count <= MAX_SENTENCE_WORDS:
+                sentences.append(sentence)
+    return sentences
+
+
+def _overlap(first: Set[str], second: Set[str]) -> float:
+    """Fraction of the smaller word set shared with the other one."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / min(len(first), len(second))
+
+
+class ExtractiveSummarizer:
+    """Picks the most relevant, non-redundant sentences as key points."""
+
+    def __init__(self, max_points: int = 3):
+        """Initialize the summarizer.
+
+        Args:
+            max_points: Number of key points returned
+        """
+        self.max_points = max_points
+
+    def key_points(
+        self,
+        content: str,
+        ticker: str,
+        company_name: Optional[str] = None,
+    ) -> List[str]:
+        """Select the key sentences of a text.
+
+        Args:
+            content: Text to summarize
+            ticker: Stock ticker symbol
+            company_name: Company name (optional)
+
+        Returns:
+            Up to max_points sentences, most important first
+        """
+        sentences = split_sentences(content)
+        if not sentences:
+            return []
+
+        relevance = BM25Ranker(sentences).score(build_query(ticker, company_name))
+        # Earlier sentences (newer or higher-priority items) break ties
+        scored = sorted(
+            (
+                (score + 0.1 * (1.0 - index / len(sentences)), sentence)
+                for index, (score, sentence) in enumerate(zip(relevance, sentences))
+            ),
+            reverse=True,
+        )
+
+        selected: List[str] = []
+        selected_words: List[Set[str]] = []
+        for _, sentence in scored:
+            words = set(tokenize(sentence))
+            if any(_overlap(words, other) > MAX_OVERLAP for other in selected_words):
+                continue
+            selected.append(sentence)
+            selected_words.append(words)
+            if len(selected) == self.max_points:
+                break
+        return selected
+
+    def summarize(
+        self,
+        content: str,
+        ticker: str,
+        company_name: Optional[str] = None,
+    ) -> str:
+        """Summarize a text as numbered key points.
+
+        Args:
+            content: Text to summarize
+            ticker: Stock ticker symbol
+            company_name: Company name (optional)
+
+        Returns:
+            Numbered key points, or a notice if nothing usable was found
+        """
+        points = self.key_points(content, ticker, company_name)
+        if not points:
+            return "No key points found."
+        return "\n".join(f"{index}. {point}" for index, point in enumerate(points, 1))
@@ -0,0 +1,214 @@
+"""
+Ticker mention extraction utilities.
+
+This module provides a mention extractor that is compiled once per run from the
+watchlist universe (tickers and company names) and finds every ticker mention in
+a piece of text in a single linear scan.
+"""
+
+import re
+from typing import Dict, Iterable, NamedTuple, Optional
+
+# Corporate suffixes stripped from company names so that "Apple Inc." also
+# matches plain "Apple" in free text
+COMPANY_SUFFIXES = {
+    "inc",
+    "inc.",
+    "incorporated",
+    "corp",
+    "corp.",
+    "corporation",
+    "co",
+    "co.",
+    "company",
+    "ltd",
+    "ltd.",
+    "limited",
+    "plc",
+    "holdings",
+    "group",
+    "sa",
+    "s.a.",
+    "nv",
+    "n.v.",
+    "ag",
+    "se",
+    "class",
+    "a",
+    "b",
+    "c",
+    "adr",
+}
+
+# Company names shorter than this are too ambiguous to match in free text
+MIN_COMPANY_NAME_LENGTH = 3
+
+
+class Mention(NamedTuple):
+    """Mention statistics for a single ticker within a text."""
+
+    count: int
+    first_position: int
+
+
+def normalize_company_name(name: Optional[str]) -> Optional[str]:
+    """Strip punctuation and corporate suffixes from a company name.
+
+    Args:
+        name: Company name as reported by the broker (e.g. "Tesla, Inc.")
+
+    Returns:
+        Normalized name (e.g. "Tesla"), or None if nothing usable remains
+    """
+    if not name:
+        return None
+
+    words = name.replace(",", " ").split()
+    while words and words[-1].lower() in COMPANY_SUFFIXES:
+        words.pop()
+
+    normalized = " ".join(words).strip(" .")
+    if len(normalized) < MIN_COMPANY_NAME_LENGTH:
+        return None
+    return normalized
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Build a prefix-factored regex alternation for a set of words.
+
+    Args:
+        words: Lowercase words to match
+
+    Returns:
+        Regex source matching exactly the given words
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = []
+        optional = False
+        for char in sorted(node):
+            if char == "":
+                optional = True
+                continue
+            branches.append(re.escape(char) + build(node[char]))
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        pattern = "(?:" + "|".join(branches) + ")"
+        # Greedy optional suffix so the longest alternative wins ("GOOGL" over "GOOG")
+        return pattern + "?" if optional else pattern
+
+    return build(trie)
+
+
+class MentionExtractor:
+    """Compiled multi-ticker mention extractor.
+
+    Tickers are matched case-sensitively (so "ON" does not match "on") unless they
+    are written as a cashtag ("$on"), and always on word boundaries (so "GS" does
+    not match "things"). Company names are matched case-insensitively.
+    """
+
+    def __init__(self, universe: Dict[str, Optional[str]]):
+        """Compile the extractor for a ticker universe.
+
+        Args:
+            universe: Dictionary mapping ticker symbols to company names (or None)
+        """
+        self.universe = {
+            ticker.upper(): name for ticker, name in universe.items() if ticker
+        }
+        self.tickers = set(self.universe)
+        self._name_to_ticker: Dict[str, str] = {}
+
+        for ticker, name in self.universe.items():
+            for alias in {name, normalize_company_name(name)}:
+                # Keep the first ticker claiming an alias to stay deterministic
+                if alias and alias.lower() not in self._name_to_ticker:
+                    self._name_to_ticker[alias.lower()] = ticker
+
+        self._pattern = self._compile()
+
+    def _compile(self) -> Optional["re.Pattern"]:
+        """Build a single trie-shaped regex covering every ticker and name.
+
+        Returns:
+            Compiled pattern, or None if the universe is empty
+        """
+        words = {ticker.lower() for ticker in self.tickers}
+        words.update(self._name_to_ticker)
+        if not words:
+            return None
+
+        # Anchoring on a word start and factoring common prefixes keeps the scan
+        # linear: the engine only tries one trie branch per word in the text
+        return re.compile(
+            rf"(?<![\w$])\$?(?:{_trie_regex(words)})(?!\w)", re.IGNORECASE
+        )
+
+    def _resolve(self, token: str) -> Optional[str]:
+        """Map a matched token back to its ticker.
+
+        Args:
+            token: Matched text
+
+        Returns:
+            Ticker symbol, or None if the token is unknown
+        """
+        # Cashtags match in any case, bare tickers only in upper case
+        if token.startswith("$"):
+            symbol = token[1:].upper()
+            if symbol in self.tickers:
+                return symbol
+            token = token[1:]
+        elif token in self.tickers:
+            return token
+        return self._name_to_ticker.get(token.lower())
+
+    def extract(self, text: Optional[str]) -> Dict[str, Mention]:
+        """Count ticker mentions in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dictionary mapping tickers to their mention count and first position
+        """
+        mentions: Dict[str, Mention] = {}
+        if not text or self._pattern is None:
+            return mentions
+
+        for match in self._pattern.finditer(text):
+            ticker = self._resolve(match.group())
+            if ticker is None:
+                continue
+            previous = mentions.get(ticker)
+            if previous is None:
+                mentions[ticker] = Mention(1, match.start())
+            else:
+                mentions[ticker] = Mention(previous.count + 1, previous.first_position)
+
+        return mentions
+
+    @classmethod
+    def from_tickers(
+        cls, tickers: Iterable[str], names: Optional[Dict[str, str]] = None
+    ) -> "MentionExtractor":
+        """Build an extractor from a list of tickers and optional company names.
+
+        Args:
+            tickers: Ticker symbols to include
+            names: Optional dictionary mapping tickers to company names
+
+        Returns:
+            Compiled MentionExtractor
+        """
+        names = names or {}
+        return cls({ticker: names.get(ticker) for ticker in tickers})
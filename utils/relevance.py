@@ -0,0 +1,178 @@
+"""
+Local relevance ranking of articles.
+
+This module scores short documents (headlines, posts, article bodies) against a
+query with Okapi BM25, in pure Python and without any network access. Queries
+are built from the ticker, the company name and vocabulary typical of news that
+moves a stock price.
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from models.news_models import ArticleRecord
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['.][a-z0-9]+)*")
+
+# Priority bonus for articles whose title mentions the ticker
+TITLE_MENTION_BONUS = 1.0
+
+# Weight of the (max-normalized) BM25 relevance score in an article's priority
+RELEVANCE_WEIGHT = float(os.environ.get("SUMMARY_RELEVANCE_WEIGHT", "1.5"))
+
+# Vocabulary that tends to appear in news explaining a price move
+MOVE_TERMS = """
+earnings revenue guidance outlook forecast eps beat miss misses beats upgrade
+downgrade upgraded downgraded target rating analyst analysts surge surges soar
+soars jump jumps rally rallies plunge plunges slump tumble tumbles drop drops
+falls fell rises rose gain gains sell selloff shares stock quarter quarterly
+results acquisition merger deal lawsuit sec fda approval recall layoffs buyback
+dividend offering tariff tariffs demand sales margin margins profit loss ceo
+contract partnership launch investigation
+""".split()
+
+# Words dropped from company names when they're used as query terms
+COMPANY_STOPWORDS = set(
+    """
+    adr ag and class co com company corp corporation group holding holdings inc
+    limited ltd nv of plc sa se the
+    """.split()
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens
+    """
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def build_query(ticker: str, company_name: Optional[str] = None) -> List[str]:
+    """Build the query terms used to rank a stock's articles.
+
+    The ticker and company name are repeated so they outweigh any single
+    move-related term.
+
+    Args:
+        ticker: Stock ticker symbol
+        company_name: Company name (optional)
+
+    Returns:
+        List of query terms (repeats act as weights)
+    """
+    subject = [ticker.lower()]
+    subject += [
+        token for token in tokenize(company_name) if token not in COMPANY_STOPWORDS
+    ]
+    return subject * 3 + MOVE_TERMS
+
+
+class BM25Ranker:
+    """Okapi BM25 scorer over a small in-memory corpus."""
+
+    def __init__(self, documents: Iterable[str], k1: float = 1.5, b: float = 0.75):
+        """Index the documents.
+
+        Args:
+            documents: Document texts
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.term_counts = [Counter(tokenize(document)) for document in documents]
+        self.lengths = [sum(counts.values()) for counts in self.term_counts]
+        self.average_length = (
+            sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+        )
+        document_frequency: Counter = Counter()
+        for counts in self.term_counts:
+            document_frequency.update(counts.keys())
+        total = len(self.term_counts)
+        self.idf = {
+            term: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def score(self, query_terms: Iterable[str]) -> List[float]:
+        """Score every indexed document against a query.
+
+        Args:
+            query_terms: Query terms (repeats act as weights)
+
+        Returns:
+            BM25 score of each document, in index order
+        """
+        weights = Counter(query_terms)
+        scores = []
+        for counts, length in zip(self.term_counts, self.lengths):
+            norm = self.k1 * (
+                1 - self.b + self.b * length / (self.average_length or 1.0)
+            )
+            score = 0.0
+            for term, weight in weights.items():
+                frequency = counts.get(term)
+                if frequency:
+                    score += (
+                        weight
+                        * self.idf[term]
+                        * frequency
+                        * (self.k1 + 1)
+                        / (frequency + norm)
+                    )
+            scores.append(score)
+        return scores
+
+
+def rank_articles(
+    articles: Sequence[ArticleRecord],
+    ticker: str,
+    company_name: Optional[str] = None,
+) -> List[Tuple[float, ArticleRecord]]:
+    """Rank articles by how worth summarizing they are.
+
+    An article's priority combines its recency (rank by publication date scaled
+    to [0, 1], newest first), a bonus for mentioning the ticker in the title,
+    and its BM25 relevance to the ticker, company name and price-move vocabulary
+    (titles count twice). Articles with no relevance at all are dropped as long
+    as any article has some.
+
+    Args:
+        articles: Articles to rank
+        ticker: Stock ticker symbol
+        company_name: Company name (optional)
+
+    Returns:
+        List of (priority, article) tuples, highest priority first
+    """
+    ticker_pattern = re.compile(rf"(?<![\w$])\$?{re.escape(ticker)}(?!\w)")
+    ranked = sorted(articles, key=lambda x: x.published_ts or 0, reverse=True)
+    ranker = BM25Ranker(
+        f"{article.title} {article.title} {article.content or ''}"
+        for article in ranked
+    )
+    relevance = ranker.score(build_query(ticker, company_name))
+    top_relevance = max(relevance, default=0.0)
+
+    scored = []
+    for rank, article in enumerate(ranked):
+        if relevance[rank] == 0.0 and top_relevance > 0.0:
+            continue
+        priority = 1.0 - rank / len(ranked)
+        if ticker_pattern.search(article.title):
+            priority += TITLE_MENTION_BONUS
+        if top_relevance > 0.0:
+            priority += RELEVANCE_WEIGHT * relevance[rank] / top_relevance
+        scored.append((priority, article))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return scored
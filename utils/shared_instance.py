@@ -0,0 +1,40 @@
+"""
+Process-wide shared instance utilities.
+
+This module provides a mixin that gives a class a lazily constructed, thread-safe
+shared instance, so every part of the pipeline reuses one client per backend.
+"""
+
+import threading
+from typing import Dict, Type, TypeVar
+
+T = TypeVar("T", bound="SharedInstanceMixin")
+
+_instances: Dict[type, object] = {}
+_lock = threading.Lock()
+
+
+class SharedInstanceMixin:
+    """Mixin providing a lazily constructed shared instance per class."""
+
+    @classmethod
+    def shared(cls: Type[T]) -> T:
+        """Get the process-wide shared instance, constructing it on first use.
+
+        Returns:
+            Shared instance of the class, built with default arguments
+        """
+        instance = _instances.get(cls)
+        if instance is None:
+            with _lock:
+                instance = _instances.get(cls)
+                if instance is None:
+                    instance = cls()
+                    _instances[cls] = instance
+        return instance
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop the shared instance so the next call to shared() rebuilds it."""
+        with _lock:
+            _instances.pop(cls, None)
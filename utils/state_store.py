@@ -0,0 +1,102 @@
+"""
+Persistent JSON state store.
+
+This module provides a small thread-safe key/value store persisted as a JSON file
+in the agent's cache directory, used to carry state (high-water marks, caches,
+statistics) from one run to the next.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("news_agent")
+
+# Directory holding persistent state between runs
+CACHE_DIR = os.environ.get("NEWS_AGENT_CACHE_DIR", ".cache")
+
+
+class JsonStateStore:
+    """Thread-safe key/value store persisted to a JSON file."""
+
+    def __init__(self, name: str, cache_dir: Optional[str] = None):
+        """Initialize the state store.
+
+        The file is only read on first access.
+
+        Args:
+            name: File name of the store inside the cache directory
+            cache_dir: Directory holding the store (defaults to CACHE_DIR)
+        """
+        self.path = os.path.join(cache_dir or CACHE_DIR, name)
+        self._data: Optional[Dict[str, Any]] = None
+        self._lock = threading.RLock()
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the store from disk if it hasn't been loaded yet.
+
+        Returns:
+            The store's data
+        """
+        if self._data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except FileNotFoundError:
+                self._data = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read state store {self.path}: {str(e)}")
+                self._data = {}
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value from the store.
+
+        Args:
+            key: Key to look up
+            default: Value returned if the key is missing
+
+        Returns:
+            Stored value, or default
+        """
+        with self._lock:
+            return self._load().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Set a value in the store (call save() to persist it).
+
+        Args:
+            key: Key to set
+            value: JSON-serializable value
+        """
+        with self._lock:
+            self._load()[key] = value
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the store (call save() to persist it).
+
+        Args:
+            key: Key to remove
+        """
+        with self._lock:
+            self._load().pop(key, None)
+
+    def keys(self):
+        """Return a snapshot of the store's keys."""
+        with self._lock:
+            return list(self._load().keys())
+
+    def save(self) -> None:
+        """Atomically write the store to disk."""
+        with self._lock:
+            data = self._load()
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Could not write state store {self.path}: {str(e)}")
@@ -0,0 +1,179 @@
+"""
+Token-budget-aware prompt packing utilities.
+
+This module counts tokens (with tiktoken when installed, otherwise with a close
+approximation), strips boilerplate and URLs from scraped text, and packs
+prioritized items into a prompt up to a token budget.
+"""
+
+import logging
+import re
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger("news_agent")
+
+# Marker appended to items cut to fit the budget
+TRUNCATION_MARKER = "... [truncated]"
+
+# Items that can't fit at least this many tokens are skipped rather than cut
+MIN_PARTIAL_ITEM_TOKENS = 40
+
+URL_PATTERN = re.compile(r"https?://\S+|www\.\S+")
+HTML_TAG_PATTERN = re.compile(r"<[^<]+?>")
+WHITESPACE_PATTERN = re.compile(r"[ \t\r\f\v]+")
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+# Rough BPE approximation: words, numbers and punctuation runs
+APPROX_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+BOILERPLATE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"\[(?:removed|deleted)\]",
+        r"view full coverage on google news",
+        r"click here[^.\n]*",
+        r"read more[^.\n]*",
+        r"subscribe (?:now|today|to)[^.\n]*",
+        r"sign up for[^.\n]*newsletter[^.\n]*",
+        r"&nbsp;|&amp;|&#\d+;",
+        r"\*\*?edit\*?\*?:?",
+    ]
+]
+
+_encoding = None
+_encoding_loaded = False
+
+
+class PackResult(NamedTuple):
+    """Result of packing items into a token budget."""
+
+    text: str
+    tokens: int
+    items_included: int
+    items_total: int
+
+
+def _get_encoding():
+    """Load the tiktoken encoding once, if tiktoken is installed."""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            logger.info("tiktoken not available, using approximate token counts")
+            _encoding = None
+    return _encoding
+
+
+def count_tokens(text: Optional[str]) -> int:
+    """Count the tokens of a text.
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Token count (exact with tiktoken, approximate otherwise)
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # Long words split into several BPE tokens; ~4 characters per token
+    return sum(
+        max(1, len(match) // 4) if match[0].isalnum() else 1
+        for match in APPROX_TOKEN_PATTERN.findall(text)
+    )
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut a text down to a token budget, marking it as truncated.
+
+    Args:
+        text: Text to cut
+        max_tokens: Maximum tokens of the result, including the marker
+
+    Returns:
+        The text itself if it fits, otherwise a truncated prefix with a marker
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+    budget = max(0, max_tokens - count_tokens(TRUNCATION_MARKER))
+    encoding = _get_encoding()
+    if encoding is not None:
+        prefix = encoding.decode(encoding.encode(text)[:budget])
+    else:
+        # Binary search on characters for the approximate counter
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if count_tokens(text[:middle]) <= budget:
+                low = middle
+            else:
+                high = middle - 1
+        prefix = text[:low]
+    return prefix.rstrip() + TRUNCATION_MARKER
+
+
+def clean_text(text: Optional[str]) -> str:
+    """Strip URLs, HTML tags, boilerplate phrases and redundant whitespace.
+
+    Args:
+        text: Scraped text
+
+    Returns:
+        Cleaned text
+    """
+    if not text:
+        return ""
+    text = HTML_TAG_PATTERN.sub("", text)
+    text = URL_PATTERN.sub("", text)
+    for pattern in BOILERPLATE_PATTERNS:
+        text = pattern.sub("", text)
+    text = WHITESPACE_PATTERN.sub(" ", text)
+    text = BLANK_LINES_PATTERN.sub("\n\n", text)
+    return "\n".join(line.strip() for line in text.split("\n")).strip()
+
+
+def pack_items(
+    items: Sequence[Tuple[float, str]],
+    budget_tokens: int,
+    header: str = "",
+    max_item_tokens: Optional[int] = None,
+) -> PackResult:
+    """Pack prioritized items into a prompt up to a token budget.
+
+    Items are taken in descending priority. Each item is first capped at
+    max_item_tokens; an item that doesn't fit in the remaining budget is cut to
+    fit if enough room is left, otherwise skipped.
+
+    Args:
+        items: Sequence of (priority, rendered item text) tuples
+        budget_tokens: Token budget for the whole packed text, header included
+        header: Text placed before the items
+        max_item_tokens: Optional per-item token cap
+
+    Returns:
+        PackResult with the packed text and the tokens used
+    """
+    parts: List[str] = [header] if header else []
+    used = count_tokens(header)
+    included = 0
+
+    for _, text in sorted(items, key=lambda item: item[0], reverse=True):
+        if max_item_tokens is not None:
+            text = truncate_to_tokens(text, max_item_tokens)
+        remaining = budget_tokens - used
+        if remaining < MIN_PARTIAL_ITEM_TOKENS:
+            break
+        tokens = count_tokens(text)
+        if tokens > remaining:
+            text = truncate_to_tokens(text, remaining)
+            tokens = count_tokens(text)
+        parts.append(text)
+        used += tokens
+        included += 1
+
+    return PackResult("".join(parts), used, included, len(items))